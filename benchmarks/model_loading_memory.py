@@ -0,0 +1,145 @@
+"""Model Loading Memory Benchmark.
+
+Starts N worker processes that load the same model artifact, either into private memory or memory-mapped, and reports
+the RSS, PSS and private memory of every worker while all of them hold the model. PSS divides shared pages between the
+processes mapping them, so the memory-mapped workers show a PSS close to their private memory while their RSS still
+counts the shared pages in full.
+
+Linux only, memory figures are read from /proc/self/smaps_rollup.
+
+Example usage:
+python -m benchmarks.model_loading_memory --workers 4
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+from multiprocessing.synchronize import Barrier
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from src.ml_pipeline_handler.io.artifact import ModelArtifact, write_artifact
+from src.ml_pipeline_handler.io.loader import load_model
+
+
+def memory_usage_mb() -> dict[str, float]:
+    """Read the RSS, PSS and private memory of the current process.
+
+    Returns:
+        Mapping of 'rss', 'pss' and 'private' to megabytes.
+
+    """
+    fields: dict[str, float] = {}
+    with Path("/proc/self/smaps_rollup").open() as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0]) / 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def worker(file_name: str, mmap: bool, barrier: Barrier, results: "multiprocessing.Queue[tuple]") -> None:  # noqa: FBT001
+    """Load the artifact, score one row and report the memory usage once every worker holds the model.
+
+    Args:
+        file_name: The path of the artifact.
+        mmap: Whether to memory-map the artifact.
+        barrier: Barrier shared by the workers, so the memory is measured while all of them are alive.
+        results: Queue receiving the memory usage of the worker before and after loading.
+
+    Returns:
+        None
+
+    """
+    before = memory_usage_mb()
+    artifact = load_model(file_name=file_name, mmap=mmap)
+    artifact.model.predict(X=np.zeros(shape=(1, artifact.model.n_features_in_)))
+    barrier.wait()
+    results.put((before, memory_usage_mb()))
+    barrier.wait()
+
+
+def run(file_name: str, workers: int, mmap: bool) -> list[tuple[dict[str, float], dict[str, float]]]:  # noqa: FBT001
+    """Start the workers and collect their memory usage.
+
+    Args:
+        file_name: The path of the artifact.
+        workers: The number of worker processes.
+        mmap: Whether the workers memory-map the artifact.
+
+    Returns:
+        The memory usage of every worker before and after loading.
+
+    """
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(file_name, mmap, barrier, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    usage = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return usage
+
+
+def build_artifacts(directory: Path) -> dict[str, str]:
+    """Fit a random forest and a wide linear model on synthetic data and write them as artifacts.
+
+    Args:
+        directory: The directory to write the artifacts to.
+
+    Returns:
+        Mapping of model name to artifact path.
+
+    """
+    rng = np.random.default_rng(seed=42)
+    models = {
+        "random_forest": RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1).fit(
+            X=rng.normal(size=(50_000, 20)), y=rng.integers(low=0, high=2, size=50_000)
+        ),
+        "wide_linear": SGDClassifier(max_iter=1, tol=None, random_state=42).fit(
+            X=rng.normal(size=(200, 200_000)), y=np.arange(200) % 20
+        ),
+    }
+
+    paths = {}
+    for name, model in models.items():
+        paths[name] = str(directory / f"{name}.art")
+        with Path(paths[name]).open(mode="wb") as f:
+            write_artifact(artifact=ModelArtifact(algorithm=name, features=[], target_column="", model=model), f=f)
+    return paths
+
+
+def main() -> None:
+    """Run the benchmark and print the average memory usage per worker.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(description="Model loading memory benchmark")
+    parser.add_argument("--workers", type=int, default=4, help="Number of worker processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_artifacts(directory=Path(directory))
+        print(f"{'model':<15}{'mmap':<7}{'size MB':>9}{'RSS MB':>9}{'PSS MB':>9}{'private MB':>12}")  # noqa: T201
+        for name, path in paths.items():
+            size = Path(path).stat().st_size / 1024 / 1024
+            for mmap in (False, True):
+                usage = run(file_name=path, workers=args.workers, mmap=mmap)
+                delta = {key: np.mean([after[key] - before[key] for before, after in usage]) for key in usage[0][0]}
+                print(  # noqa: T201
+                    f"{name:<15}{mmap!s:<7}{size:>9.1f}{delta['rss']:>9.1f}{delta['pss']:>9.1f}{delta['private']:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
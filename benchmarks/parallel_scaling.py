@@ -0,0 +1,265 @@
+"""Parallel Scaling Benchmark.
+
+Measures how the parallel paths of the pipeline scale with the number of cores given to a run (PipelineConfig.n_jobs):
+fit_predict of a pipeline whose estimator supports n_jobs, cross_validate with its folds fitted in the worker pool, and
+the bootstrap confidence intervals of the metrics computed by blocks of replicates. Every path is timed at 1, 2, 4, ...
+cores up to the cores of the machine, and reported as throughput (rows per second), speedup over one core and
+efficiency (speedup per core).
+
+The results are written as JSON with the same metadata as the pipeline benchmark suite.
+
+Example usage:
+python -m benchmarks.parallel_scaling --rows 200000 --out_file scaling.json
+python -m benchmarks.parallel_scaling --rows 200000 --backend threading --blas_threads 1
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import sklearn
+from joblib import cpu_count
+from sklearn.base import is_classifier
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.bootstrap import WEIGHT_BYTES, BootstrapConfig
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.pipeline.base_config import BACKENDS, PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+from benchmarks.pipeline_suite import build_config, generate_data, measure
+
+# The bootstrap replicates are split into this many blocks, so that every core count has blocks to share.
+BOOTSTRAP_BLOCKS = 16
+
+
+@dataclass
+class ScalingResult:
+    """Scaling Result Data Class, the timing of one parallel path at one number of cores."""
+
+    name: str
+    rows: int
+    n_jobs: int
+    seconds: float
+    rows_per_second: float
+    speedup: float
+    efficiency: float
+
+
+def core_counts(max_cores: int) -> list[int]:
+    """List the numbers of cores to time: the powers of two below max_cores, and max_cores.
+
+    Args:
+        max_cores: The largest number of cores.
+
+    Returns:
+        The increasing numbers of cores.
+
+    """
+    counts = [2**power for power in range(max(max_cores, 1).bit_length()) if 2**power < max_cores]
+    return [*counts, max(max_cores, 1)]
+
+
+def benchmark_n_jobs(config: PipelineConfig, n_rows: int, repeats: int, n_boot: int, cv_folds: int) -> dict[str, float]:
+    """Time every parallel path with the n_jobs, backend and blas_threads of a config.
+
+    Args:
+        config: PipelineConfig of the benchmarked pipeline.
+        n_rows: The number of rows of the data set.
+        repeats: The number of timed runs per path, the fastest is reported.
+        n_boot: The number of bootstrap replicates.
+        cv_folds: The number of cross-validation folds.
+
+    Returns:
+        Mapping of the name of every path to its time in seconds.
+
+    """
+    algorithm = AlgorithmType(config.algorithm).value
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    prepared = pipeline.prepare_data(test_size=pipeline.test_size)
+    x_train, x_test, y_train, y_test = prepared.x_train, prepared.x_test, prepared.y_train, prepared.y_test
+
+    fit_predict = measure(
+        name=f"fit_predict[{algorithm},n_jobs={config.n_jobs}]",
+        n_rows=n_rows,
+        run=lambda: pipeline.fit_predict(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test),
+        repeats=repeats,
+        memory=False,
+    )
+    cross_validate = measure(
+        name=f"cross_validate[{algorithm},n_jobs={config.n_jobs}]",
+        n_rows=n_rows,
+        run=lambda: pipeline.cross_validate(n_folds=cv_folds),
+        repeats=repeats,
+        memory=False,
+    )
+
+    prediction, probability = pipeline.fit_predict(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test)
+    bootstrap_config = BootstrapConfig(
+        n_boot=n_boot,
+        block_bytes=WEIGHT_BYTES * len(y_test) * math.ceil(n_boot / BOOTSTRAP_BLOCKS),
+        n_jobs=config.n_jobs,
+        blas_threads=config.blas_threads,
+        random_state=config.random_state,
+    )
+    bootstrap = measure(
+        name=f"bootstrap[{algorithm},n_jobs={config.n_jobs}]",
+        n_rows=len(y_test),
+        run=lambda: pipeline.metric_handler.compute_confidence_intervals(
+            y_true=y_test,
+            y_pred=prediction,
+            y_proba=probability,
+            config=bootstrap_config,
+            classes=getattr(pipeline.model, "classes_", None),
+        ),
+        repeats=repeats,
+        memory=False,
+    )
+    return {
+        "fit_predict": fit_predict.seconds,
+        "cross_validate": cross_validate.seconds,
+        "bootstrap": bootstrap.seconds,
+    }
+
+
+def run_scaling(
+    n_rows: int,
+    algorithm: AlgorithmType,
+    data_dir: Path,
+    *,
+    max_cores: Optional[int] = None,
+    backend: str = "loky",
+    blas_threads: Optional[int] = None,
+    repeats: int = 3,
+    n_boot: int = 1000,
+    cv_folds: int = 4,
+) -> dict[str, Any]:
+    """Time the parallel paths of a pipeline at every number of cores.
+
+    Args:
+        n_rows: The number of rows of the synthetic data set.
+        algorithm: The algorithm of the pipeline.
+        data_dir: The directory of the generated data sets, reused between runs.
+        max_cores: Optional largest number of cores, defaults to the cores of the machine.
+        backend: The joblib backend of the worker pools.
+        blas_threads: Optional BLAS and OpenMP thread limit.
+        repeats: The number of timed runs per path.
+        n_boot: The number of bootstrap replicates.
+        cv_folds: The number of cross-validation folds.
+
+    Returns:
+        Mapping of 'metadata' (versions, platform, date, cores) and 'results' (every ScalingResult as a mapping).
+
+    """
+    probe = PipelineFactory.build_pipeline(config=build_config(data_path=Path(), algorithm=algorithm, out_file=""))
+    model_type = ModelType.CLASSIFICATION if is_classifier(probe.model) else ModelType.REGRESSION
+    data_path = generate_data(directory=data_dir, n_rows=n_rows, model_type=model_type)
+    max_cores = max_cores or cpu_count()
+
+    print(f"{'benchmark':<48}{'rows':>10}{'seconds':>12}{'peak MB':>10}")  # noqa: T201
+    results: list[ScalingResult] = []
+    with tempfile.TemporaryDirectory() as directory:
+        config = build_config(data_path=data_path, algorithm=algorithm, out_file=f"{directory}/model.pkl")
+        timings = {
+            n_jobs: benchmark_n_jobs(
+                config=replace(config, n_jobs=n_jobs, backend=backend, blas_threads=blas_threads),
+                n_rows=n_rows,
+                repeats=repeats,
+                n_boot=n_boot,
+                cv_folds=cv_folds,
+            )
+            for n_jobs in core_counts(max_cores=max_cores)
+        }
+
+    for n_jobs, paths in timings.items():
+        for name, seconds in paths.items():
+            speedup = timings[1][name] / seconds
+            results.append(
+                ScalingResult(
+                    name=name,
+                    rows=n_rows,
+                    n_jobs=n_jobs,
+                    seconds=seconds,
+                    rows_per_second=n_rows / seconds,
+                    speedup=speedup,
+                    efficiency=speedup / n_jobs,
+                )
+            )
+
+    print(f"{'path':<24}{'n_jobs':>8}{'rows/s':>14}{'speedup':>10}{'efficiency':>12}")  # noqa: T201
+    for result in results:
+        print(  # noqa: T201
+            f"{result.name:<24}{result.n_jobs:>8}{result.rows_per_second:>14.0f}{result.speedup:>10.2f}"
+            f"{result.efficiency:>12.2f}"
+        )
+
+    return {
+        "metadata": {
+            "date": datetime.now(tz=UTC).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "scikit-learn": sklearn.__version__,
+            "repeats": repeats,
+            "cpu_count": cpu_count(),
+            "algorithm": algorithm.value,
+            "backend": backend,
+            "blas_threads": blas_threads,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main() -> None:
+    """Run the scaling benchmark and write its results.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(description="Parallel scaling benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="Data set size")
+    parser.add_argument(
+        "--algorithm",
+        choices=[algorithm.value for algorithm in AlgorithmType],
+        default=AlgorithmType.RANDOM_FOREST_REGRESSOR.value,
+        help="Algorithm of the benchmarked pipeline, ideally one whose estimator supports n_jobs",
+    )
+    parser.add_argument("--max_cores", type=int, default=None, help="Largest number of cores, every core by default")
+    parser.add_argument("--backend", choices=BACKENDS, default="loky", help="joblib backend of the worker pools")
+    parser.add_argument("--blas_threads", type=int, default=None, help="Thread limit of the BLAS and OpenMP libraries")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of timed runs per path")
+    parser.add_argument("--n_boot", type=int, default=1000, help="Number of bootstrap replicates")
+    parser.add_argument("--cv_folds", type=int, default=4, help="Number of cross-validation folds")
+    parser.add_argument(
+        "--data_dir", default=".benchmark_data", help="Directory of the generated data sets, reused between runs"
+    )
+    parser.add_argument("--out_file", default="scaling.json", help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    report = run_scaling(
+        n_rows=args.rows,
+        algorithm=AlgorithmType(args.algorithm),
+        data_dir=Path(args.data_dir),
+        max_cores=args.max_cores,
+        backend=args.backend,
+        blas_threads=args.blas_threads,
+        repeats=args.repeats,
+        n_boot=args.n_boot,
+        cv_folds=args.cv_folds,
+    )
+    Path(args.out_file).write_text(json.dumps(report, indent=2))
+    print(f"Results written to {args.out_file}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
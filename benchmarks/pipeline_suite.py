@@ -0,0 +1,477 @@
+"""Pipeline Benchmark Suite.
+
+Times and measures the peak memory of the pipeline hot paths on synthetic data sets of the given sizes: load_data,
+create_training_set and pre_process_data per task, fit and predict of every AlgorithmType, compute_metrics of every
+metric handler, and save_model / pickle load and save_artifact / load_model. Every stage is timed over several repeats
+(the fastest is reported) and run once more under tracemalloc for its peak memory, as tracing slows it down. The
+peak covers the allocations of Python and numpy, not the buffers that compiled estimators allocate themselves.
+
+The results are written as JSON, and two result files can be compared to find regressions between versions.
+
+Example usage:
+python -m benchmarks.pipeline_suite --rows 10000 1000000 --out_file bench.json
+python -m benchmarks.pipeline_suite --compare baseline.json bench.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import pickle
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import sklearn
+from pandas import DataFrame
+from sklearn.base import is_classifier
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.io.loader import load_data, load_model
+from src.ml_pipeline_handler.io.saver import save_artifact, save_model
+from src.ml_pipeline_handler.metric.metric_factory import MetricFactory
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+N_FEATURES = 8
+FEATURES = [f"feature_{index}" for index in range(N_FEATURES)]
+CLASSES = np.array(["class_a", "class_b", "class_c"])
+
+
+@dataclass
+class BenchmarkResult:
+    """Benchmark Result Data Class, the timing and peak memory of one stage."""
+
+    name: str
+    rows: int
+    seconds: float
+    peak_mb: Optional[float]
+    repeats: int
+
+
+def generate_data(directory: Path, n_rows: int, model_type: ModelType, seed: int = 42) -> Path:
+    """Write a synthetic data set, or reuse the one written by a previous run.
+
+    The features are standard normal, the regression target is a noisy linear combination of them and the
+    classification target the tercile of that combination, as one of three string labels.
+
+    Args:
+        directory: The directory of the generated data sets.
+        n_rows: The number of rows.
+        model_type: The task of the target column.
+        seed: The random seed.
+
+    Returns:
+        The path of the CSV file.
+
+    """
+    data_path = directory / f"{model_type.value}_{n_rows}_{seed}.csv"
+    if data_path.exists():
+        return data_path
+
+    rng = np.random.default_rng(seed=seed)
+    features = rng.normal(size=(n_rows, N_FEATURES)).astype(np.float32)
+    signal = features @ rng.normal(size=N_FEATURES) + rng.normal(scale=0.5, size=n_rows)
+    if model_type == ModelType.REGRESSION:
+        target: np.ndarray = signal
+    else:
+        target = CLASSES[np.searchsorted(np.quantile(signal, q=[1 / 3, 2 / 3]), signal)]
+
+    data = DataFrame(data=features, columns=FEATURES)
+    data["target"] = target
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp_path = data_path.with_suffix(".tmp")
+    data.to_csv(path_or_buf=tmp_path, index=False, float_format="%.6g")
+    tmp_path.replace(data_path)
+    return data_path
+
+
+def measure(name: str, n_rows: int, run: Callable[[], Any], repeats: int, *, memory: bool = True) -> BenchmarkResult:
+    """Time a stage over several repeats and measure its peak memory in one more run.
+
+    Args:
+        name: The name of the stage.
+        n_rows: The number of rows of the data set.
+        run: Callable running the stage.
+        repeats: The number of timed runs, the fastest is reported.
+        memory: Whether to measure the peak memory with tracemalloc.
+
+    Returns:
+        BenchmarkResult of the stage.
+
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+    result = BenchmarkResult(name=name, rows=n_rows, seconds=min(timings), peak_mb=peak_mb, repeats=repeats)
+    peak = f"{peak_mb:>10.1f}" if peak_mb is not None else f"{'-':>10}"
+    print(f"{name:<48}{n_rows:>10}{result.seconds:>12.4f}{peak}")  # noqa: T201
+    return result
+
+
+def build_config(data_path: Path, algorithm: AlgorithmType, out_file: str) -> PipelineConfig:
+    """Build the config of a benchmarked pipeline, scaling every feature with scalers the SGD pipelines fit in batches.
+
+    Args:
+        data_path: The path of the data set.
+        algorithm: The algorithm of the pipeline.
+        out_file: The output file of the pipeline.
+
+    Returns:
+        PipelineConfig of the pipeline.
+
+    """
+    return PipelineConfig(
+        data_path=str(data_path),
+        features=FEATURES,
+        target_column="target",
+        algorithm=algorithm,
+        out_file=out_file,
+        random_state=42,
+        scale_standard=FEATURES[:6],
+        scale_minmax=FEATURES[6:],
+    )
+
+
+def model_type_of(algorithm: AlgorithmType) -> ModelType:
+    """Find the task of an algorithm from the estimator of its pipeline.
+
+    Args:
+        algorithm: The algorithm.
+
+    Returns:
+        ModelType of the algorithm.
+
+    """
+    pipeline = PipelineFactory.build_pipeline(config=build_config(data_path=Path(), algorithm=algorithm, out_file=""))
+    return ModelType.CLASSIFICATION if is_classifier(pipeline.model) else ModelType.REGRESSION
+
+
+def benchmark_task(
+    data_path: Path, n_rows: int, model_type: ModelType, algorithms: list[AlgorithmType], repeats: int, *, memory: bool
+) -> list[BenchmarkResult]:
+    """Benchmark the stages of one task on one data set.
+
+    Args:
+        data_path: The path of the data set.
+        n_rows: The number of rows of the data set.
+        model_type: The task of the data set.
+        algorithms: The algorithms of the task to fit and predict with.
+        repeats: The number of timed runs per stage.
+        memory: Whether to measure the peak memory of every stage.
+
+    Returns:
+        The BenchmarkResult of every stage.
+
+    """
+    task = model_type.value
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        config = build_config(data_path=data_path, algorithm=algorithms[0], out_file=f"{directory}/model.art")
+        pipeline = PipelineFactory.build_pipeline(config=config)
+
+        results.append(
+            measure(
+                name=f"load_data[{task}]",
+                n_rows=n_rows,
+                run=lambda: load_data(data_path=config.data_path, target_column="target", features=FEATURES),
+                repeats=repeats,
+                memory=memory,
+            )
+        )
+        features, target = load_data(data_path=config.data_path, target_column="target", features=FEATURES)
+        results.append(
+            measure(
+                name=f"create_training_set[{task}]",
+                n_rows=n_rows,
+                run=lambda: pipeline.create_training_set(features=features, target=target, test_size=0.3),
+                repeats=repeats,
+                memory=memory,
+            )
+        )
+        x_train, x_test, y_train, y_test = pipeline.create_training_set(features=features, target=target, test_size=0.3)
+        results.append(
+            measure(
+                name=f"pre_process_data[{task}]",
+                n_rows=n_rows,
+                run=lambda: pipeline.pre_process_data(x_train=x_train, x_test=x_test),
+                repeats=repeats,
+                memory=memory,
+            )
+        )
+        x_train_pre_processed, x_test_pre_processed = pipeline.pre_process_data(x_train=x_train, x_test=x_test)
+
+        for algorithm in algorithms:
+            pipeline = PipelineFactory.build_pipeline(
+                config=build_config(data_path=data_path, algorithm=algorithm, out_file=f"{directory}/model.art")
+            )
+            results.extend(
+                benchmark_algorithm(
+                    pipeline=pipeline,
+                    x_train=x_train_pre_processed,
+                    x_test=x_test_pre_processed,
+                    y_train=y_train,
+                    n_rows=n_rows,
+                    repeats=repeats,
+                    memory=memory,
+                )
+            )
+            # The estimator is fitted by the fit benchmark, the pre-processor is needed by the artifact.
+            pipeline.pre_process_data(x_train=x_train, x_test=x_test)
+            results.extend(
+                benchmark_persistence(
+                    pipeline=pipeline, directory=Path(directory), n_rows=n_rows, repeats=repeats, memory=memory
+                )
+            )
+
+        prediction = pipeline.model.predict(X=x_test_pre_processed)
+        probability = pipeline.predict_probability(x=x_test_pre_processed)
+        handler = MetricFactory.get_metrics_handler(model_type=model_type)
+        results.append(
+            measure(
+                name=f"compute_metrics[{task}]",
+                n_rows=n_rows,
+                run=lambda: handler.compute_metrics(
+                    y_true=y_test,
+                    y_pred=prediction,
+                    y_proba=probability,
+                    classes=getattr(pipeline.model, "classes_", None),
+                ),
+                repeats=repeats,
+                memory=memory,
+            )
+        )
+    return results
+
+
+def benchmark_algorithm(
+    pipeline: BasePipeline,
+    x_train: np.ndarray,
+    x_test: np.ndarray,
+    y_train: pd.Series,
+    *,
+    n_rows: int,
+    repeats: int,
+    memory: bool,
+) -> list[BenchmarkResult]:
+    """Benchmark fitting and predicting with the estimator of a pipeline on pre-processed data.
+
+    Args:
+        pipeline: The pipeline of the algorithm.
+        x_train: The pre-processed training features.
+        x_test: The pre-processed testing features.
+        y_train: The training target.
+        n_rows: The number of rows of the data set.
+        repeats: The number of timed runs per stage.
+        memory: Whether to measure the peak memory of every stage.
+
+    Returns:
+        The BenchmarkResult of fit and predict.
+
+    """
+    algorithm = AlgorithmType(pipeline.config.algorithm).value
+    model = pipeline.model
+    fit = measure(
+        name=f"fit[{algorithm}]",
+        n_rows=n_rows,
+        run=lambda: model.fit(X=x_train, y=y_train),
+        repeats=repeats,
+        memory=memory,
+    )
+    predict = measure(
+        name=f"predict[{algorithm}]",
+        n_rows=n_rows,
+        run=lambda: model.predict(X=x_test),
+        repeats=repeats,
+        memory=memory,
+    )
+    return [fit, predict]
+
+
+def benchmark_persistence(
+    pipeline: BasePipeline, directory: Path, n_rows: int, repeats: int, *, memory: bool
+) -> list[BenchmarkResult]:
+    """Benchmark saving and loading a fitted pipeline as a pickle and as a slim artifact.
+
+    Args:
+        pipeline: The fitted pipeline.
+        directory: The directory to write the files to.
+        n_rows: The number of rows of the data set.
+        repeats: The number of timed runs per stage.
+        memory: Whether to measure the peak memory of every stage.
+
+    Returns:
+        The BenchmarkResult of every save and load.
+
+    """
+    algorithm = AlgorithmType(pipeline.config.algorithm).value
+    pickle_path, artifact_path = directory / "model.pkl", directory / "model.art"
+
+    def load_pickle() -> BasePipeline:
+        with pickle_path.open(mode="rb") as f:
+            return pickle.load(f)  # noqa: S301
+
+    stages: list[tuple[str, Callable[[], Any]]] = [
+        ("save_model", lambda: save_model(model=pipeline, file_name=str(pickle_path))),
+        ("load_pickle", load_pickle),
+        ("save_artifact", lambda: save_artifact(model=pipeline, file_name=str(artifact_path))),
+        ("load_model", lambda: load_model(file_name=str(artifact_path))),
+    ]
+    return [
+        measure(name=f"{name}[{algorithm}]", n_rows=n_rows, run=run, repeats=repeats, memory=memory)
+        for name, run in stages
+    ]
+
+
+def run_suite(
+    rows: list[int], algorithms: list[AlgorithmType], data_dir: Path, repeats: int, *, memory: bool = True
+) -> dict[str, Any]:
+    """Run the benchmark suite on data sets of every size.
+
+    Args:
+        rows: The sizes of the synthetic data sets.
+        algorithms: The algorithms to benchmark.
+        data_dir: The directory of the generated data sets, reused between runs.
+        repeats: The number of timed runs per stage.
+        memory: Whether to measure the peak memory of every stage.
+
+    Returns:
+        Mapping of 'metadata' (versions, platform, date) and 'results' (every BenchmarkResult as a mapping).
+
+    """
+    print(f"{'benchmark':<48}{'rows':>10}{'seconds':>12}{'peak MB':>10}")  # noqa: T201
+    results = []
+    for n_rows in rows:
+        for model_type in ModelType:
+            task_algorithms = [
+                algorithm for algorithm in algorithms if model_type_of(algorithm=algorithm) == model_type
+            ]
+            if not task_algorithms:
+                continue
+            data_path = generate_data(directory=data_dir, n_rows=n_rows, model_type=model_type)
+            results.extend(
+                benchmark_task(
+                    data_path=data_path,
+                    n_rows=n_rows,
+                    model_type=model_type,
+                    algorithms=task_algorithms,
+                    repeats=repeats,
+                    memory=memory,
+                )
+            )
+
+    return {
+        "metadata": {
+            "date": datetime.now(tz=UTC).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "scikit-learn": sklearn.__version__,
+            "repeats": repeats,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> list[str]:
+    """Compare two result files and print the time and peak memory ratio of every common benchmark.
+
+    Args:
+        baseline: The results of the reference version.
+        current: The results of the version to check.
+        tolerance: The relative slowdown or memory growth above which a benchmark counts as a regression.
+
+    Returns:
+        The names of the regressed benchmarks, with their rows.
+
+    """
+    reference = {(result["name"], result["rows"]): result for result in baseline["results"]}
+    regressions = []
+    print(f"{'benchmark':<48}{'rows':>10}{'time ratio':>12}{'peak ratio':>12}")  # noqa: T201
+    for result in current["results"]:
+        key = (result["name"], result["rows"])
+        if key not in reference:
+            continue
+        time_ratio = result["seconds"] / reference[key]["seconds"]
+        peak_ratio = (
+            result["peak_mb"] / reference[key]["peak_mb"]
+            if result["peak_mb"] is not None and reference[key]["peak_mb"]
+            else 1.0
+        )
+        regressed = time_ratio > 1 + tolerance or peak_ratio > 1 + tolerance
+        if regressed:
+            regressions.append(f"{result['name']} ({result['rows']} rows)")
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{result['name']:<48}{result['rows']:>10}{time_ratio:>12.2f}{peak_ratio:>12.2f}{flag}")  # noqa: T201
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark suite and write its results, or compare two result files.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(description="Pipeline benchmark suite")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000], help="Data set sizes (e.g. 10000 1000000)")
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        default=[algorithm.value for algorithm in AlgorithmType],
+        help="Algorithms to fit and predict with, every AlgorithmType by default",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Number of timed runs per stage")
+    parser.add_argument("--no_memory", action="store_true", help="Skip the tracemalloc peak memory runs")
+    parser.add_argument(
+        "--data_dir", default=".benchmark_data", help="Directory of the generated data sets, reused between runs"
+    )
+    parser.add_argument("--out_file", default="benchmark.json", help="Where to write the JSON results")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="Compare two result files instead of running"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative slowdown counted as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (json.loads(Path(file_name).read_text()) for file_name in args.compare)
+        regressions = compare(baseline=baseline, current=current, tolerance=args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")  # noqa: T201
+            sys.exit(1)
+        return
+
+    report = run_suite(
+        rows=args.rows,
+        algorithms=[AlgorithmType(algorithm) for algorithm in args.algorithms],
+        data_dir=Path(args.data_dir),
+        repeats=args.repeats,
+        memory=not args.no_memory,
+    )
+    Path(args.out_file).write_text(json.dumps(report, indent=2))
+    print(f"Results written to {args.out_file}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
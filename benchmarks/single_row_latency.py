@@ -0,0 +1,91 @@
+"""Single Row Latency Benchmark.
+
+Scores records one at a time through the current path (a 1-row DataFrame through predict_batch, i.e. the fitted
+ColumnTransformer and the estimator's predict) and through the CompiledScorer (a plain dict), and reports the p50 and
+p99 latency per row of both.
+
+Example usage:
+python -m benchmarks.single_row_latency --rows 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from pandas import DataFrame, read_csv
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.compiled_scorer import CompiledScorer
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+HOUSING_FEATURES = ["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"]
+IRIS_FEATURES = ["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"]
+CASES = [
+    (AlgorithmType.LINEAR_REGRESSION, "src/data/housing.csv", HOUSING_FEATURES, "SalePrice"),
+    (AlgorithmType.LOGISTIC_REGRESSION, "src/data/Iris.csv", IRIS_FEATURES, "Species"),
+    (AlgorithmType.DECISION_TREE_REGRESSOR, "src/data/housing.csv", HOUSING_FEATURES, "SalePrice"),
+]
+
+
+def percentiles_us(latencies: list[float]) -> tuple[float, float]:
+    """Compute the p50 and p99 of latencies in microseconds.
+
+    Args:
+        latencies: The latencies in seconds.
+
+    Returns:
+        The p50 and p99 latency in microseconds.
+
+    """
+    p50, p99 = np.percentile(np.array(latencies) * 1e6, q=[50, 99])
+    return float(p50), float(p99)
+
+
+def main() -> None:
+    """Run the benchmark and print the per-row latency of both scoring paths.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(description="Single row latency benchmark")
+    parser.add_argument("--rows", type=int, default=2000, help="Number of rows scored per path")
+    args = parser.parse_args()
+
+    print(f"{'algorithm':<26}{'path':<10}{'p50 us':>10}{'p99 us':>10}")  # noqa: T201
+    for algorithm, data_path, features, target_column in CASES:
+        config = PipelineConfig(
+            data_path=data_path,
+            features=features,
+            target_column=target_column,
+            algorithm=algorithm,
+            out_file="",
+            random_state=42,
+            scale_standard=features[:2],
+            scale_robust=features[2:3],
+            scale_minmax=features[3:],
+        )
+        pipeline = PipelineFactory.build_pipeline(config=config)
+        pipeline.predict()
+        scorer = CompiledScorer.from_pipeline(pipeline=pipeline)
+
+        records = read_csv(data_path)[features].to_dict(orient="records")
+        records = (records * (args.rows // len(records) + 1))[: args.rows]
+
+        current, compiled = [], []
+        for record in records:
+            start = time.perf_counter()
+            pipeline.predict_batch(x=DataFrame([record]))
+            current.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            scorer.predict_one(row=record)
+            compiled.append(time.perf_counter() - start)
+
+        for path, latencies in (("current", current), ("compiled", compiled)):
+            p50, p99 = percentiles_us(latencies=latencies)
+            print(f"{algorithm.value:<26}{path:<10}{p50:>10.1f}{p99:>10.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ from loguru import logger
 from src.ml_pipeline_handler.algorithm import AlgorithmType
 from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
 from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.telemetry.profiler import StageProfiler
+from src.ml_pipeline_handler.telemetry.span import configure_instrumentation, shutdown_instrumentation, span
 
 
 def main(
@@ -16,6 +18,9 @@ def main(
     algorithm: AlgorithmType,
     out_file: str,
     random_state: int = 42,
+    *,
+    profile: bool = False,
+    profile_top: int = 20,
 ) -> None:
     """Entry point for the ML pipeline application.
 
@@ -29,6 +34,9 @@ def main(
         algorithm: str, Name of the ML algorithm.
         out_file: str, Name of the outfile for model pipelines.
         random_state: int, Random seed for reproducibility.
+        profile: bool, Profile the run by stage with cProfile, the profile is written next to out_file (or to
+            main.pstats and main.collapsed without out_file).
+        profile_top: int, Number of functions logged per stage by cumulative time.
 
     Returns:
         None
@@ -38,26 +46,32 @@ def main(
         f"Starting Main function with: [data_path]: {data_path}, [features]: {features}, [target_column]: "
         f"{target_column}, [scale_standard]: {scale_standard}, [scale_robust]: {scale_robust}, "
         f"[scale_minmax]: {scale_minmax}, [algorithm]: {algorithm}, [out_file]: {out_file}, "
-        f"[random_state]: {random_state}"
+        f"[random_state]: {random_state}, [profile]: {profile}"
     )
+    if profile:
+        configure_instrumentation(sinks=[StageProfiler(file_name=out_file or "main", top_n=profile_top)])
 
-    pipeline_config = PipelineConfig(
-        data_path=data_path,
-        features=features,
-        target_column=target_column,
-        algorithm=algorithm,
-        out_file=out_file,
-        random_state=random_state,
-        scale_standard=scale_standard,
-        scale_robust=scale_robust,
-        scale_minmax=scale_minmax,
-    )
+    try:
+        pipeline_config = PipelineConfig(
+            data_path=data_path,
+            features=features,
+            target_column=target_column,
+            algorithm=algorithm,
+            out_file=out_file,
+            random_state=random_state,
+            scale_standard=scale_standard,
+            scale_robust=scale_robust,
+            scale_minmax=scale_minmax,
+        )
 
-    pipeline = PipelineFactory.build_pipeline(config=pipeline_config)
-    prediction, probability = pipeline.predict()
+        pipeline = PipelineFactory.build_pipeline(config=pipeline_config)
+        prediction, probability = pipeline.predict()
 
-    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
-    logger.info(f"Metrics: {metrics}")
+        with span("metrics", rows=len(prediction)):
+            metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+        logger.info(f"Metrics: {metrics}")
+    finally:
+        shutdown_instrumentation()
 
     # TODO: from src.io.saver import save_data # save_model(pipeline, "model.pkl")
 
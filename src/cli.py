@@ -1,34 +1,35 @@
-"""CLI module."""
+"""CLI module.
+
+Only argparse and the algorithm, backend and sampling method names are imported at start-up, every command imports the
+modules it uses once its arguments are parsed, so --help and argument errors return without importing pandas,
+scikit-learn or the pipelines.
+"""
 
 import argparse
+import sys
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Optional
 
-from loguru import logger
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_config import BACKENDS, SAMPLING_METHODS
 
-from src.ml_pipeline_handler.io.saver import save_model
-from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
-from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+if TYPE_CHECKING:
+    from numpy import ndarray
 
+    from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
 
-def cli() -> None:
-    """CLI wrapper for the main application.
 
-    Example usage:
-    python src/cli.py --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea" "GarageCars" "GarageArea"
-     "TotalBsmtSF" --target_column=SalePrice --algorithm=linear_regression --random_state=42 --out_file=whatever.pkl
-      --scale_robust "GrLivArea" "TotalBsmtSF"
+def add_data_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the data loading, pre-processing and split arguments shared by the training subcommands.
 
-    python src/cli.py --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea" "GarageCars" "GarageArea"
-     "TotalBsmtSF" --target_column=SalePrice --algorithm=linear_regression --random_state=42 --out_file=whatever.pkl
+    Args:
+        parser: The parser to add the arguments to.
 
     Returns:
         None
 
     """
-    logger.info("[START] CLI")
-
-    parser = argparse.ArgumentParser(
-        description="ML Pipeline Application",
-    )
     parser.add_argument("--data_path", required=True, help="Path to the CSV file")
     parser.add_argument(
         "--features",
@@ -58,39 +59,721 @@ def cli() -> None:
         default=[],
         help="List of features to scale using MinMaxScaler (e.g., 'feature1 feature2 feature3')",
     )
+    parser.add_argument("--random_state", type=int, default=42, help="Random state for reproducibility")
+    parser.add_argument(
+        "--compact_dtypes",
+        action="store_true",
+        help="Downcast parsed columns to compact dtypes (float32, smallest integer, category)",
+    )
+    parser.add_argument(
+        "--csv_engine",
+        choices=["c", "python", "pyarrow"],
+        default="c",
+        help="Parser engine used to read the CSV file, 'pyarrow' falls back to 'c' when not installed",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        default=None,
+        help="Directory of the columnar dataset cache, the CSV is parsed once and memory-mapped on later runs",
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=100_000,
+        help="Rows per batch streamed to incremental algorithms (e.g. 'sgd_regressor', 'sgd_classifier')",
+    )
+    parser.add_argument(
+        "--cache_stages",
+        action="store_true",
+        help="Reuse the train/test split and fitted scalers of pipelines sharing the same data and scaler settings",
+    )
+    parser.add_argument(
+        "--stage_cache_dir",
+        default=None,
+        help="Directory to also keep the cached split-and-preprocess stages in, for reuse across runs",
+    )
+    parser.add_argument(
+        "--sample",
+        type=float,
+        default=None,
+        help="Fit on a sample of the rows, a fraction (e.g. 0.01) or a number of rows (e.g. 50000), streamed from the "
+        "CSV file and cached in --cache_dir when set",
+    )
+    parser.add_argument(
+        "--sample_method",
+        choices=SAMPLING_METHODS,
+        default="uniform",
+        help="How the --sample rows are drawn: 'uniform' (independent rows), 'stratified' (every target class keeps "
+        "its share) or 'reservoir' (exactly the requested number of rows)",
+    )
+    parser.add_argument(
+        "--n_jobs",
+        type=int,
+        default=-1,
+        help="Number of cores of the estimators and of the worker pools sharing them, -1 uses every core",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="loky",
+        help="joblib backend of the worker pools, 'threading' suits estimators releasing the GIL",
+    )
+    parser.add_argument(
+        "--blas_threads",
+        type=int,
+        default=None,
+        help="Thread limit of the BLAS and OpenMP libraries, capped to the cores of every worker",
+    )
+
+
+def add_instrumentation_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments enabling the per-stage instrumentation, disabled unless a sink is given.
+
+    Args:
+        parser: The argument parser of a CLI command.
+
+    Returns:
+        None
+
+    """
+    parser.add_argument("--telemetry_json", default=None, help="Append a JSON line per pipeline stage to this file")
+    parser.add_argument(
+        "--telemetry_prometheus",
+        default=None,
+        help="Write per-stage metrics to this Prometheus textfile (e.g. for the node exporter's textfile collector)",
+    )
+    parser.add_argument(
+        "--telemetry_otlp",
+        default=None,
+        help="Export the stages as OpenTelemetry spans, written as OTLP/JSON to this file when the SDK is missing",
+    )
+    parser.add_argument(
+        "--trace_memory",
+        action="store_true",
+        help="Also record the peak memory allocated per stage with tracemalloc (slower)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run with cProfile, writing .pstats and collapsed-stack (flamegraph) files next to the output",
+    )
+    parser.add_argument(
+        "--profile_file",
+        default=None,
+        help="Write the profile to <profile_file>.pstats and <profile_file>.collapsed instead of next to the output",
+    )
+    parser.add_argument(
+        "--profile_top", type=int, default=20, help="Number of functions logged per stage by cumulative time"
+    )
+
+
+def setup_instrumentation(args: argparse.Namespace, out_file: Optional[str]) -> None:
+    """Configure the instrumentation sinks requested on the command line.
+
+    Args:
+        args: The parsed arguments, including the ones of add_instrumentation_arguments.
+        out_file: Optional output file of the command, the profile is written next to it unless --profile_file is
+            given. Commands without an output file require --profile_file with --profile.
+
+    Returns:
+        None
+
+    """
+    from src.ml_pipeline_handler.telemetry.profiler import StageProfiler
+    from src.ml_pipeline_handler.telemetry.sinks import (
+        BaseSink,
+        JsonLogSink,
+        PrometheusTextfileSink,
+        get_opentelemetry_sink,
+    )
+    from src.ml_pipeline_handler.telemetry.span import configure_instrumentation
+
+    sinks: list[BaseSink] = []
+    if args.telemetry_json:
+        sinks.append(JsonLogSink(file_name=args.telemetry_json))
+    if args.telemetry_prometheus:
+        sinks.append(PrometheusTextfileSink(file_name=args.telemetry_prometheus))
+    if args.telemetry_otlp:
+        sinks.append(get_opentelemetry_sink(file_name=args.telemetry_otlp))
+    if args.profile:
+        sinks.append(StageProfiler(file_name=args.profile_file or str(out_file), top_n=args.profile_top))
+    if sinks:
+        configure_instrumentation(sinks=sinks, trace_memory=args.trace_memory)
+
+
+def predict_cli(argv: Optional[list[str]] = None) -> None:
+    """CLI wrapper to score new data with a saved model artifact, in fixed-size chunks and without retraining.
+
+    Example usage:
+    python src/cli.py predict --model=whatever.pkl --input=src/data/housing.csv --output=predictions.csv
+
+    Args:
+        argv: Optional list of arguments, defaults to the command line arguments.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py predict",
+        description="Score new data with a saved model artifact",
+    )
+    parser.add_argument("--model", required=True, help="Path to the model artifact (saved with --slim_artifact)")
+    parser.add_argument("--input", required=True, help="Path to the CSV file to score")
+    parser.add_argument("--output", required=True, help="Where to store the predictions (.csv or .parquet)")
+    parser.add_argument("--chunk_size", type=int, default=100_000, help="Rows scored per chunk")
+    parser.add_argument("--mmap", action="store_true", help="Memory-map the model artifact")
+    parser.add_argument(
+        "--evaluate",
+        action="store_true",
+        help="Also compute the metrics against the target column of the input, accumulated chunk by chunk",
+    )
+    add_instrumentation_arguments(parser=parser)
+
+    args = parser.parse_args(args=argv)
+
+    from loguru import logger
+    from pandas import DataFrame
+    from sklearn.base import is_classifier
+
+    from src.ml_pipeline_handler.io.loader import load_model
+    from src.ml_pipeline_handler.io.saver import save_predictions
+    from src.ml_pipeline_handler.io.stream import stream_data, stream_features
+    from src.ml_pipeline_handler.metric.metric_factory import MetricFactory
+    from src.ml_pipeline_handler.metric.model_type import ModelType
+    from src.ml_pipeline_handler.telemetry.span import shutdown_instrumentation, span
+
+    logger.info("[START] CLI predict")
+    setup_instrumentation(args=args, out_file=args.output)
+
+    logger.info(
+        f"Starting Predict function with: [model]: {args.model}, [input]: {args.input}, [output]: {args.output}, "
+        f"[chunk_size]: {args.chunk_size}, [mmap]: {args.mmap}, [evaluate]: {args.evaluate}"
+    )
+
+    try:
+        artifact = load_model(file_name=args.model, mmap=args.mmap)
+        frames = stream_features(data_path=args.input, features=artifact.features, chunk_size=args.chunk_size)
+
+        def predictions() -> Iterator[DataFrame]:
+            for x in frames:
+                yield DataFrame({artifact.target_column: artifact.predict_batch(x=x)})
+
+        model_type = ModelType.CLASSIFICATION if is_classifier(artifact.model) else ModelType.REGRESSION
+        accumulator = MetricFactory.get_metrics_accumulator(
+            model_type=model_type, classes=getattr(artifact.model, "classes_", None)
+        )
+
+        def evaluated_predictions() -> Iterator[DataFrame]:
+            for x, y in stream_data(
+                data_path=args.input,
+                target_column=artifact.target_column,
+                features=artifact.features,
+                chunk_size=args.chunk_size,
+            ):
+                prediction, probability = artifact.score_batch(x=x)
+                accumulator.update(y_true=y, y_pred=prediction, y_proba=probability)
+                yield DataFrame({artifact.target_column: prediction})
+
+        start = time.perf_counter()
+        with span("predict") as stage:
+            scored = evaluated_predictions() if args.evaluate else predictions()
+            rows = save_predictions(frames=scored, file_name=args.output)
+            stage.set_rows(rows)
+        elapsed = time.perf_counter() - start
+        logger.info(f"Scored {rows} rows in {elapsed:.3f}s ({rows / max(elapsed, 1e-9):.0f} rows/s)")
+        if args.evaluate:
+            logger.info(f"Metrics: {accumulator.result()}")
+    finally:
+        shutdown_instrumentation()
+    logger.info("[END] CLI predict")
+
+
+def compare_cli(argv: Optional[list[str]] = None) -> None:
+    """CLI wrapper to fit several algorithms in parallel on one shared split of the data set and rank them.
+
+    Example usage:
+    python src/cli.py compare --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea" "GarageCars"
+     --target_column=SalePrice --algorithms linear_regression decision_tree_regressor random_forest_regressor
+
+    Args:
+        argv: Optional list of arguments, defaults to the command line arguments.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py compare",
+        description="Compare several algorithms on one shared split of the data set",
+    )
+    add_data_arguments(parser=parser)
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        required=True,
+        choices=[algorithm.value for algorithm in AlgorithmType],
+        help="List of algorithms to compare (e.g., 'linear_regression random_forest_regressor')",
+    )
+    add_instrumentation_arguments(parser=parser)
+
+    args = parser.parse_args(args=argv)
+    if args.profile and not args.profile_file:
+        parser.error("--profile requires --profile_file, compare has no output file to write the profile next to")
+
+    from loguru import logger
+
+    from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+    from src.ml_pipeline_handler.pipeline.comparison_runner import compare_algorithms
+    from src.ml_pipeline_handler.telemetry.span import shutdown_instrumentation
+
+    logger.info("[START] CLI compare")
+    setup_instrumentation(args=args, out_file=None)
+
+    logger.info(
+        f"Starting Compare function with: [data_path]: {args.data_path}, [features]: {args.features}, "
+        f"[target_column]: {args.target_column}, [algorithms]: {args.algorithms}, [n_jobs]: {args.n_jobs}, "
+        f"[backend]: {args.backend}, [blas_threads]: {args.blas_threads}, [sample]: {args.sample}, [sample_method]: "
+        f"{args.sample_method}"
+    )
+
+    try:
+        algorithms = [AlgorithmType(algorithm) for algorithm in args.algorithms]
+        pipeline_config = PipelineConfig(
+            data_path=args.data_path,
+            features=args.features,
+            target_column=args.target_column,
+            algorithm=algorithms[0],
+            out_file="",
+            random_state=args.random_state,
+            scale_standard=args.scale_standard,
+            scale_robust=args.scale_robust,
+            scale_minmax=args.scale_minmax,
+            compact_dtypes=args.compact_dtypes,
+            csv_engine=args.csv_engine,
+            cache_dir=args.cache_dir,
+            chunk_size=args.chunk_size,
+            cache_stages=args.cache_stages,
+            stage_cache_dir=args.stage_cache_dir,
+            n_jobs=args.n_jobs,
+            backend=args.backend,
+            blas_threads=args.blas_threads,
+            sample=args.sample,
+            sample_method=args.sample_method,
+        )
+        compare_algorithms(config=pipeline_config, algorithms=algorithms)
+    finally:
+        shutdown_instrumentation()
+    logger.info("[END] CLI compare")
+
+
+def search_cli(argv: Optional[list[str]] = None) -> None:
+    """CLI wrapper to tune an algorithm with successive halving and save the best pipeline.
+
+    Example usage:
+    python src/cli.py search --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea" "GarageCars"
+     --target_column=SalePrice --algorithm=random_forest_regressor --out_file=best.pkl --n_candidates=27
+
+    Args:
+        argv: Optional list of arguments, defaults to the command line arguments.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py search",
+        description="Tune an algorithm with successive halving and save the best pipeline",
+    )
+    add_data_arguments(parser=parser)
+    parser.add_argument(
+        "--algorithm",
+        required=True,
+        choices=[algorithm.value for algorithm in AlgorithmType],
+        help="Algorithm name (e.g., 'random_forest')",
+    )
+    parser.add_argument("--out_file", required=True, help="Where to store the best pipeline")
+    parser.add_argument("--n_candidates", type=int, default=27, help="Number of candidates of the first round")
+    parser.add_argument("--factor", type=int, default=3, help="Proportion of candidates kept (1 / factor) per round")
+    parser.add_argument("--n_folds", type=int, default=3, help="Number of cross-validation folds")
+    parser.add_argument("--max_trials", type=int, default=None, help="Budget of candidate evaluations")
+    add_instrumentation_arguments(parser=parser)
+
+    args = parser.parse_args(args=argv)
+
+    from loguru import logger
+
+    from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+    from src.ml_pipeline_handler.search.halving_search import SearchConfig, halving_search
+    from src.ml_pipeline_handler.telemetry.span import shutdown_instrumentation
+
+    logger.info("[START] CLI search")
+    setup_instrumentation(args=args, out_file=args.out_file)
+
+    logger.info(
+        f"Starting Search function with: [data_path]: {args.data_path}, [features]: {args.features}, "
+        f"[target_column]: {args.target_column}, [algorithm]: {args.algorithm}, [out_file]: {args.out_file}, "
+        f"[n_candidates]: {args.n_candidates}, [factor]: {args.factor}, [n_folds]: {args.n_folds}, "
+        f"[max_trials]: {args.max_trials}, [n_jobs]: {args.n_jobs}, [backend]: {args.backend}, [blas_threads]: "
+        f"{args.blas_threads}, [sample]: {args.sample}, [sample_method]: {args.sample_method}"
+    )
+
+    try:
+        pipeline_config = PipelineConfig(
+            data_path=args.data_path,
+            features=args.features,
+            target_column=args.target_column,
+            algorithm=AlgorithmType(args.algorithm),
+            out_file=args.out_file,
+            random_state=args.random_state,
+            scale_standard=args.scale_standard,
+            scale_robust=args.scale_robust,
+            scale_minmax=args.scale_minmax,
+            compact_dtypes=args.compact_dtypes,
+            csv_engine=args.csv_engine,
+            cache_dir=args.cache_dir,
+            chunk_size=args.chunk_size,
+            cache_stages=args.cache_stages,
+            stage_cache_dir=args.stage_cache_dir,
+            n_jobs=args.n_jobs,
+            backend=args.backend,
+            blas_threads=args.blas_threads,
+            sample=args.sample,
+            sample_method=args.sample_method,
+        )
+        search_config = SearchConfig(
+            n_candidates=args.n_candidates,
+            factor=args.factor,
+            n_folds=args.n_folds,
+            max_trials=args.max_trials,
+        )
+        halving_search(config=pipeline_config, search_config=search_config)
+    finally:
+        shutdown_instrumentation()
+    logger.info("[END] CLI search")
+
+
+def learning_curve_cli(argv: Optional[list[str]] = None) -> None:
+    """CLI wrapper to fit an algorithm on growing fractions of the training set and report the metrics of every size.
+
+    Example usage:
+    python src/cli.py learning_curve --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea"
+     "GarageCars" --target_column=SalePrice --algorithm=random_forest_regressor --fractions 0.1 0.25 0.5 1
+
+    Args:
+        argv: Optional list of arguments, defaults to the command line arguments.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py learning_curve",
+        description="Fit an algorithm on growing fractions of the training set and report the metrics of every size",
+    )
+    add_data_arguments(parser=parser)
+    parser.add_argument(
+        "--algorithm",
+        required=True,
+        choices=[algorithm.value for algorithm in AlgorithmType],
+        help="Algorithm name (e.g., 'random_forest')",
+    )
+    parser.add_argument(
+        "--fractions",
+        nargs="+",
+        type=float,
+        default=None,
+        help="Fractions of the training set to fit on (defaults to 0.01 0.05 0.1 0.25 0.5 1)",
+    )
+    add_instrumentation_arguments(parser=parser)
+
+    args = parser.parse_args(args=argv)
+    if args.profile and not args.profile_file:
+        parser.error(
+            "--profile requires --profile_file, learning_curve has no output file to write the profile next to"
+        )
+
+    from loguru import logger
+
+    from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+    from src.ml_pipeline_handler.pipeline.learning_curve import learning_curve
+    from src.ml_pipeline_handler.telemetry.span import shutdown_instrumentation
+
+    logger.info("[START] CLI learning_curve")
+    setup_instrumentation(args=args, out_file=None)
+
+    logger.info(
+        f"Starting Learning Curve function with: [data_path]: {args.data_path}, [features]: {args.features}, "
+        f"[target_column]: {args.target_column}, [algorithm]: {args.algorithm}, [fractions]: {args.fractions}, "
+        f"[n_jobs]: {args.n_jobs}, [backend]: {args.backend}, [blas_threads]: {args.blas_threads}, [sample]: "
+        f"{args.sample}, [sample_method]: {args.sample_method}"
+    )
+
+    try:
+        pipeline_config = PipelineConfig(
+            data_path=args.data_path,
+            features=args.features,
+            target_column=args.target_column,
+            algorithm=AlgorithmType(args.algorithm),
+            out_file="",
+            random_state=args.random_state,
+            scale_standard=args.scale_standard,
+            scale_robust=args.scale_robust,
+            scale_minmax=args.scale_minmax,
+            compact_dtypes=args.compact_dtypes,
+            csv_engine=args.csv_engine,
+            cache_dir=args.cache_dir,
+            chunk_size=args.chunk_size,
+            cache_stages=args.cache_stages,
+            stage_cache_dir=args.stage_cache_dir,
+            n_jobs=args.n_jobs,
+            backend=args.backend,
+            blas_threads=args.blas_threads,
+            sample=args.sample,
+            sample_method=args.sample_method,
+        )
+        learning_curve(config=pipeline_config, fractions=args.fractions)
+    finally:
+        shutdown_instrumentation()
+    logger.info("[END] CLI learning_curve")
+
+
+def retrain_cli(argv: Optional[list[str]] = None) -> None:
+    """CLI wrapper to add trees fitted on new data to a saved random forest and save it as a new artifact.
+
+    Example usage:
+    python src/cli.py retrain --model=whatever.art --data_path=new_data.csv --out_file=retrained.art --n_new_trees=50
+     --drop_oldest=50
+
+    Args:
+        argv: Optional list of arguments, defaults to the command line arguments.
+
+    Returns:
+        None
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py retrain",
+        description="Add trees fitted on new data to a saved random forest, with the saved pre-processor",
+    )
+    parser.add_argument("--model", required=True, help="Path to the model artifact (saved with --slim_artifact)")
+    parser.add_argument("--data_path", required=True, help="Path to the CSV file of the new data")
+    parser.add_argument("--out_file", required=True, help="Where to store the retrained model artifact")
+    parser.add_argument("--n_new_trees", type=int, default=100, help="Number of trees fitted on the new data")
+    parser.add_argument(
+        "--drop_oldest",
+        type=int,
+        default=0,
+        help="Number of the oldest trees dropped before adding the new ones, a sliding window over the data batches",
+    )
+    parser.add_argument(
+        "--n_jobs", type=int, default=-1, help="Number of cores fitting the new trees, -1 uses every core"
+    )
+    add_instrumentation_arguments(parser=parser)
+
+    args = parser.parse_args(args=argv)
+
+    from loguru import logger
+
+    from src.ml_pipeline_handler.io.loader import load_model
+    from src.ml_pipeline_handler.pipeline.retrain import artifact_config, retrain_forest
+    from src.ml_pipeline_handler.telemetry.span import shutdown_instrumentation
+
+    logger.info("[START] CLI retrain")
+    setup_instrumentation(args=args, out_file=args.out_file)
+
+    logger.info(
+        f"Starting Retrain function with: [model]: {args.model}, [data_path]: {args.data_path}, [out_file]: "
+        f"{args.out_file}, [n_new_trees]: {args.n_new_trees}, [drop_oldest]: {args.drop_oldest}, [n_jobs]: "
+        f"{args.n_jobs}"
+    )
+
+    try:
+        artifact = load_model(file_name=args.model)
+        pipeline_config = artifact_config(
+            artifact=artifact, data_path=args.data_path, out_file=args.out_file, n_jobs=args.n_jobs
+        )
+        retrain_forest(
+            artifact=artifact, config=pipeline_config, n_new_trees=args.n_new_trees, drop_oldest=args.drop_oldest
+        )
+    finally:
+        shutdown_instrumentation()
+    logger.info("[END] CLI retrain")
+
+
+def log_confidence_intervals(
+    args: argparse.Namespace, pipeline: "BasePipeline", prediction: "ndarray", probability: Optional["ndarray"]
+) -> None:
+    """Compute and log the bootstrap confidence intervals of the testing metrics of a fitted pipeline.
+
+    Args:
+        args: The parsed arguments of the CLI, with the number of bootstrap replicates.
+        pipeline: The fitted pipeline.
+        prediction: The predictions of the testing set.
+        probability: Optional class probabilities of the testing set.
+
+    Returns:
+        None
+
+    """
+    from loguru import logger
+
+    from src.ml_pipeline_handler.metric.bootstrap import BootstrapConfig
+    from src.ml_pipeline_handler.telemetry.span import span
+
+    with span("bootstrap", rows=len(prediction), n_boot=args.bootstrap):
+        intervals = pipeline.metric_handler.compute_confidence_intervals(
+            y_true=pipeline.y_test,
+            y_pred=prediction,
+            y_proba=probability,
+            config=BootstrapConfig(
+                n_boot=args.bootstrap,
+                n_jobs=args.n_jobs,
+                blas_threads=args.blas_threads,
+                random_state=args.random_state,
+            ),
+            classes=getattr(pipeline.model, "classes_", None),
+        )
+    logger.info(f"Bootstrap confidence intervals: {intervals}")
+
+
+def cli() -> None:
+    """CLI wrapper for the main application.
+
+    Example usage:
+    python src/cli.py --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea" "GarageCars" "GarageArea"
+     "TotalBsmtSF" --target_column=SalePrice --algorithm=linear_regression --random_state=42 --out_file=whatever.pkl
+      --scale_robust "GrLivArea" "TotalBsmtSF"
+
+    python src/cli.py --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea" "GarageCars" "GarageArea"
+     "TotalBsmtSF" --target_column=SalePrice --algorithm=linear_regression --random_state=42 --out_file=whatever.pkl
+
+    python src/cli.py predict --model=whatever.pkl --input=src/data/housing.csv --output=predictions.csv
+
+    python src/cli.py compare --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea"
+     --target_column=SalePrice --algorithms linear_regression random_forest_regressor
+
+    python src/cli.py search --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea"
+     --target_column=SalePrice --algorithm=random_forest_regressor --out_file=best.pkl
+
+    python src/cli.py learning_curve --data_path=src/data/housing.csv --features "OverallQual" "GrLivArea"
+     --target_column=SalePrice --algorithm=random_forest_regressor
+
+    python src/cli.py retrain --model=whatever.art --data_path=new_data.csv --out_file=retrained.art
+
+    Returns:
+        None
+
+    """
+    if sys.argv[1:2] == ["predict"]:
+        predict_cli(argv=sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["compare"]:
+        compare_cli(argv=sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["search"]:
+        search_cli(argv=sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["learning_curve"]:
+        learning_curve_cli(argv=sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["retrain"]:
+        retrain_cli(argv=sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(
+        description="ML Pipeline Application",
+    )
+    add_data_arguments(parser=parser)
     parser.add_argument("--algorithm", required=True, help="Algorithm name (e.g., 'RandomForest')")
     parser.add_argument("--out_file", required=True, help="Where to store the output file")
-    parser.add_argument("--random_state", type=int, default=42, help="Random state for reproducibility")
+    parser.add_argument(
+        "--cv_folds",
+        type=int,
+        default=None,
+        help="Also evaluate the pipeline with k-fold cross-validation, folds fitted in parallel (e.g. 5)",
+    )
+    parser.add_argument(
+        "--slim_artifact",
+        action="store_true",
+        help="Save a slim model artifact (pre-processor, estimator and metadata only) to out_file",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=None,
+        help="Also compute 95%% bootstrap confidence intervals of the metrics with this many replicates (e.g. 1000)",
+    )
+    add_instrumentation_arguments(parser=parser)
 
     args = parser.parse_args()
 
+    from loguru import logger
+
+    from src.ml_pipeline_handler.io.saver import save_artifact, save_model
+    from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+    from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+    from src.ml_pipeline_handler.telemetry.span import shutdown_instrumentation, span
+
+    logger.info("[START] CLI")
+    setup_instrumentation(args=args, out_file=args.out_file)
+
     logger.info(
         f"Starting Main function with: [data_path]: {args.data_path}, [features]: {args.features}, [target_column]: "
         f"{args.target_column}, [scale_standard]: {args.scale_standard}, [scale_robust]: {args.scale_robust}, "
         f"[scale_minmax]: {args.scale_minmax}, [algorithm]: {args.algorithm}, [out_file]: {args.out_file}, "
-        f"[random_state]: {args.random_state}"
+        f"[random_state]: {args.random_state}, [compact_dtypes]: {args.compact_dtypes}, [csv_engine]: "
+        f"{args.csv_engine}, [cache_dir]: {args.cache_dir}, "
+        f"[chunk_size]: {args.chunk_size}, [cache_stages]: {args.cache_stages}, [stage_cache_dir]: "
+        f"{args.stage_cache_dir}, [cv_folds]: {args.cv_folds}, [slim_artifact]: {args.slim_artifact}, [bootstrap]: "
+        f"{args.bootstrap}, [n_jobs]: {args.n_jobs}, [backend]: {args.backend}, [blas_threads]: {args.blas_threads}, "
+        f"[sample]: {args.sample}, [sample_method]: {args.sample_method}"
     )
 
-    pipeline_config = PipelineConfig(
-        data_path=args.data_path,
-        features=args.features,
-        target_column=args.target_column,
-        algorithm=args.algorithm,
-        out_file=args.out_file,
-        random_state=args.random_state,
-        scale_standard=args.scale_standard,
-        scale_robust=args.scale_robust,
-        scale_minmax=args.scale_minmax,
-    )
+    try:
+        pipeline_config = PipelineConfig(
+            data_path=args.data_path,
+            features=args.features,
+            target_column=args.target_column,
+            algorithm=args.algorithm,
+            out_file=args.out_file,
+            random_state=args.random_state,
+            scale_standard=args.scale_standard,
+            scale_robust=args.scale_robust,
+            scale_minmax=args.scale_minmax,
+            compact_dtypes=args.compact_dtypes,
+            csv_engine=args.csv_engine,
+            cache_dir=args.cache_dir,
+            chunk_size=args.chunk_size,
+            cache_stages=args.cache_stages,
+            stage_cache_dir=args.stage_cache_dir,
+            n_jobs=args.n_jobs,
+            backend=args.backend,
+            blas_threads=args.blas_threads,
+            sample=args.sample,
+            sample_method=args.sample_method,
+        )
+
+        pipeline = PipelineFactory.build_pipeline(config=pipeline_config)
+        prediction, probability = pipeline.predict()
 
-    pipeline = PipelineFactory.build_pipeline(config=pipeline_config)
-    prediction, probability = pipeline.predict()
+        with span("metrics", rows=len(prediction)):
+            metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+        logger.info(f"Metrics: {metrics}")
 
-    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
-    logger.info(f"Metrics: {metrics}")
+        if args.bootstrap:
+            log_confidence_intervals(args=args, pipeline=pipeline, prediction=prediction, probability=probability)
 
-    save_model(model=pipeline, file_name="model.pkl")
+        if args.cv_folds:
+            cv_metrics = pipeline.cross_validate(n_folds=args.cv_folds)
+            logger.info(f"Cross-validation metrics: {cv_metrics}")
 
+        if args.slim_artifact:
+            save_artifact(model=pipeline, file_name=args.out_file)
+        else:
+            save_model(model=pipeline, file_name="model.pkl")
+    finally:
+        shutdown_instrumentation()
     logger.info("[END] CLI")
 
 
@@ -12,3 +12,7 @@ class AlgorithmType(str, Enum):
     RANDOM_FOREST = "random_forest"
     DECISION_TREE_REGRESSOR = "decision_tree_regressor"
     RANDOM_FOREST_REGRESSOR = "random_forest_regressor"
+    SGD_REGRESSOR = "sgd_regressor"
+    SGD_CLASSIFIER = "sgd_classifier"
+    HIST_GRADIENT_BOOSTING_REGRESSOR = "hist_gradient_boosting_regressor"
+    HIST_GRADIENT_BOOSTING_CLASSIFIER = "hist_gradient_boosting_classifier"
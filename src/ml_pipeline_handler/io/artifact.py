@@ -0,0 +1,257 @@
+"""Model Artifact Module.
+
+This module defines the slim model artifact format. An artifact holds only what is needed to score new data: the
+fitted pre-processor, the fitted estimator, the feature list and the pipeline config metadata, never the training or
+testing data.
+
+File layout:
+    MAGIC (8 bytes) | header length (uint64, little endian) | JSON header | pickle payload | buffers
+
+The pickle payload uses protocol 5, large numpy arrays (e.g. the node arrays of forest models) are written out-of-band
+as raw buffers aligned on BUFFER_ALIGNMENT bytes, so that loading them does not copy them through the pickle stream.
+"""
+
+import json
+import mmap
+import pickle
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from numpy import ndarray
+from pandas import DataFrame
+
+MAGIC = b"MLPHART\x00"
+FORMAT_VERSION = 1
+BUFFER_ALIGNMENT = 64
+OUT_OF_BAND_MIN_BYTES = 4096
+HEADER_LENGTH = struct.Struct("<Q")
+
+
+@dataclass
+class ModelArtifact:
+    """Model Artifact Data Class."""
+
+    algorithm: str
+    features: list[str]
+    target_column: str
+    model: Any
+    pre_processor: Optional[Any] = None
+    config: dict[str, Any] = field(default_factory=dict)
+    version: int = FORMAT_VERSION
+
+    def predict_batch(self, x: DataFrame) -> ndarray:
+        """Predict the target values of a batch of new data.
+
+        Args:
+            x: DataFrame containing at least the features of the model.
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+        return predict_features(model=self.model, pre_processor=self.pre_processor, features=self.features, x=x)
+
+    def score_batch(self, x: DataFrame) -> tuple[ndarray, Optional[ndarray]]:
+        """Predict the target values and, for classifiers, the class probabilities of a batch of new data.
+
+        Args:
+            x: DataFrame containing at least the features of the model.
+
+        Returns:
+            ndarray of the prediction results, and Optional[ndarray] of the predicted probabilities.
+
+        """
+        x_to_use = transform_features(pre_processor=self.pre_processor, features=self.features, x=x)
+        probability = self.model.predict_proba(X=x_to_use) if hasattr(self.model, "predict_proba") else None
+        return self.model.predict(X=x_to_use), probability
+
+    def predict_stream(self, frames: Iterable[DataFrame]) -> Iterator[ndarray]:
+        """Predict the target values of a stream of batches of new data.
+
+        Args:
+            frames: Iterable of DataFrames containing at least the features of the model.
+
+        Returns:
+            Iterator of ndarray, of the prediction results of every batch.
+
+        """
+        for x in frames:
+            yield self.predict_batch(x=x)
+
+
+def transform_features(pre_processor: Optional[Any], features: list[str], x: DataFrame) -> ndarray | DataFrame:  # noqa: ANN401
+    """Select the features of a batch and apply the fitted pre-processor, the input of the fitted model.
+
+    Args:
+        pre_processor: The fitted pre-processor, None when the model was trained on the raw features.
+        features: The features the model was trained on.
+        x: DataFrame containing at least the features of the model.
+
+    Returns:
+        The pre-processed features, or the selected features as is without a pre-processor.
+
+    """
+    x = x[features]
+    return x if pre_processor is None else pre_processor.transform(x)
+
+
+def predict_features(model: Any, pre_processor: Optional[Any], features: list[str], x: DataFrame) -> ndarray:  # noqa: ANN401
+    """Select the features of a batch, apply the fitted pre-processor and predict with the fitted model.
+
+    Args:
+        model: The fitted estimator.
+        pre_processor: The fitted pre-processor, None when the model was trained on the raw features.
+        features: The features the model was trained on.
+        x: DataFrame containing at least the features of the model.
+
+    Returns:
+        ndarray, of the prediction results.
+
+    """
+    return model.predict(X=transform_features(pre_processor=pre_processor, features=features, x=x))
+
+
+def _padding(offset: int) -> int:
+    """Compute the number of bytes needed to align an offset on BUFFER_ALIGNMENT.
+
+    Args:
+        offset: The current offset in the file.
+
+    Returns:
+        The number of padding bytes.
+
+    """
+    return -offset % BUFFER_ALIGNMENT
+
+
+def write_artifact(artifact: ModelArtifact, f: BinaryIO) -> None:
+    """Write a model artifact to a binary file.
+
+    Args:
+        artifact: The artifact to write.
+        f: The binary file, opened for writing.
+
+    Returns:
+        None
+
+    """
+    buffers: list[pickle.PickleBuffer] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        # A false return value moves the buffer out-of-band, small buffers stay in the pickle stream.
+        if buffer.raw().nbytes < OUT_OF_BAND_MIN_BYTES:
+            return True
+        buffers.append(buffer)
+        return False
+
+    payload = pickle.dumps((artifact.pre_processor, artifact.model), protocol=5, buffer_callback=buffer_callback)
+
+    header = {
+        "version": artifact.version,
+        "algorithm": artifact.algorithm,
+        "features": artifact.features,
+        "target_column": artifact.target_column,
+        "config": artifact.config,
+        "payload_length": len(payload),
+        "buffer_lengths": [buffer.raw().nbytes for buffer in buffers],
+    }
+    header_bytes = json.dumps(header).encode()
+
+    f.write(MAGIC)
+    f.write(HEADER_LENGTH.pack(len(header_bytes)))
+    f.write(header_bytes)
+    f.write(payload)
+    offset = len(MAGIC) + HEADER_LENGTH.size + len(header_bytes) + len(payload)
+    for buffer in buffers:
+        f.write(b"\x00" * _padding(offset))
+        offset += _padding(offset)
+        f.write(buffer.raw())
+        offset += buffer.raw().nbytes
+
+
+def read_header(f: BinaryIO) -> dict[str, Any]:
+    """Read and validate the header of a model artifact.
+
+    Args:
+        f: The binary file, opened for reading and positioned at its start.
+
+    Returns:
+        The JSON header, with the offset of the pickle payload added as 'payload_offset'.
+
+    Raises:
+        ValueError: If the file is not a model artifact or was written by a newer format version.
+
+    """
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"File '{f.name}' is not a model artifact.")
+
+    (header_length,) = HEADER_LENGTH.unpack(f.read(HEADER_LENGTH.size))
+    header = json.loads(f.read(header_length))
+    if header["version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"Model artifact version {header['version']} is newer than the supported version {FORMAT_VERSION}."
+        )
+
+    header["payload_offset"] = len(MAGIC) + HEADER_LENGTH.size + header_length
+    return header
+
+
+def buffer_offsets(header: dict[str, Any]) -> list[int]:
+    """Compute the file offsets of the out-of-band buffers of a model artifact.
+
+    Args:
+        header: The header returned by read_header.
+
+    Returns:
+        The offset of every buffer in the file.
+
+    """
+    offsets = []
+    offset = header["payload_offset"] + header["payload_length"]
+    for length in header["buffer_lengths"]:
+        offset += _padding(offset)
+        offsets.append(offset)
+        offset += length
+    return offsets
+
+
+def read_artifact(file_path: Path, *, mmap_buffers: bool = False) -> ModelArtifact:
+    """Read a model artifact, the out-of-band buffers are used in place without going through the pickle stream.
+
+    Args:
+        file_path: The path of the artifact.
+        mmap_buffers: Whether to back the out-of-band buffers with a read-only memory map of the file instead of
+            reading it into memory. Processes mapping the same artifact then share one copy of these arrays through
+            the page cache.
+
+    Returns:
+        The loaded ModelArtifact.
+
+    """
+    with file_path.open(mode="rb") as f:
+        header = read_header(f=f)
+        if mmap_buffers:
+            data = memoryview(mmap.mmap(fileno=f.fileno(), length=0, access=mmap.ACCESS_READ))
+        else:
+            f.seek(0)
+            data = memoryview(bytearray(f.read()))
+
+    payload = data[header["payload_offset"] : header["payload_offset"] + header["payload_length"]]
+    buffers = [
+        data[offset : offset + length]
+        for offset, length in zip(buffer_offsets(header=header), header["buffer_lengths"], strict=True)
+    ]
+    pre_processor, model = pickle.loads(payload, buffers=buffers)  # noqa: S301
+
+    return ModelArtifact(
+        algorithm=header["algorithm"],
+        features=header["features"],
+        target_column=header["target_column"],
+        model=model,
+        pre_processor=pre_processor,
+        config=header["config"],
+        version=header["version"],
+    )
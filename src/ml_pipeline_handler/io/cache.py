@@ -0,0 +1,227 @@
+"""Dataset Cache Module.
+
+This module converts CSV files into a columnar on-disk cache of one .npy file per column, so that repeated runs over
+the same file load memory-mapped columns instead of re-parsing the CSV. Columns are added to a cache entry lazily, the
+first time they are requested, and entries are keyed by the path, modification time, size and content hash of the CSV.
+A column parsed with an explicit dtype is cached separately from the same column parsed with the inferred dtype, since
+the parsed values differ (e.g. the leading zeros of a string column of digits).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from loguru import logger
+from pandas import Categorical, DataFrame, api, read_csv
+
+META_FILE = "meta.json"
+HASH_BLOCK_SIZE = 1 << 20
+
+_content_hashes: dict[tuple[str, int, int], str] = {}
+
+
+def _content_hash(path: Path, mtime_ns: int, size: int) -> str:
+    """Hash the content of a file, memoized per process on its path, modification time and size.
+
+    Args:
+        path: The resolved path of the file.
+        mtime_ns: The modification time of the file in nanoseconds.
+        size: The size of the file in bytes.
+
+    Returns:
+        The hexadecimal blake2b digest of the file content.
+
+    """
+    key = (str(path), mtime_ns, size)
+    if key not in _content_hashes:
+        digest = hashlib.blake2b(digest_size=16)
+        with path.open(mode="rb") as f:
+            while block := f.read(HASH_BLOCK_SIZE):
+                digest.update(block)
+        _content_hashes[key] = digest.hexdigest()
+    return _content_hashes[key]
+
+
+def fingerprint(data_path: str) -> str:
+    """Compute the cache key of a CSV file from its path, modification time, size and content hash.
+
+    Args:
+        data_path: The path of the CSV file.
+
+    Returns:
+        The cache key, prefixed by a hash of the path so that stale entries of the same file can be found.
+
+    """
+    path = Path(data_path).resolve()
+    stat = path.stat()
+    path_hash = hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+    content_hash = _content_hash(path=path, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    file_hash = hashlib.blake2b(f"{stat.st_mtime_ns}:{stat.st_size}:{content_hash}".encode(), digest_size=8)
+    return f"{path_hash}-{file_hash.hexdigest()}"
+
+
+def column_key(column: str, dtype: Optional[str]) -> str:
+    """Compute the metadata key of a column parsed with a dtype.
+
+    Args:
+        column: The name of the column.
+        dtype: Optional explicit dtype the column is parsed with, None for the inferred dtype.
+
+    Returns:
+        The key of the column in the metadata of a cache entry.
+
+    """
+    return column if dtype is None else f"{column}:{dtype}"
+
+
+class DatasetCache:
+    """Columnar on-disk Dataset Cache."""
+
+    def __init__(self, cache_dir: str, max_entries: int = 8) -> None:
+        """Initialize the cache in the given directory.
+
+        Args:
+            cache_dir: Directory holding the cache entries, created when missing.
+            max_entries: Maximum number of cached files kept, least recently used entries are evicted first.
+
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+    def load(
+        self,
+        data_path: str,
+        columns: Optional[list[str]] = None,
+        engine: str = "c",
+        dtypes: Optional[dict[str, str]] = None,
+    ) -> DataFrame:
+        """Load columns of a CSV file through the cache, parsing only the columns that are not cached yet.
+
+        Args:
+            data_path: The path of the CSV file.
+            columns: Optional list of columns to load, defaults to all columns of the file.
+            engine: The read_csv parser engine used on a cache miss.
+            dtypes: Optional mapping of column name to the dtype the column is parsed with, the other columns are
+                parsed with the inferred dtype.
+
+        Returns:
+            A DataFrame of the requested columns, backed by read-only memory maps where the dtype allows it.
+
+        """
+        entry = self.cache_dir / fingerprint(data_path=data_path)
+        meta = self._read_meta(entry=entry)
+        requested = columns if columns is not None else list(read_csv(filepath_or_buffer=data_path, nrows=0).columns)
+
+        dtypes = {column: dtype for column, dtype in (dtypes or {}).items() if column in requested}
+        keys = {column: column_key(column=column, dtype=dtypes.get(column)) for column in requested}
+        missing = [column for column in requested if keys[column] not in meta["columns"]]
+        if missing:
+            logger.info(f"Dataset cache miss for {data_path}: parsing {len(missing)} column(s)")
+            data = read_csv(
+                filepath_or_buffer=data_path,
+                usecols=missing,
+                dtype={column: dtype for column, dtype in dtypes.items() if column in missing},
+                engine=engine,
+            )
+            self._store(entry=entry, meta=meta, data=data.rename(columns=keys))
+        else:
+            logger.info(f"Dataset cache hit for {data_path}")
+            os.utime(entry)
+
+        self._evict(keep=entry)
+        return DataFrame(
+            {column: self._load_column(entry=entry, spec=meta["columns"][keys[column]]) for column in requested},
+            copy=False,
+        )
+
+    @staticmethod
+    def _read_meta(entry: Path) -> dict[str, Any]:
+        """Read the metadata of a cache entry.
+
+        Args:
+            entry: The directory of the cache entry.
+
+        Returns:
+            The metadata, empty when the entry does not exist yet.
+
+        """
+        meta_path = entry / META_FILE
+        if not meta_path.exists():
+            return {"columns": {}}
+        with meta_path.open() as f:
+            return json.load(f)
+
+    @staticmethod
+    def _store(entry: Path, meta: dict[str, Any], data: DataFrame) -> None:
+        """Write the columns of a DataFrame to a cache entry and update its metadata atomically.
+
+        Object, string and categorical columns are stored as categorical codes with their categories in the metadata,
+        so that every column file can be memory-mapped.
+
+        Args:
+            entry: The directory of the cache entry.
+            meta: The current metadata of the entry, updated in place.
+            data: The parsed columns to store.
+
+        Returns:
+            None
+
+        """
+        entry.mkdir(parents=True, exist_ok=True)
+        for column in data.columns:
+            file_name = f"column_{len(meta['columns'])}.npy"
+            values = data[column]
+            categories = None
+            if not isinstance(values.dtype, np.dtype) or api.types.is_object_dtype(values):
+                categorical = Categorical(values)
+                categories = categorical.categories.tolist()
+                values = categorical.codes
+            np.save(file=entry / file_name, arr=np.asarray(values), allow_pickle=False)
+            meta["columns"][column] = {"file": file_name, "categories": categories}
+
+        tmp_path = entry / f"{META_FILE}.{os.getpid()}.tmp"
+        with tmp_path.open(mode="w") as f:
+            json.dump(meta, f)
+        tmp_path.replace(entry / META_FILE)
+
+    @staticmethod
+    def _load_column(entry: Path, spec: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Load a cached column as a read-only memory map.
+
+        Args:
+            entry: The directory of the cache entry.
+            spec: The metadata of the column.
+
+        Returns:
+            The column values, a memory-mapped ndarray or a Categorical rebuilt from memory-mapped codes.
+
+        """
+        values = np.load(file=entry / spec["file"], mmap_mode="r", allow_pickle=False)
+        if spec["categories"] is not None:
+            return Categorical.from_codes(codes=values, categories=spec["categories"])
+        return values
+
+    def _evict(self, keep: Path) -> None:
+        """Remove stale entries of the same file and the least recently used entries above max_entries.
+
+        Args:
+            keep: The entry in use, never evicted.
+
+        Returns:
+            None
+
+        """
+        path_hash = keep.name.split("-")[0]
+        entries = sorted(
+            (entry for entry in self.cache_dir.iterdir() if entry.is_dir() and entry != keep),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        for index, entry in enumerate(entries):
+            if entry.name.startswith(f"{path_hash}-") or index + 1 >= self.max_entries:
+                logger.info(f"Evicting dataset cache entry {entry.name}")
+                shutil.rmtree(entry, ignore_errors=True)
@@ -1,24 +1,161 @@
 """Data Loader Module."""
 
-from pandas import DataFrame, Series, read_csv
+import time
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional
 
+from loguru import logger
+from pandas import DataFrame, Series, api, read_csv, to_numeric
 
-def load_data(data_path: str, target_column: str) -> tuple[DataFrame, Series]:
+from src.ml_pipeline_handler.io.artifact import ModelArtifact, read_artifact
+from src.ml_pipeline_handler.io.cache import DatasetCache
+from src.ml_pipeline_handler.telemetry.span import span
+
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def resolve_engine(engine: str) -> str:
+    """Fall back to the default C parser when the requested engine is not installed.
+
+    Args:
+        engine: The requested read_csv engine ("c", "python" or "pyarrow").
+
+    Returns:
+        The engine that will actually be used.
+
+    """
+    if engine == "pyarrow" and find_spec("pyarrow") is None:
+        logger.warning("Engine 'pyarrow' requested but pyarrow is not installed, falling back to 'c'.")
+        return "c"
+    return engine
+
+
+def validate_columns(data_path: str, target_column: Optional[str], features: Optional[list[str]]) -> list[str]:
+    """Check the CSV header for the requested columns without parsing the body.
+
+    Args:
+        data_path: The path of the data to load.
+        target_column: The target column of the dataset, None when the data has no target (e.g. for scoring).
+        features: Optional list of feature columns that will be projected.
+
+    Returns:
+        The list of all columns present in the CSV header.
+
+    """
+    columns = read_csv(filepath_or_buffer=data_path, nrows=0).columns
+
+    if target_column is not None and target_column not in columns:
+        raise ValueError(f"Target column '{target_column}' not found in the dataset.")
+
+    missing = [feature for feature in features or [] if feature not in columns]
+    if missing:
+        raise ValueError(f"Feature columns {missing} not found in the dataset.")
+
+    return list(columns)
+
+
+def compact_dtypes(data: DataFrame, columns: Optional[list[str]] = None) -> DataFrame:
+    """Downcast the columns of a DataFrame in place to the smallest dtype that holds their values.
+
+    Floats become float32, integers the smallest signed/unsigned integer type and low cardinality strings become
+    categoricals.
+
+    Args:
+        data: The DataFrame to compact.
+        columns: Optional subset of columns to compact, defaults to all columns.
+
+    Returns:
+        The compacted DataFrame.
+
+    """
+    for column in data.columns if columns is None else columns:
+        series = data[column]
+        if api.types.is_float_dtype(series):
+            data[column] = series.astype("float32")
+        elif api.types.is_integer_dtype(series):
+            data[column] = to_numeric(series, downcast="unsigned" if series.min() >= 0 else "integer")
+        elif api.types.is_object_dtype(series) and series.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(series):
+            data[column] = series.astype("category")
+    return data
+
+
+def load_data(
+    data_path: str,
+    target_column: str,
+    *,
+    features: Optional[list[str]] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    compact: bool = False,
+    engine: str = "c",
+    cache_dir: Optional[str] = None,
+) -> tuple[DataFrame, Series]:
     """Load the data as a Dataframe and split it into features and target column.
 
     Args:
         data_path: The path of the data to load
         target_column: The target column of the dataset.
+        features: Optional list of feature columns, when given only these and the target column are parsed.
+        dtypes: Optional mapping of column name to dtype (e.g. 'float32', 'int8', 'category').
+        compact: Whether to downcast the columns that have no explicit dtype after parsing.
+        engine: The read_csv parser engine, 'pyarrow' falls back to 'c' when pyarrow is not installed.
+        cache_dir: Optional directory of a columnar dataset cache, when given the columns are loaded memory-mapped
+            from the cache and only parsed from the CSV on a cache miss.
 
     Returns:
         A tuple of a DataFrame and a Series representing the features and target column.
 
     """
-    data = read_csv(filepath_or_buffer=data_path)
+    all_columns = validate_columns(data_path=data_path, target_column=target_column, features=features)
+    usecols = None if features is None else list(dict.fromkeys([*features, target_column]))
 
-    if target_column not in data.columns:
-        raise ValueError(f"Target column '{target_column}' not found in the dataset.")
+    start = time.perf_counter()
+    if cache_dir is None:
+        data = read_csv(filepath_or_buffer=data_path, usecols=usecols, dtype=dtypes, engine=resolve_engine(engine))
+    else:
+        data = DatasetCache(cache_dir=cache_dir).load(
+            data_path=data_path, columns=usecols, engine=resolve_engine(engine), dtypes=dtypes
+        )
+        if dtypes:
+            # Cached string columns come back as categoricals.
+            data = data.astype(dtype={column: dtype for column, dtype in dtypes.items() if column in data.columns})
+    parse_time = time.perf_counter() - start
 
-    x = data.drop(columns=[target_column])
+    logger.info(
+        f"Loaded {data_path} in {parse_time:.3f}s: {data.shape[0]} rows, {data.shape[1]} of {len(all_columns)} columns"
+    )
+
+    if compact:
+        parsed_bytes = int(data.memory_usage(deep=True).sum())
+        compact_dtypes(data=data, columns=[column for column in data.columns if column not in (dtypes or {})])
+        compacted_bytes = int(data.memory_usage(deep=True).sum())
+        logger.info(
+            f"Compacted dtypes of {data_path}: {parsed_bytes - compacted_bytes} bytes saved, "
+            f"{compacted_bytes} bytes in memory"
+        )
+
+    # Split without DataFrame.drop, which would copy every feature column (and read memory-mapped columns into RAM).
+    x = DataFrame({column: data[column] for column in data.columns if column != target_column}, copy=False)
     y = data[target_column]
     return x, y
+
+
+def load_model(file_name: str, *, mmap: bool = False) -> ModelArtifact:
+    """Load a slim model artifact written by save_artifact from the saver module.
+
+    Args:
+        file_name: The path of the artifact.
+        mmap: Whether to back the large arrays of the model with read-only memory maps of the artifact, so that worker
+            processes serving the same artifact share one physical copy through the page cache. Arrays that the
+            estimator copies into its own memory on unpickling (e.g. the node arrays of scikit-learn trees) are not
+            shared.
+
+    Returns:
+        The ModelArtifact, holding the fitted pre-processor, the fitted estimator and the feature list.
+
+    """
+    start = time.perf_counter()
+    with span("load_model", mmap=mmap):
+        artifact = read_artifact(file_path=Path(file_name), mmap_buffers=mmap)
+    logger.info(f"Loaded model artifact {file_name} ({artifact.algorithm}) in {time.perf_counter() - start:.3f}s")
+    return artifact
@@ -0,0 +1,416 @@
+"""Row Sampling Module.
+
+This module draws a sample of the rows of a CSV file for quick exploratory fits, reading the file in chunks so that
+the full dataset is never materialized. Every row gets a uniform key from a hash of its index and the random state, so
+the sample only depends on the file, the sampling settings and the random state, not on the chunk size:
+- uniform: with a fraction, every row is kept independently when its key is below the fraction (Bernoulli sampling,
+  the sample size is approximate). With a row cap, the rows with the smallest keys are kept, as in reservoir sampling.
+- reservoir: exactly the requested number of rows, the ones with the smallest keys, kept in one pass with bounded
+  memory. A fraction is turned into a number of rows by a first pass counting the rows of the target column only.
+- stratified: every class of the target keeps its share of the rows (at least one row for a fraction, every class in
+  proportion to its size for a row cap), from a first pass counting the classes of the target column only.
+
+Samples are memoized in the process and, when a directory is given, written to it as pickle files reused by later
+runs.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from loguru import logger
+from numpy import ndarray
+from pandas import DataFrame, Series, concat, read_csv
+
+from src.ml_pipeline_handler.io.cache import fingerprint
+from src.ml_pipeline_handler.io.loader import compact_dtypes, resolve_engine, validate_columns
+from src.ml_pipeline_handler.io.stream import row_uniform, stream_data
+from src.ml_pipeline_handler.pipeline.base_config import SAMPLING_METHODS
+
+# Stratified sampling keeps one reservoir per class, targets with more distinct values than this are rejected.
+MAX_STRATA = 100
+MAX_CACHED_SAMPLES = 4
+
+Stratum = tuple[DataFrame, Series, ndarray]
+
+_samples: OrderedDict[str, tuple[DataFrame, Series]] = OrderedDict()
+
+
+def parse_sample_size(size: float) -> tuple[Optional[float], Optional[int]]:
+    """Read a sample size as a fraction of the rows or as a row cap.
+
+    Args:
+        size: A fraction of the rows in (0, 1), or a number of rows from 1.
+
+    Returns:
+        The fraction and None, or None and the number of rows.
+
+    Raises:
+        ValueError: If the size is not positive, or is a number of rows that is not a whole number.
+
+    """
+    if size <= 0:
+        raise ValueError(f"Sample size must be a fraction in (0, 1) or a number of rows, got {size}.")
+    if size < 1:
+        return size, None
+    if not float(size).is_integer():
+        raise ValueError(f"Sample size {size} is neither a fraction in (0, 1) nor a whole number of rows.")
+    return None, int(size)
+
+
+def count_classes(
+    data_path: str, target_column: str, chunk_size: int, dtypes: Optional[dict[str, str]] = None, engine: str = "c"
+) -> Series:
+    """Count the rows of every value of the target column, parsing that column only.
+
+    Args:
+        data_path: The path of the CSV file.
+        target_column: The target column of the dataset.
+        chunk_size: The number of rows per chunk.
+        dtypes: Optional mapping of column name to dtype.
+        engine: The read_csv parser engine ("c" or "python").
+
+    Returns:
+        Series of the number of rows of every target value, missing targets left out.
+
+    """
+    counts = Series(dtype="int64")
+    reader = read_csv(
+        filepath_or_buffer=data_path,
+        usecols=[target_column],
+        dtype={target_column: dtypes[target_column]} if dtypes and target_column in dtypes else None,
+        chunksize=chunk_size,
+        engine=engine,
+    )
+    with reader:
+        for chunk in reader:
+            counts = counts.add(chunk[target_column].value_counts(sort=False), fill_value=0)
+    return counts.astype("int64")
+
+
+def allocate_rows(counts: Series, fraction: Optional[float], rows: Optional[int]) -> dict[Any, int]:
+    """Split the rows of a stratified sample between the classes of the target.
+
+    Args:
+        counts: Series of the number of rows of every class.
+        fraction: The fraction of the rows of every class to keep, at least one row per class.
+        rows: The total number of rows to keep, split in proportion to the class sizes (largest remainders first).
+
+    Returns:
+        Mapping of every class to its number of sampled rows.
+
+    """
+    if fraction is not None:
+        sizes = np.maximum(np.round(counts.to_numpy() * fraction), 1).astype(np.int64)
+        return dict(zip(counts.index, np.minimum(sizes, counts.to_numpy()).tolist(), strict=True))
+
+    shares = counts.to_numpy() * min(rows or 0, int(counts.sum())) / max(int(counts.sum()), 1)
+    sizes = np.floor(shares).astype(np.int64)
+    remainders = np.argsort(sizes - shares, kind="stable")[: round(float(shares.sum())) - int(sizes.sum())]
+    sizes[remainders] += 1
+    return dict(zip(counts.index, sizes.tolist(), strict=True))
+
+
+def stratum_capacities(
+    data_path: str,
+    target_column: str,
+    *,
+    method: str,
+    size: float,
+    chunk_size: int,
+    dtypes: Optional[dict[str, str]],
+    engine: str,
+) -> Optional[dict[Any, int]]:
+    """Compute the number of rows every stratum of a sample keeps, counting the target column when needed.
+
+    Args:
+        data_path: The path of the CSV file.
+        target_column: The target column of the dataset.
+        method: The sampling method, one of SAMPLING_METHODS.
+        size: A fraction of the rows in (0, 1), or a number of rows from 1.
+        chunk_size: The number of rows per chunk.
+        dtypes: Optional mapping of column name to dtype.
+        engine: The read_csv parser engine ("c" or "python").
+
+    Returns:
+        Mapping of every class of the target (stratified) or of None (a single stratum) to its number of rows, None
+        for Bernoulli sampling.
+
+    Raises:
+        ValueError: If a stratified target has more than MAX_STRATA values.
+
+    """
+    fraction, rows = parse_sample_size(size=size)
+    if method == "uniform" and fraction is not None:
+        return None
+    if method != "stratified" and rows is not None:
+        return {None: rows}
+
+    counts = count_classes(
+        data_path=data_path, target_column=target_column, chunk_size=chunk_size, dtypes=dtypes, engine=engine
+    )
+    if method != "stratified":
+        return {None: round(int(counts.sum()) * (fraction or 0))}
+    if len(counts) > MAX_STRATA:
+        raise ValueError(
+            f"Stratified sampling needs a categorical target, '{target_column}' has {len(counts)} distinct values "
+            f"(more than {MAX_STRATA})."
+        )
+    return allocate_rows(counts=counts, fraction=fraction, rows=rows)
+
+
+def keep_smallest(kept: Optional[Stratum], chunk: Stratum, capacity: int) -> Stratum:
+    """Add the rows of a chunk to a stratum and keep the rows with the smallest keys.
+
+    Args:
+        kept: The features, target and keys of the rows kept so far, None for the first rows of the stratum.
+        chunk: The features, target and keys of the rows of the chunk.
+        capacity: The number of rows to keep.
+
+    Returns:
+        The stratum reduced to its capacity rows with the smallest keys.
+
+    """
+    if kept is not None:
+        chunk = (concat([kept[0], chunk[0]]), concat([kept[1], chunk[1]]), np.concatenate([kept[2], chunk[2]]))
+    x, y, keys = chunk
+    if len(keys) <= capacity:
+        return chunk
+    keep = np.argpartition(keys, capacity - 1)[:capacity]
+    return x.iloc[keep], y.iloc[keep], keys[keep]
+
+
+def sample_data(
+    data_path: str,
+    target_column: str,
+    features: list[str],
+    *,
+    size: float,
+    method: str = "uniform",
+    chunk_size: int = 100_000,
+    random_state: int = 0,
+    dtypes: Optional[dict[str, str]] = None,
+    engine: str = "c",
+) -> tuple[DataFrame, Series]:
+    """Sample the rows of a CSV file, reading it in chunks.
+
+    Args:
+        data_path: The path of the CSV file.
+        target_column: The target column of the dataset.
+        features: The feature columns to parse.
+        size: A fraction of the rows in (0, 1), or a number of rows from 1.
+        method: The sampling method, one of SAMPLING_METHODS.
+        chunk_size: The number of rows per chunk.
+        random_state: int, seed of the sample.
+        dtypes: Optional mapping of column name to dtype (e.g. 'float32', 'int8', 'category').
+        engine: The read_csv parser engine, 'pyarrow' falls back to 'c' as it does not support chunks.
+
+    Returns:
+        A tuple of a DataFrame and a Series of the features and target of the sampled rows, in file order and indexed
+        by their absolute row positions in the file.
+
+    Raises:
+        ValueError: If the method is unknown or a stratified target has more than MAX_STRATA values.
+
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Sampling method '{method}' is not one of {SAMPLING_METHODS}.")
+    validate_columns(data_path=data_path, target_column=target_column, features=features)
+    engine = "c" if engine == "pyarrow" else resolve_engine(engine)
+    capacities = stratum_capacities(
+        data_path=data_path,
+        target_column=target_column,
+        method=method,
+        size=size,
+        chunk_size=chunk_size,
+        dtypes=dtypes,
+        engine=engine,
+    )
+
+    strata: dict[Any, Stratum] = {}
+    bernoulli: list[tuple[DataFrame, Series]] = []
+    for x, y in stream_data(
+        data_path=data_path,
+        target_column=target_column,
+        features=features,
+        chunk_size=chunk_size,
+        dtypes=dtypes,
+        engine=engine,
+    ):
+        # Offset from the seed of the train/test split, so that the sample does not select on the split.
+        keys = row_uniform(row_index=x.index.to_numpy(), random_state=random_state + 1)
+        if capacities is None:
+            mask = keys < size
+            bernoulli.append((x[mask], y[mask]))
+            continue
+
+        for label, capacity in capacities.items():
+            mask = np.ones(len(keys), dtype=bool) if label is None else (y == label).to_numpy()
+            kept = strata.get(label)
+            if kept is not None and len(kept[2]) == capacity:
+                # A full stratum only takes rows with a smaller key than its largest one.
+                mask &= keys < kept[2].max(initial=0.0)
+            if capacity > 0 and mask.any():
+                strata[label] = keep_smallest(kept=kept, chunk=(x[mask], y[mask], keys[mask]), capacity=capacity)
+
+    parts = bernoulli or [(x, y) for x, y, _ in strata.values()]
+    if not parts:
+        return DataFrame(columns=features), Series(name=target_column)
+    x = concat([x for x, _ in parts]).sort_index()
+    y = concat([y for _, y in parts]).sort_index()
+    if dtypes:
+        # Chunks parse categoricals with their own categories, which concat turns back into objects.
+        x = x.astype(dtype={column: dtype for column, dtype in dtypes.items() if column in x.columns})
+        y = y.astype(dtype=dtypes.get(target_column, y.dtype))
+    return x, y
+
+
+def sample_key(
+    data_path: str,
+    target_column: str,
+    features: list[str],
+    *,
+    size: float,
+    method: str,
+    random_state: int,
+    dtypes: Optional[dict[str, str]],
+    compact: bool,
+) -> str:
+    """Compute the cache key of a sample.
+
+    Args:
+        data_path: The path of the CSV file.
+        target_column: The target column of the dataset.
+        features: The feature columns of the sample.
+        size: The sample size.
+        method: The sampling method.
+        random_state: The seed of the sample.
+        dtypes: Optional mapping of column name to dtype.
+        compact: Whether the sample dtypes are compacted.
+
+    Returns:
+        The hexadecimal key, built from the data set fingerprint and every setting the sample depends on.
+
+    """
+    settings = {
+        "data_set": fingerprint(data_path=data_path),
+        "target_column": target_column,
+        "features": features,
+        "size": size,
+        "method": method,
+        "random_state": random_state,
+        "dtypes": dtypes,
+        "compact": compact,
+    }
+    return hashlib.blake2b(json.dumps(settings, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def load_sample(
+    data_path: str,
+    target_column: str,
+    features: list[str],
+    *,
+    size: float,
+    method: str = "uniform",
+    chunk_size: int = 100_000,
+    random_state: int = 0,
+    dtypes: Optional[dict[str, str]] = None,
+    compact: bool = False,
+    engine: str = "c",
+    cache_dir: Optional[str] = None,
+) -> tuple[DataFrame, Series]:
+    """Load a sample of the rows of a CSV file, from the sample cache or by sampling the file.
+
+    Args:
+        data_path: The path of the CSV file.
+        target_column: The target column of the dataset.
+        features: The feature columns to parse.
+        size: A fraction of the rows in (0, 1), or a number of rows from 1.
+        method: The sampling method, one of SAMPLING_METHODS.
+        chunk_size: The number of rows per chunk.
+        random_state: int, seed of the sample.
+        dtypes: Optional mapping of column name to dtype (e.g. 'float32', 'int8', 'category').
+        compact: Whether to downcast the columns that have no explicit dtype after sampling.
+        engine: The read_csv parser engine.
+        cache_dir: Optional directory to keep the samples in for later runs, as sample-<key>.pkl files.
+
+    Returns:
+        A tuple of a DataFrame and a Series of the features and target of the sampled rows.
+
+    """
+    key = sample_key(
+        data_path=data_path,
+        target_column=target_column,
+        features=features,
+        size=size,
+        method=method,
+        random_state=random_state,
+        dtypes=dtypes,
+        compact=compact,
+    )
+    if key in _samples:
+        logger.info(f"Sample cache hit in memory for {data_path}")
+        _samples.move_to_end(key)
+        return _samples[key]
+
+    file_path = Path(cache_dir) / f"sample-{key}.pkl" if cache_dir is not None else None
+    if file_path is not None and file_path.exists():
+        logger.info(f"Sample cache hit on disk for {data_path}")
+        os.utime(file_path)
+        with file_path.open(mode="rb") as f:
+            sample = pickle.load(f)  # noqa: S301
+    else:
+        start = time.perf_counter()
+        x, y = sample_data(
+            data_path=data_path,
+            target_column=target_column,
+            features=features,
+            size=size,
+            method=method,
+            chunk_size=chunk_size,
+            random_state=random_state,
+            dtypes=dtypes,
+            engine=engine,
+        )
+        if compact:
+            compact_dtypes(data=x, columns=[column for column in x.columns if column not in (dtypes or {})])
+            if target_column not in (dtypes or {}):
+                y = compact_dtypes(data=y.to_frame())[target_column]
+        sample = (x, y)
+        logger.info(f"Sampled {len(y)} rows of {data_path} ({method}, {size}) in {time.perf_counter() - start:.3f}s")
+        if file_path is not None:
+            write_sample(file_path=file_path, sample=sample)
+
+    _samples[key] = sample
+    while len(_samples) > MAX_CACHED_SAMPLES:
+        _samples.popitem(last=False)
+    return sample
+
+
+def write_sample(file_path: Path, sample: tuple[DataFrame, Series]) -> None:
+    """Write a sample to the cache directory atomically and evict the least recently used samples.
+
+    Args:
+        file_path: The path of the sample file.
+        sample: The features and target of the sample.
+
+    Returns:
+        None
+
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    with tmp_path.open(mode="wb") as f:
+        pickle.dump(obj=sample, file=f, protocol=5)
+    tmp_path.replace(file_path)
+
+    entries = sorted(file_path.parent.glob("sample-*.pkl"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for entry in entries[MAX_CACHED_SAMPLES:]:
+        logger.info(f"Evicting sample cache entry {entry.name}")
+        entry.unlink(missing_ok=True)
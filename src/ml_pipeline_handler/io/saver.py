@@ -1,9 +1,18 @@
 """Data Saver Module."""
 
 import pickle
+from collections.abc import Iterable
+from dataclasses import asdict
+from importlib import import_module
 from pathlib import Path
 
+from loguru import logger
+from pandas import DataFrame
+from sklearn.utils.validation import check_is_fitted
+
+from src.ml_pipeline_handler.io.artifact import ModelArtifact, write_artifact
 from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.telemetry.span import span
 
 
 def save_model(model: BasePipeline, file_name: str) -> None:
@@ -18,5 +27,74 @@ def save_model(model: BasePipeline, file_name: str) -> None:
 
     """
     file_path = Path(file_name)
-    with file_path.open(mode="wb") as f:
+    with span("save_model"), file_path.open(mode="wb") as f:
         pickle.dump(obj=model, file=f)
+
+
+def save_artifact(model: BasePipeline, file_name: str) -> None:
+    """Save a fitted pipeline as a slim model artifact, without its training and testing data.
+
+    The artifact holds the fitted pre-processor, the fitted estimator, the feature list and the config metadata, and
+    can be loaded with load_model from the loader module.
+
+    Args:
+        model: The fitted pipeline to be saved
+        file_name: The target file name, with optional directory
+
+    Returns:
+        None
+
+    """
+    check_is_fitted(estimator=model.model)
+
+    artifact = ModelArtifact(
+        algorithm=model.config.algorithm,
+        features=model.config.features,
+        target_column=model.config.target_column,
+        model=model.model,
+        pre_processor=model.pre_processor,
+        config=asdict(model.config),
+    )
+
+    file_path = Path(file_name)
+    with span("save_artifact"), file_path.open(mode="wb") as f:
+        write_artifact(artifact=artifact, f=f)
+
+
+def save_predictions(frames: Iterable[DataFrame], file_name: str) -> int:
+    """Write batches of predictions to a CSV or Parquet file as they are produced.
+
+    Args:
+        frames: Iterable of DataFrames of predictions, all with the same columns.
+        file_name: The target file name, with a .csv or .parquet extension (Parquet requires pyarrow).
+
+    Returns:
+        The number of rows written.
+
+    """
+    file_path = Path(file_name)
+    if file_path.suffix not in {".csv", ".parquet"}:
+        raise ValueError(f"Unsupported predictions file extension '{file_path.suffix}', use '.csv' or '.parquet'.")
+
+    rows = 0
+    if file_path.suffix == ".csv":
+        with file_path.open(mode="w", newline="") as f:
+            for frame in frames:
+                frame.to_csv(f, header=rows == 0, index=False)
+                rows += len(frame)
+    else:
+        pyarrow = import_module("pyarrow")
+        parquet = import_module("pyarrow.parquet")
+        writer = None
+        try:
+            for frame in frames:
+                table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+                writer = writer or parquet.ParquetWriter(file_path, table.schema)
+                writer.write_table(table)
+                rows += len(frame)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    logger.info(f"Saved {rows} predictions to {file_name}")
+    return rows
@@ -0,0 +1,185 @@
+"""Streaming Data Loader Module.
+
+This module reads a CSV file in fixed-size chunks and splits every chunk into train and test rows with a hash of the
+random state and the row index, so the split is deterministic, independent of the chunk size and never needs the
+full dataset in memory.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+import numpy as np
+from numpy import ndarray
+from pandas import DataFrame, Series, read_csv
+
+from src.ml_pipeline_handler.io.loader import resolve_engine, validate_columns
+
+SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+SPLITMIX_MUL_1 = np.uint64(0xBF58476D1CE4E5B9)
+SPLITMIX_MUL_2 = np.uint64(0x94D049BB133111EB)
+UINT64_MASK = (1 << 64) - 1
+
+
+def row_uniform(row_index: ndarray, random_state: int) -> ndarray:
+    """Draw a uniform number in [0, 1) per row by hashing its index with the random state (splitmix64).
+
+    Args:
+        row_index: ndarray of the absolute row positions in the file.
+        random_state: int, seed of the draw. Seeds are taken modulo 2**64, so negative seeds are valid.
+
+    Returns:
+        Float ndarray of the number of every row, the same for a row whatever the chunk it is read in.
+
+    """
+    with np.errstate(over="ignore"):
+        z = (
+            np.asarray(row_index, dtype=np.uint64)
+            + np.uint64(random_state & UINT64_MASK) * SPLITMIX_GAMMA
+            + SPLITMIX_GAMMA
+        )
+        z = (z ^ (z >> np.uint64(30))) * SPLITMIX_MUL_1
+        z = (z ^ (z >> np.uint64(27))) * SPLITMIX_MUL_2
+        z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+def is_test_row(row_index: ndarray, random_state: int, test_size: float) -> ndarray:
+    """Assign rows to the test split by hashing their index with the random state.
+
+    Args:
+        row_index: ndarray of the absolute row positions in the file.
+        random_state: int, seed of the split.
+        test_size: float of the test size [0.0 - 1.0]
+
+    Returns:
+        Boolean ndarray, True for the rows that belong to the test split.
+
+    """
+    return row_uniform(row_index=row_index, random_state=random_state) < test_size
+
+
+def stream_features(
+    data_path: str,
+    features: list[str],
+    chunk_size: int,
+    *,
+    dtypes: Optional[dict[str, str]] = None,
+    engine: str = "c",
+) -> Iterator[DataFrame]:
+    """Read the feature columns of a CSV file in chunks, for scoring data without a target column.
+
+    Args:
+        data_path: The path of the data to load.
+        features: The feature columns to parse.
+        chunk_size: The number of rows per chunk.
+        dtypes: Optional mapping of column name to dtype (e.g. 'float32', 'int8', 'category').
+        engine: The read_csv parser engine ("c" or "python", pyarrow does not support chunks).
+
+    Returns:
+        Iterator of DataFrames of the features of each chunk, indexed by the absolute row positions in the file.
+
+    """
+    validate_columns(data_path=data_path, target_column=None, features=features)
+    reader = read_csv(
+        filepath_or_buffer=data_path,
+        usecols=features,
+        dtype=dtypes,
+        chunksize=chunk_size,
+        engine="c" if engine == "pyarrow" else resolve_engine(engine),
+    )
+    with reader:
+        yield from reader
+
+
+def stream_data(
+    data_path: str,
+    target_column: str,
+    features: list[str],
+    chunk_size: int,
+    *,
+    dtypes: Optional[dict[str, str]] = None,
+    engine: str = "c",
+) -> Iterator[tuple[DataFrame, Series]]:
+    """Read the features and target column of a CSV file in chunks.
+
+    Args:
+        data_path: The path of the data to load.
+        target_column: The target column of the dataset.
+        features: The feature columns to parse.
+        chunk_size: The number of rows per chunk.
+        dtypes: Optional mapping of column name to dtype (e.g. 'float32', 'int8', 'category').
+        engine: The read_csv parser engine ("c" or "python", pyarrow does not support chunks).
+
+    Returns:
+        Iterator of tuples of a DataFrame and a Series representing the features and target column of each chunk, the
+        index of each chunk holds the absolute row positions in the file.
+
+    """
+    validate_columns(data_path=data_path, target_column=target_column, features=features)
+    reader = read_csv(
+        filepath_or_buffer=data_path,
+        usecols=list(dict.fromkeys([*features, target_column])),
+        dtype=dtypes,
+        chunksize=chunk_size,
+        engine="c" if engine == "pyarrow" else resolve_engine(engine),
+    )
+    with reader:
+        for chunk in reader:
+            yield chunk[features], chunk[target_column]
+
+
+def stream_training_set(
+    data_path: str,
+    target_column: str,
+    features: list[str],
+    *,
+    chunk_size: int,
+    test_size: float,
+    random_state: int,
+    dtypes: Optional[dict[str, str]] = None,
+    engine: str = "c",
+) -> Iterator[tuple[DataFrame, DataFrame, Series, Series]]:
+    """Read a CSV file in chunks and split every chunk deterministically into train and test rows.
+
+    Args:
+        data_path: The path of the data to load.
+        target_column: The target column of the dataset.
+        features: The feature columns to parse.
+        chunk_size: The number of rows per chunk.
+        test_size: float of the test size [0.0 - 1.0]
+        random_state: int, seed of the split.
+        dtypes: Optional mapping of column name to dtype (e.g. 'float32', 'int8', 'category').
+        engine: The read_csv parser engine.
+
+    Returns:
+        Iterator of tuple[DataFrame, DataFrame, Series, Series]: x_train, x_test, y_train, y_test of each chunk.
+
+    """
+    chunks = stream_data(
+        data_path=data_path,
+        target_column=target_column,
+        features=features,
+        chunk_size=chunk_size,
+        dtypes=dtypes,
+        engine=engine,
+    )
+    return split_chunks(chunks=chunks, test_size=test_size, random_state=random_state)
+
+
+def split_chunks(
+    chunks: Iterable[tuple[DataFrame, Series]], test_size: float, random_state: int
+) -> Iterator[tuple[DataFrame, DataFrame, Series, Series]]:
+    """Split chunks of features and target deterministically into train and test rows.
+
+    Args:
+        chunks: Iterable of the features and target of every chunk, indexed by the absolute row positions in the file.
+        test_size: float of the test size [0.0 - 1.0]
+        random_state: int, seed of the split.
+
+    Returns:
+        Iterator of tuple[DataFrame, DataFrame, Series, Series]: x_train, x_test, y_train, y_test of each chunk.
+
+    """
+    for x, y in chunks:
+        test_mask = is_test_row(row_index=x.index.to_numpy(), random_state=random_state, test_size=test_size)
+        yield x[~test_mask], x[test_mask], y[~test_mask], y[test_mask]
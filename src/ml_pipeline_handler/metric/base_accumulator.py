@@ -0,0 +1,54 @@
+"""Base Metric Accumulator Abstract Class Module."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Self
+
+from numpy import ndarray
+
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+
+
+class BaseMetricAccumulator(ABC):
+    """Base Metric Accumulator.
+
+    Accumulators compute metrics batch by batch, without holding every prediction in memory. Accumulators filled in
+    parallel workers are combined with merge.
+    """
+
+    @abstractmethod
+    def update(self, y_true: Any, y_pred: ndarray, y_proba: Optional[ndarray] = None) -> None:  # noqa: ANN401
+        """Add a batch of targets and predictions.
+
+        Args:
+            y_true: The ground truth (actual) values of the batch.
+            y_pred: The predicted values of the batch.
+            y_proba: Optional predicted probabilities of the batch (classification only).
+
+        Returns:
+            None
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def merge(self, other: Self) -> Self:
+        """Add the batches accumulated by another accumulator of the same type.
+
+        Args:
+            other: The accumulator to merge into this one.
+
+        Returns:
+            This accumulator, updated in place.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def result(self) -> BaseMetricResult:
+        """Compute the metrics of every batch added so far.
+
+        Returns:
+            BaseMetricResult, containing metric information.
+
+        """
+        raise NotImplementedError
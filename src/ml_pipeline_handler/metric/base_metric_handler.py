@@ -6,7 +6,8 @@ from typing import Optional
 from numpy import ndarray
 from pandas import Series
 
-from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult, BootstrapResult
+from src.ml_pipeline_handler.metric.bootstrap import BootstrapConfig, BootstrapStatistic, bootstrap_metrics
 from src.ml_pipeline_handler.metric.model_type import ModelType
 
 
@@ -23,16 +24,75 @@ class BaseMetricsHandler(ABC):
         self.model_type = model_type
 
     @abstractmethod
-    def compute_metrics(self, y_true: Series, y_pred: ndarray, y_proba: Optional[ndarray] = None) -> BaseMetricResult:
+    def compute_metrics(
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        bootstrap: Optional[BootstrapConfig] = None,
+        classes: Optional[ndarray] = None,
+    ) -> BaseMetricResult:
         """Compute all relevant metrics for a given task and return them in a structured datamodel.
 
         Args:
             y_true (Series): The ground truth (actual) values.
             y_pred (ndarray): The predicted values.
             y_proba (Optional[ndarray]): The predicted probabilities for the positive class (classification only).
+            bootstrap (Optional[BootstrapConfig]): Also compute bootstrap confidence intervals of every metric.
+            classes (Optional[ndarray]): The sorted classes of the model, the order of the y_proba columns
+                (classification only).
 
         Returns:
             MetricsResults: A datamodel containing all computed metrics.
 
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def bootstrap_statistic(
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        classes: Optional[ndarray] = None,
+    ) -> BootstrapStatistic:
+        """Prepare the computation of the metrics of weighted resamples of the samples.
+
+        Args:
+            y_true (Series): The ground truth (actual) values.
+            y_pred (ndarray): The predicted values.
+            y_proba (Optional[ndarray]): The predicted probabilities (classification only).
+            classes (Optional[ndarray]): The sorted classes of the model, the order of the y_proba columns
+                (classification only).
+
+        Returns:
+            BootstrapStatistic: Callable computing the metric result of every row of a (n_rows, n_samples) sample
+            weight matrix.
+
+        """
+        raise NotImplementedError
+
+    def compute_confidence_intervals(
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        config: Optional[BootstrapConfig] = None,
+        classes: Optional[ndarray] = None,
+    ) -> BootstrapResult:
+        """Compute bootstrap percentile confidence intervals of every metric.
+
+        Args:
+            y_true (Series): The ground truth (actual) values.
+            y_pred (ndarray): The predicted values.
+            y_proba (Optional[ndarray]): The predicted probabilities (classification only).
+            config (Optional[BootstrapConfig]): Number of replicates, confidence level, block size and threads.
+            classes (Optional[ndarray]): The sorted classes of the model, the order of the y_proba columns
+                (classification only).
+
+        Returns:
+            BootstrapResult: The bounds and standard error of every scalar metric.
+
+        """
+        statistic = self.bootstrap_statistic(y_true=y_true, y_pred=y_pred, y_proba=y_proba, classes=classes)
+        return bootstrap_metrics(statistic=statistic, n_samples=len(y_true), config=config)
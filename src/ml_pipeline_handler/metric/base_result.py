@@ -1,8 +1,95 @@
 """Base Metric Result Module."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+import numpy as np
+from numpy import ndarray
+
+
+@dataclass
+class CrossValidationResult:
+    """Cross Validation Result Data Class.
+
+    Attributes:
+        folds: The metric values of every fold.
+        mean: The mean of every metric over the folds.
+        std: The standard deviation of every metric over the folds.
+        fit_time: The pre-processing and fitting time of every fold, in seconds.
+        predict_time: The prediction time of every fold, in seconds.
+
+    """
+
+    folds: list[dict[str, float]]
+    mean: dict[str, float]
+    std: dict[str, float]
+    fit_time: list[float]
+    predict_time: list[float]
+
+
+@dataclass
+class BootstrapResult:
+    """Bootstrap Confidence Intervals Data Class.
+
+    Attributes:
+        confidence: The confidence level of the intervals, e.g. 0.95.
+        n_boot: The number of bootstrap replicates.
+        lower: The lower bound of the percentile interval of every metric.
+        upper: The upper bound of the percentile interval of every metric.
+        std: The standard deviation of every metric over the replicates (bootstrap standard error).
+
+    """
+
+    confidence: float
+    n_boot: int
+    lower: dict[str, float]
+    upper: dict[str, float]
+    std: dict[str, float]
 
 
 @dataclass
 class BaseMetricResult:
     """Base Metric Result Data Class."""
+
+
+def metric_values(results: list[BaseMetricResult]) -> tuple[list[str], ndarray]:
+    """Collect the scalar metrics of metric results of the same type.
+
+    Args:
+        results: The metric results, all of the same type.
+
+    Returns:
+        The names of the float-valued metrics, and ndarray of shape (len(results), len(names)) of their values.
+
+    """
+    names = [metric.name for metric in fields(results[0]) if isinstance(getattr(results[0], metric.name), float)]
+    values = np.array([[getattr(result, name) for name in names] for result in results], dtype=np.float64)
+    return names, values
+
+
+def aggregate_folds(
+    results: list[BaseMetricResult], fit_time: list[float], predict_time: list[float]
+) -> BaseMetricResult:
+    """Aggregate the metric results of cross-validation folds into one result holding their mean.
+
+    Args:
+        results: The metric results of every fold, all of the same type.
+        fit_time: The fitting time of every fold.
+        predict_time: The prediction time of every fold.
+
+    Returns:
+        A metric result of the same type as the folds, with the mean of every scalar metric and the per-fold values,
+        mean, standard deviation and timings in cross_validation.
+
+    """
+    names, values = metric_values(results=results)
+    mean = values.mean(axis=0)
+    std = values.std(axis=0, ddof=1 if len(results) > 1 else 0)
+
+    cross_validation = CrossValidationResult(
+        folds=[dict(zip(names, row.tolist(), strict=True)) for row in values],
+        mean=dict(zip(names, mean.tolist(), strict=True)),
+        std=dict(zip(names, std.tolist(), strict=True)),
+        fit_time=fit_time,
+        predict_time=predict_time,
+    )
+    return type(results[0])(**cross_validation.mean, cross_validation=cross_validation)  # type: ignore[call-arg]
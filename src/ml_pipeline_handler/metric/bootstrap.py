@@ -0,0 +1,131 @@
+"""Bootstrap Confidence Intervals Module.
+
+This module computes bootstrap confidence intervals of every metric without materializing the resampled data: every
+replicate is drawn as n_samples random row indices, turned with np.bincount into how often every row is drawn, and
+the metrics of all the replicates of a block are computed at once from the (n_replicates, n_samples) weight matrix, as
+weighted sums over the rows (matrix products and np.add.reduceat over presorted rows). The replicates are processed in
+blocks bounding the size of this matrix, and the blocks run in a thread pool, as numpy releases the GIL in these
+operations.
+"""
+
+import warnings
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from joblib import Parallel, delayed
+from numpy import ndarray
+
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult, BootstrapResult, metric_values
+from src.ml_pipeline_handler.parallelism import blas_limits, split_n_jobs
+
+# Bytes of one cell of the replicate weight matrix (float64).
+WEIGHT_BYTES = 8
+
+BootstrapStatistic = Callable[[ndarray], list[BaseMetricResult]]
+
+
+@dataclass
+class BootstrapConfig:
+    """Bootstrap Config Dataclass.
+
+    Attributes:
+        n_boot: Number of bootstrap replicates.
+        confidence: Confidence level of the percentile intervals.
+        block_bytes: Maximum size of the weight matrix of a block of replicates, the working memory of a block is a
+            small multiple of it and one block is processed per thread.
+        n_jobs: Number of cores, -1 uses every core. The blocks are processed by up to n_jobs threads.
+        blas_threads: Optional BLAS and OpenMP thread limit, shared by the threads and capped to their share of the
+            cores.
+        random_state: Optional seed of the resampling.
+
+    """
+
+    n_boot: int = 1000
+    confidence: float = 0.95
+    block_bytes: int = 32 * 2**20
+    n_jobs: int = -1
+    blas_threads: Optional[int] = None
+    random_state: Optional[int] = None
+
+
+def resample_weights(rng: np.random.Generator, n_replicates: int, n_samples: int) -> ndarray:
+    """Draw bootstrap replicates as row weights.
+
+    Args:
+        rng: The random generator of the block.
+        n_replicates: Number of replicates.
+        n_samples: Number of rows of the data.
+
+    Returns:
+        ndarray of shape (n_replicates, n_samples), the number of times every row is drawn in every replicate.
+
+    """
+    weights = np.empty(shape=(n_replicates, n_samples), dtype=np.float64)
+    for row in weights:
+        # One bincount per replicate keeps the counts in cache, unlike a single bincount over the whole block.
+        row[:] = np.bincount(rng.integers(low=0, high=n_samples, size=n_samples), minlength=n_samples)
+    return weights
+
+
+def bootstrap_block(
+    statistic: BootstrapStatistic, seed: np.random.SeedSequence, n_replicates: int, n_samples: int
+) -> list[BaseMetricResult]:
+    """Compute the metrics of one block of replicates.
+
+    Args:
+        statistic: Callable computing the metric result of every row of a weight matrix.
+        seed: The seed of the block.
+        n_replicates: Number of replicates of the block.
+        n_samples: Number of rows of the data.
+
+    Returns:
+        The metric result of every replicate of the block.
+
+    """
+    weights = resample_weights(rng=np.random.default_rng(seed), n_replicates=n_replicates, n_samples=n_samples)
+    return statistic(weights)
+
+
+def bootstrap_metrics(
+    statistic: BootstrapStatistic, n_samples: int, config: Optional[BootstrapConfig] = None
+) -> BootstrapResult:
+    """Compute the bootstrap percentile confidence interval of every metric.
+
+    Args:
+        statistic: Callable computing the metric result of every row of a weight matrix, as returned by
+            BaseMetricsHandler.bootstrap_statistic.
+        n_samples: Number of rows of the data.
+        config: Optional BootstrapConfig, defaults to BootstrapConfig().
+
+    Returns:
+        BootstrapResult with the bounds and standard error of every scalar metric.
+
+    """
+    config = config or BootstrapConfig()
+    block_size = min(config.n_boot, max(config.block_bytes // (WEIGHT_BYTES * n_samples), 1))
+    sizes = [min(block_size, config.n_boot - start) for start in range(0, config.n_boot, block_size)]
+    seeds = np.random.SeedSequence(config.random_state).spawn(len(sizes))
+
+    n_workers, worker_cores = split_n_jobs(n_jobs=config.n_jobs, n_tasks=len(sizes))
+    with blas_limits(blas_threads=min(config.blas_threads or worker_cores, worker_cores)):
+        blocks = Parallel(n_jobs=n_workers, backend="threading")(
+            delayed(bootstrap_block)(statistic=statistic, seed=seed, n_replicates=size, n_samples=n_samples)
+            for seed, size in zip(seeds, sizes, strict=True)
+        )
+    names, values = metric_values(results=[result for block in blocks for result in block])
+
+    alpha = (1 - config.confidence) / 2
+    with warnings.catch_warnings():
+        # Metrics undefined in every replicate (e.g. the ROC AUC of a single class) get nan bounds.
+        warnings.simplefilter(action="ignore", category=RuntimeWarning)
+        lower, upper = np.nanquantile(values, q=[alpha, 1 - alpha], axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+    return BootstrapResult(
+        confidence=config.confidence,
+        n_boot=config.n_boot,
+        lower=dict(zip(names, [float(value) for value in lower], strict=True)),
+        upper=dict(zip(names, [float(value) for value in upper], strict=True)),
+        std=dict(zip(names, [float(value) for value in std], strict=True)),
+    )
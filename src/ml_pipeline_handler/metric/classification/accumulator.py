@@ -0,0 +1,190 @@
+"""Classification Metrics Accumulator Module."""
+
+from collections.abc import Sequence
+from typing import Any, Optional, Self
+
+import numpy as np
+from numpy import ndarray
+
+from src.ml_pipeline_handler.metric.base_accumulator import BaseMetricAccumulator
+from src.ml_pipeline_handler.metric.classification.engine import (
+    check_probabilities,
+    confusion_matrix,
+    encode_labels,
+    grouped_auc,
+    metrics_from_confusion_matrix,
+)
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+
+
+def binned_auc(positive_histogram: ndarray, negative_histogram: ndarray) -> float:
+    """Compute the ROC AUC from histograms of the scores of the positive and negative samples.
+
+    Scores falling in the same bin count as tied, so the error is bounded by the share of positive/negative pairs
+    sharing a bin.
+
+    Args:
+        positive_histogram: The number of positive samples in every score bin.
+        negative_histogram: The number of negative samples in every score bin.
+
+    Returns:
+        The ROC AUC, nan when only one class is present.
+
+    """
+    return float(grouped_auc(positive_weights=positive_histogram, negative_weights=negative_histogram))
+
+
+class ClassificationMetricAccumulator(BaseMetricAccumulator):
+    """Classification Metric Accumulator.
+
+    Keeps the confusion matrix and, when probabilities are given, a histogram of the probabilities of every class for
+    its positive and negative samples, from which the one-vs-rest ROC AUCs are computed.
+    """
+
+    def __init__(self, classes: Optional[Sequence[Any]] = None, n_bins: int = 1000) -> None:
+        """Initialize an empty accumulator.
+
+        Args:
+            classes: Optional sorted classes of the model, in the order of its probability columns (model.classes_).
+                Required to accumulate probabilities, else the classes are collected from the batches.
+            n_bins: Number of probability bins of the ROC AUC histograms.
+
+        """
+        self.classes: Optional[ndarray] = np.asarray(classes) if classes is not None else None
+        self.fixed_classes = classes is not None
+        self.n_bins = n_bins
+
+        n_classes = len(self.classes) if self.classes is not None else 0
+        self.matrix = np.zeros(shape=(n_classes, n_classes), dtype=np.int64)
+        self.positive_histogram = np.zeros(shape=(n_classes, n_bins), dtype=np.int64)
+        self.negative_histogram = np.zeros(shape=(n_classes, n_bins), dtype=np.int64)
+
+    def _extend_classes(self, labels: ndarray) -> ndarray:
+        """Add new labels to the classes collected so far, growing the confusion matrix.
+
+        Args:
+            labels: The labels of a batch or of another accumulator.
+
+        Returns:
+            The sorted classes.
+
+        Raises:
+            ValueError: If the classes are fixed and a label is not one of them.
+
+        """
+        if self.fixed_classes and self.classes is not None:
+            unknown = np.setdiff1d(labels, self.classes)
+            if len(unknown):
+                raise ValueError(f"Labels {unknown.tolist()} are not in the classes {self.classes.tolist()}.")
+            return self.classes
+
+        classes = np.unique(labels) if self.classes is None else np.union1d(self.classes, labels)
+        if self.classes is None or len(classes) != len(self.classes):
+            matrix = np.zeros(shape=(len(classes), len(classes)), dtype=np.int64)
+            if self.classes is not None:
+                index = np.searchsorted(classes, self.classes)
+                matrix[np.ix_(index, index)] = self.matrix
+            self.classes, self.matrix = classes, matrix
+        return classes
+
+    def update(self, y_true: Any, y_pred: ndarray, y_proba: Optional[ndarray] = None) -> None:  # noqa: ANN401
+        """Add a batch of targets, predictions and optional probabilities.
+
+        Args:
+            y_true: The ground truth (actual) labels of the batch.
+            y_pred: The predicted labels of the batch.
+            y_proba: Optional predicted probabilities of the batch, one column per class. For two classes, the
+                probabilities of the positive class (index 1) alone are also accepted.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If probabilities are given without fixed classes or do not have one column per class.
+
+        """
+        y_true, y_pred = np.asarray(y_true), np.asarray(y_pred)
+        if len(y_true) == 0:
+            return
+        classes = self._extend_classes(labels=np.concatenate([y_true, y_pred]))
+        _, true_codes, pred_codes = encode_labels(y_true=y_true, y_pred=y_pred, classes=classes)
+        self.matrix += confusion_matrix(true_codes=true_codes, pred_codes=pred_codes, n_classes=len(classes))
+
+        if y_proba is None:
+            return
+        if not self.fixed_classes:
+            raise ValueError(
+                f"The classes of the model are required to accumulate probabilities in {type(self).__name__}."
+            )
+        y_proba = check_probabilities(y_proba=y_proba, n_classes=len(classes))
+        if y_proba.ndim == 1:
+            y_proba = np.column_stack([1 - y_proba, y_proba])
+        bins = np.minimum((y_proba * self.n_bins).astype(np.intp), self.n_bins - 1)
+        for code in range(len(classes)):
+            positives = true_codes == code
+            self.positive_histogram[code] += np.bincount(bins[positives, code], minlength=self.n_bins)
+            self.negative_histogram[code] += np.bincount(bins[~positives, code], minlength=self.n_bins)
+
+    def merge(self, other: Self) -> Self:
+        """Add the batches accumulated by another classification accumulator.
+
+        Args:
+            other: The accumulator to merge into this one.
+
+        Returns:
+            This accumulator, updated in place.
+
+        Raises:
+            ValueError: If the other accumulator holds probabilities and this one was created without the same classes
+                and bins.
+
+        """
+        if other.classes is None:
+            return self
+
+        if other.positive_histogram.any() or other.negative_histogram.any():
+            if (
+                not self.fixed_classes
+                or self.classes is None
+                or not np.array_equal(self.classes, other.classes)
+                or self.n_bins != other.n_bins
+            ):
+                raise ValueError(
+                    f"Accumulators holding probabilities must share their classes and bins, got {self.classes} with "
+                    f"{self.n_bins} bins and {other.classes} with {other.n_bins} bins."
+                )
+            self.positive_histogram += other.positive_histogram
+            self.negative_histogram += other.negative_histogram
+
+        classes = self._extend_classes(labels=other.classes)
+        index = np.searchsorted(classes, other.classes)
+        self.matrix[np.ix_(index, index)] += other.matrix
+        return self
+
+    def result(self) -> ClassificationMetricResult:
+        """Compute the classification metrics of every batch added so far.
+
+        Returns:
+            ClassificationMetricResult, the ROC AUCs are nan when no probabilities were added.
+
+        Raises:
+            ValueError: If no sample was added.
+
+        """
+        if self.classes is None or self.matrix.sum() == 0:
+            raise ValueError(f"No samples were added to the {type(self).__name__}.")
+
+        roc_auc_per_class: ndarray
+        if not self.positive_histogram.any() and not self.negative_histogram.any():
+            # Without fixed classes the histograms are never allocated for the collected classes.
+            roc_auc_per_class = np.full(shape=len(self.classes), fill_value=np.nan)
+        else:
+            roc_auc_per_class = np.array(
+                [
+                    binned_auc(positive_histogram=positive, negative_histogram=negative)
+                    for positive, negative in zip(self.positive_histogram, self.negative_histogram, strict=True)
+                ]
+            )
+        return metrics_from_confusion_matrix(
+            matrix=self.matrix, classes=self.classes, roc_auc_per_class=roc_auc_per_class
+        )
@@ -0,0 +1,297 @@
+"""Classification Metrics Engine Module.
+
+This module computes every classification metric in a single pass over the labels: the labels are encoded once, the
+confusion matrix is built with one np.bincount and accuracy, per-class precision, recall and F1 and their macro and
+weighted averages are derived from it. The ROC AUC of every class against the rest is computed from the ranks of its
+probabilities, with one sort per class.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+from numpy import ndarray
+
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+
+N_BINARY_CLASSES = 2
+
+
+def encode_labels(y_true: Any, y_pred: Any, classes: Optional[ndarray] = None) -> tuple[ndarray, ndarray, ndarray]:  # noqa: ANN401
+    """Encode the true and predicted labels as class indices.
+
+    Args:
+        y_true: The ground truth (actual) labels.
+        y_pred: The predicted labels.
+        classes: Optional sorted classes, e.g. the classes of the model (model.classes_), defaults to the sorted union
+            of the true and predicted labels.
+
+    Returns:
+        The classes, and the class index of every true and predicted label.
+
+    Raises:
+        ValueError: If a label is not one of the given classes.
+
+    """
+    y_true, y_pred = np.asarray(y_true), np.asarray(y_pred)
+    if classes is None:
+        classes = np.unique(np.concatenate([y_true, y_pred]))
+    else:
+        classes = np.asarray(classes)
+        unknown = np.setdiff1d(np.concatenate([y_true, y_pred]), classes)
+        if len(unknown):
+            raise ValueError(f"Labels {unknown.tolist()} are not in the classes {classes.tolist()}.")
+    return classes, np.searchsorted(classes, y_true), np.searchsorted(classes, y_pred)
+
+
+def check_probabilities(y_proba: Any, n_classes: int) -> ndarray:  # noqa: ANN401
+    """Check that the predicted probabilities have one column per class.
+
+    Args:
+        y_proba: The predicted probabilities, one column per class. For two classes, the probabilities of the positive
+            class (index 1) alone are also accepted.
+        n_classes: The number of classes.
+
+    Returns:
+        The probabilities as a float64 ndarray.
+
+    Raises:
+        ValueError: If the probabilities do not have one column per class, e.g. when a class of the model is missing
+            from the scored labels and the classes of the model were not given.
+
+    """
+    y_proba = np.asarray(y_proba, dtype=np.float64)
+    if n_classes == N_BINARY_CLASSES and y_proba.ndim == 1:
+        return y_proba
+    if y_proba.shape[1:] != (n_classes,):
+        raise ValueError(
+            f"Expected probabilities of shape (n_samples, {n_classes}), one column per class, got {y_proba.shape}: "
+            f"pass the classes of the model (model.classes_) when some of them are missing from the scored labels."
+        )
+    return y_proba
+
+
+def confusion_matrix(true_codes: ndarray, pred_codes: ndarray, n_classes: int) -> ndarray:
+    """Build the confusion matrix with a single bincount.
+
+    Args:
+        true_codes: The class index of every true label.
+        pred_codes: The class index of every predicted label.
+        n_classes: The number of classes.
+
+    Returns:
+        ndarray of shape (n_classes, n_classes), rows are true classes and columns predicted classes.
+
+    """
+    return np.bincount(true_codes * n_classes + pred_codes, minlength=n_classes * n_classes).reshape(
+        n_classes, n_classes
+    )
+
+
+def binary_auc(scores: ndarray, positives: ndarray) -> float:
+    """Compute the ROC AUC from the ranks of the scores (Mann-Whitney U), tied scores get their average rank.
+
+    Args:
+        scores: The score of every sample.
+        positives: Boolean ndarray, True for the samples of the positive class.
+
+    Returns:
+        The ROC AUC, nan when only one class is present.
+
+    """
+    n_positives = int(positives.sum())
+    n_negatives = len(scores) - n_positives
+    if n_positives == 0 or n_negatives == 0:
+        return float("nan")
+
+    order = np.argsort(scores, kind="mergesort")
+    sorted_scores = scores[order]
+    is_first = np.r_[True, sorted_scores[1:] != sorted_scores[:-1]]
+    starts = np.flatnonzero(is_first)
+    ends = np.r_[starts[1:], len(scores)]
+    ranks = np.empty(len(scores), dtype=np.float64)
+    ranks[order] = ((starts + ends + 1) / 2)[np.cumsum(is_first) - 1]
+
+    return float((ranks[positives].sum() - n_positives * (n_positives + 1) / 2) / (n_positives * n_negatives))
+
+
+def one_vs_rest_auc(true_codes: ndarray, y_proba: ndarray, n_classes: int) -> ndarray:
+    """Compute the ROC AUC of every class against the rest.
+
+    Args:
+        true_codes: The class index of every true label.
+        y_proba: The predicted probabilities, one column per class. For two classes only the column of the positive
+            class (index 1) is used.
+        n_classes: The number of classes.
+
+    Returns:
+        ndarray of the ROC AUC of every class.
+
+    Raises:
+        ValueError: If the probabilities do not have one column per class.
+
+    """
+    y_proba = check_probabilities(y_proba=y_proba, n_classes=n_classes)
+    if n_classes == N_BINARY_CLASSES:
+        scores = y_proba[:, 1] if y_proba.ndim > 1 else y_proba
+        positive = binary_auc(scores=scores, positives=true_codes == 1)
+        return np.array([1 - positive, positive])
+
+    return np.array([binary_auc(scores=y_proba[:, code], positives=true_codes == code) for code in range(n_classes)])
+
+
+def grouped_auc(positive_weights: ndarray, negative_weights: ndarray) -> ndarray:
+    """Compute ROC AUCs from the weight of the positive and negative samples of groups of tied scores.
+
+    Args:
+        positive_weights: ndarray of shape (..., n_groups), the positive weight of every group in increasing score
+            order, for every row (bootstrap replicate or accumulator).
+        negative_weights: ndarray of shape (..., n_groups), the negative weight of every group.
+
+    Returns:
+        ndarray of the ROC AUC of every row, nan where only one class is present.
+
+    """
+    n_positives, n_negatives = positive_weights.sum(axis=-1), negative_weights.sum(axis=-1)
+    # Positive and negative pairs of a group are tied and count as half.
+    pairs = np.einsum("...i,...i->...", positive_weights, np.cumsum(negative_weights, axis=-1)) - (
+        np.einsum("...i,...i->...", positive_weights, negative_weights) / 2
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((n_positives > 0) & (n_negatives > 0), pairs / (n_positives * n_negatives), np.nan)
+
+
+def sorted_groups(values: ndarray) -> tuple[ndarray, Optional[ndarray]]:
+    """Sort values and find the groups of equal values, for np.add.reduceat.
+
+    Args:
+        values: The values to group.
+
+    Returns:
+        The stable sorting order of the values, and the position of the first value of every group in that order,
+        None when all the values are distinct.
+
+    """
+    order = np.argsort(values, kind="mergesort")
+    sorted_values = values[order]
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    return order, starts if len(starts) < len(values) else None
+
+
+def weighted_confusion_matrices(weights: ndarray, true_codes: ndarray, pred_codes: ndarray, n_classes: int) -> ndarray:
+    """Build the confusion matrix of every row of a sample weight matrix.
+
+    Args:
+        weights: ndarray of shape (n_rows, n_samples) of sample weights, e.g. bootstrap replicates.
+        true_codes: The class index of every true label.
+        pred_codes: The class index of every predicted label.
+        n_classes: The number of classes.
+
+    Returns:
+        ndarray of shape (n_rows, n_classes, n_classes), rows are true classes and columns predicted classes.
+
+    """
+    cells = true_codes * n_classes + pred_codes
+    matrices = np.array([np.bincount(cells, weights=row, minlength=n_classes * n_classes) for row in weights])
+    return matrices.reshape(len(weights), n_classes, n_classes)
+
+
+def weighted_sorted_auc(sorted_weights: ndarray, sorted_positives: ndarray, starts: Optional[ndarray]) -> ndarray:
+    """Compute the ROC AUC of every row of a sample weight matrix whose samples are sorted by score.
+
+    Args:
+        sorted_weights: ndarray of shape (n_rows, n_samples) of sample weights, in increasing score order.
+        sorted_positives: Boolean ndarray, True for the samples of the positive class, in increasing score order.
+        starts: The position of the first sample of every group of tied scores, None when all scores are distinct.
+
+    Returns:
+        ndarray of the ROC AUC of every row, nan where only one class is present.
+
+    """
+    positive_weights = sorted_weights * sorted_positives
+    negative_weights = sorted_weights - positive_weights
+    if starts is not None:
+        positive_weights = np.add.reduceat(positive_weights, starts, axis=1)
+        negative_weights = np.add.reduceat(negative_weights, starts, axis=1)
+    return grouped_auc(positive_weights=positive_weights, negative_weights=negative_weights)
+
+
+class ClassificationMetricsEngine:
+    """Classification Metrics Engine Class."""
+
+    @staticmethod
+    def compute(
+        y_true: Any,  # noqa: ANN401
+        y_pred: Any,  # noqa: ANN401
+        y_proba: ndarray,
+        classes: Optional[ndarray] = None,
+    ) -> ClassificationMetricResult:
+        """Compute every classification metric from one confusion matrix and the one-vs-rest ROC AUCs.
+
+        Args:
+            y_true: The ground truth (actual) labels.
+            y_pred: The predicted labels.
+            y_proba: The predicted probabilities, one column per class in sorted class order.
+            classes: Optional sorted classes of the probability columns, the classes of the model (model.classes_).
+                Defaults to the sorted union of the true and predicted labels, which misses the classes of the model
+                absent from a testing set or fold.
+
+        Returns:
+            ClassificationMetricResult with the accuracy, the ROC AUC (of the positive class for binary targets, the
+            macro average of the one-vs-rest AUCs otherwise), the per-class metrics and their averages.
+
+        Raises:
+            ValueError: If a label is not one of the classes or the probabilities do not have one column per class.
+
+        """
+        classes, true_codes, pred_codes = encode_labels(y_true=y_true, y_pred=y_pred, classes=classes)
+        matrix = confusion_matrix(true_codes=true_codes, pred_codes=pred_codes, n_classes=len(classes))
+        roc_auc_per_class = one_vs_rest_auc(true_codes=true_codes, y_proba=y_proba, n_classes=len(classes))
+        return metrics_from_confusion_matrix(matrix=matrix, classes=classes, roc_auc_per_class=roc_auc_per_class)
+
+
+def metrics_from_confusion_matrix(
+    matrix: ndarray, classes: ndarray, roc_auc_per_class: ndarray
+) -> ClassificationMetricResult:
+    """Derive the classification metrics from a confusion matrix and the one-vs-rest ROC AUCs.
+
+    Args:
+        matrix: The confusion matrix, rows are true classes and columns predicted classes.
+        classes: The sorted classes of the rows and columns.
+        roc_auc_per_class: The one-vs-rest ROC AUC of every class.
+
+    Returns:
+        ClassificationMetricResult with the accuracy, the ROC AUC (of the positive class for binary targets, the macro
+        average of the one-vs-rest AUCs otherwise), the per-class metrics and their averages.
+
+    """
+    true_positives = np.diag(matrix).astype(np.float64)
+    support = matrix.sum(axis=1)
+    predicted = matrix.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, true_positives / predicted, 0.0)
+        recall = np.where(support > 0, true_positives / support, 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+    weights = support / support.sum()
+
+    if len(classes) == N_BINARY_CLASSES:
+        roc_auc = roc_auc_per_class[1]
+    else:
+        roc_auc = np.nan if np.isnan(roc_auc_per_class).all() else np.nanmean(roc_auc_per_class)
+
+    return ClassificationMetricResult(
+        accuracy=float(true_positives.sum() / support.sum()),
+        roc_auc=float(roc_auc),
+        precision_macro=float(precision.mean()),
+        recall_macro=float(recall.mean()),
+        f1_macro=float(f1.mean()),
+        precision_weighted=float(precision @ weights),
+        recall_weighted=float(recall @ weights),
+        f1_weighted=float(f1 @ weights),
+        classes=list(classes.tolist()),
+        precision=[float(value) for value in precision],
+        recall=[float(value) for value in recall],
+        f1=[float(value) for value in f1],
+        support=[int(value) for value in support],
+        roc_auc_per_class=[float(value) for value in roc_auc_per_class],
+        confusion_matrix=[[int(value) for value in row] for row in matrix],
+    )
@@ -2,12 +2,26 @@
 
 from typing import Optional
 
+import numpy as np
 from loguru import logger
 from numpy import ndarray
 from pandas import Series
-from sklearn.metrics import accuracy_score, roc_auc_score
+from sklearn.metrics import accuracy_score
 
 from src.ml_pipeline_handler.metric.base_metric_handler import BaseMetricsHandler
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.bootstrap import BootstrapConfig, BootstrapStatistic
+from src.ml_pipeline_handler.metric.classification.engine import (
+    N_BINARY_CLASSES,
+    ClassificationMetricsEngine,
+    check_probabilities,
+    encode_labels,
+    metrics_from_confusion_matrix,
+    one_vs_rest_auc,
+    sorted_groups,
+    weighted_confusion_matrices,
+    weighted_sorted_auc,
+)
 from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
 
 
@@ -30,40 +44,125 @@ class ClassificationMetricHandler(BaseMetricsHandler):
         return accuracy_score(y_true=y_true, y_pred=y_pred)
 
     @staticmethod
-    def compute_area_under_curve_score(y_true: Series, y_proba: ndarray) -> float:
+    def compute_area_under_curve_score(y_true: Series, y_proba: ndarray, classes: Optional[ndarray] = None) -> float:
         """Compute the Area Under the Receiver Operating Characteristic Curve (ROC AUC).
 
         Args:
-            y_true (Series): The ground truth (actual) binary labels.
-            y_proba (ndarray): The predicted probabilities for the positive class.
+            y_true (Series): The ground truth (actual) labels.
+            y_proba (ndarray): The predicted probabilities, one column per class in sorted class order.
+            classes (Optional[ndarray]): The sorted classes of the probability columns (model.classes_), defaults to
+                the classes of the true labels.
 
         Returns:
-            float: The ROC AUC score, which measures the ability of the model to distinguish between the positive and
-            negative classes.
+            float: The ROC AUC score of the positive class for binary targets, the macro average of the one-vs-rest
+            ROC AUC of every class for multiclass targets.
 
         """
-        return roc_auc_score(y_true=y_true, y_score=y_proba[:, 1])
+        classes, true_codes, _ = encode_labels(y_true=y_true, y_pred=np.asarray(y_true), classes=classes)
+        roc_auc = one_vs_rest_auc(true_codes=true_codes, y_proba=y_proba, n_classes=len(classes))
+        return float(roc_auc[1] if len(classes) == N_BINARY_CLASSES else np.nanmean(roc_auc))
 
     def compute_metrics(
-        self, y_true: Series, y_pred: ndarray, y_proba: Optional[ndarray] = None
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        bootstrap: Optional[BootstrapConfig] = None,
+        classes: Optional[ndarray] = None,
     ) -> ClassificationMetricResult:
         """Compute all relevant metrics for a given task and return them in a structured datamodel.
 
+        The metrics are computed in a single pass by the ClassificationMetricsEngine, for binary and multiclass
+        targets.
+
         Args:
             y_true (Series): The ground truth (actual) values.
             y_pred (ndarray): The predicted values.
-            y_proba (Optional[ndarray]): The predicted probabilities for the positive class (classification only).
+            y_proba (Optional[ndarray]): The predicted probabilities, one column per class (classification only).
+            bootstrap (Optional[BootstrapConfig]): Also compute bootstrap confidence intervals of every metric.
+            classes (Optional[ndarray]): The sorted classes of the model (model.classes_), the order of the probability
+                columns. Defaults to the classes of the true and predicted labels, which misses the classes of the
+                model absent from the scored labels.
 
         Returns:
             MetricsResults: A datamodel containing all computed metrics.
 
-        """
-        accuracy = ClassificationMetricHandler.compute_accuracy_score(y_true=y_true, y_pred=y_pred)
+        Raises:
+            ValueError: If y_proba is None, a label is not one of the classes or y_proba does not have one column per
+                class.
 
+        """
         if y_proba is None:
             logger.error("Variable [y_proba] is mandatory in ClassificationMetricHandler")
             raise ValueError
 
-        roc_auc = ClassificationMetricHandler.compute_area_under_curve_score(y_true=y_true, y_proba=y_proba)
+        result = ClassificationMetricsEngine.compute(y_true=y_true, y_pred=y_pred, y_proba=y_proba, classes=classes)
+        if bootstrap is not None:
+            result.confidence_intervals = self.compute_confidence_intervals(
+                y_true=y_true, y_pred=y_pred, y_proba=y_proba, config=bootstrap, classes=classes
+            )
+        return result
+
+    def bootstrap_statistic(
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        classes: Optional[ndarray] = None,
+    ) -> BootstrapStatistic:
+        """Prepare the computation of the classification metrics of weighted resamples of the samples.
+
+        The labels are encoded and the samples sorted by the score of every class once; the confusion matrices of all
+        the weight rows are then computed with weighted bincounts and their one-vs-rest ROC AUCs from the cumulative
+        weights of the sorted samples.
+
+        Args:
+            y_true (Series): The ground truth (actual) values.
+            y_pred (ndarray): The predicted values.
+            y_proba (Optional[ndarray]): The predicted probabilities, one column per class.
+            classes (Optional[ndarray]): The sorted classes of the model (model.classes_), the order of the probability
+                columns, defaults to the classes of the true and predicted labels.
+
+        Returns:
+            BootstrapStatistic: Callable computing the ClassificationMetricResult of every row of a sample weight
+            matrix.
+
+        Raises:
+            ValueError: If y_proba is None, a label is not one of the classes or y_proba does not have one column per
+                class.
+
+        """
+        if y_proba is None:
+            logger.error("Variable [y_proba] is mandatory in ClassificationMetricHandler")
+            raise ValueError
 
-        return ClassificationMetricResult(accuracy=accuracy, roc_auc=roc_auc)
+        classes, true_codes, pred_codes = encode_labels(y_true=y_true, y_pred=y_pred, classes=classes)
+        n_classes = len(classes)
+        y_proba = check_probabilities(y_proba=y_proba, n_classes=n_classes)
+        if n_classes == N_BINARY_CLASSES:
+            scored = [(y_proba[:, 1] if y_proba.ndim > 1 else y_proba, true_codes == 1)]
+        else:
+            scored = [(y_proba[:, code], true_codes == code) for code in range(n_classes)]
+        sorted_scores = []
+        for scores, positives in scored:
+            order, starts = sorted_groups(values=scores)
+            sorted_scores.append((order, positives[order], starts))
+
+        def statistic(weights: ndarray) -> list[BaseMetricResult]:
+            matrices = weighted_confusion_matrices(
+                weights=weights, true_codes=true_codes, pred_codes=pred_codes, n_classes=n_classes
+            )
+            roc_auc = np.column_stack(
+                [
+                    weighted_sorted_auc(sorted_weights=weights[:, order], sorted_positives=positives, starts=starts)
+                    for order, positives, starts in sorted_scores
+                ]
+            )
+            if n_classes == N_BINARY_CLASSES:
+                roc_auc = np.column_stack([1 - roc_auc[:, 0], roc_auc[:, 0]])
+            return [
+                metrics_from_confusion_matrix(matrix=matrix, classes=classes, roc_auc_per_class=roc_auc_per_class)
+                for matrix, roc_auc_per_class in zip(matrices, roc_auc, strict=True)
+            ]
+
+        return statistic
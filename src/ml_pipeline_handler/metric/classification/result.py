@@ -1,13 +1,34 @@
 """Classification Metric results module."""
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
-from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult, BootstrapResult, CrossValidationResult
 
 
 @dataclass
 class ClassificationMetricResult(BaseMetricResult):
-    """Classification Metric results."""
+    """Classification Metric results.
+
+    The per-class lists follow the order of classes, rows of the confusion matrix are true classes and columns
+    predicted classes.
+    """
 
     accuracy: float
     roc_auc: float
+    precision_macro: float = math.nan
+    recall_macro: float = math.nan
+    f1_macro: float = math.nan
+    precision_weighted: float = math.nan
+    recall_weighted: float = math.nan
+    f1_weighted: float = math.nan
+    classes: list[Any] = field(default_factory=list)
+    precision: list[float] = field(default_factory=list)
+    recall: list[float] = field(default_factory=list)
+    f1: list[float] = field(default_factory=list)
+    support: list[int] = field(default_factory=list)
+    roc_auc_per_class: list[float] = field(default_factory=list)
+    confusion_matrix: list[list[int]] = field(default_factory=list)
+    cross_validation: Optional[CrossValidationResult] = None
+    confidence_intervals: Optional[BootstrapResult] = None
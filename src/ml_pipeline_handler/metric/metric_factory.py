@@ -1,10 +1,16 @@
 """Metrics Factory Module."""
 
+from collections.abc import Sequence
+from typing import Any, Optional
+
 from loguru import logger
 
+from src.ml_pipeline_handler.metric.base_accumulator import BaseMetricAccumulator
 from src.ml_pipeline_handler.metric.base_metric_handler import BaseMetricsHandler
+from src.ml_pipeline_handler.metric.classification.accumulator import ClassificationMetricAccumulator
 from src.ml_pipeline_handler.metric.classification.handler import ClassificationMetricHandler
 from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.metric.regression.accumulator import RegressionMetricAccumulator
 from src.ml_pipeline_handler.metric.regression.handler import RegressionMetricHandler
 
 
@@ -28,3 +34,24 @@ class MetricFactory:
             return ClassificationMetricHandler(model_type=model_type)
         logger.error(f"Model Type: {model_type} is not valid.")
         raise NotImplementedError
+
+    @classmethod
+    def get_metrics_accumulator(
+        cls, model_type: ModelType, classes: Optional[Sequence[Any]] = None
+    ) -> BaseMetricAccumulator:
+        """Instantiate the concrete Metrics Accumulator Class based on the model type.
+
+        Args:
+            model_type: Type of Machine Learning Model.
+            classes: Optional sorted classes of a classification model, required to accumulate probabilities.
+
+        Returns:
+            The Concrete Metrics Accumulator Class based on given model type.
+
+        """
+        if model_type == ModelType.REGRESSION:
+            return RegressionMetricAccumulator()
+        if model_type == ModelType.CLASSIFICATION:
+            return ClassificationMetricAccumulator(classes=classes)
+        logger.error(f"Model Type: {model_type} is not valid.")
+        raise NotImplementedError
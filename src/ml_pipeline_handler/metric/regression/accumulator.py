@@ -0,0 +1,121 @@
+"""Regression Metrics Accumulator Module."""
+
+from typing import Any, Optional, Self
+
+import numpy as np
+from numpy import ndarray
+
+from src.ml_pipeline_handler.metric.base_accumulator import BaseMetricAccumulator
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+
+
+class RegressionMetricAccumulator(BaseMetricAccumulator):
+    """Regression Metric Accumulator.
+
+    Keeps the number of samples, the sums of the absolute and squared errors, and the mean and sum of squared
+    deviations of the target, combined between batches with the parallel variance update of Chan et al. (a batched
+    Welford update), so R² is exact without a second pass over the targets.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.absolute_error = 0.0
+        self.squared_error = 0.0
+        self.mean = 0.0
+        self.sum_of_squares = 0.0
+
+    def _combine(
+        self, count: int, absolute_error: float, squared_error: float, mean: float, sum_of_squares: float
+    ) -> None:
+        """Combine the statistics of a batch or another accumulator into this accumulator.
+
+        Args:
+            count: The number of samples.
+            absolute_error: The sum of the absolute errors.
+            squared_error: The sum of the squared errors.
+            mean: The mean of the targets.
+            sum_of_squares: The sum of the squared deviations of the targets from their mean.
+
+        Returns:
+            None
+
+        """
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.sum_of_squares += sum_of_squares + delta**2 * self.count * count / total
+        self.count = total
+        self.absolute_error += absolute_error
+        self.squared_error += squared_error
+
+    def update(self, y_true: Any, y_pred: ndarray, y_proba: Optional[ndarray] = None) -> None:  # noqa: ANN401
+        """Add a batch of targets and predictions.
+
+        Args:
+            y_true: The ground truth (actual) values of the batch.
+            y_pred: The predicted values of the batch.
+            y_proba: Not used by regression.
+
+        Returns:
+            None
+
+        """
+        del y_proba  # Argument is not used by Regression.
+        y_true = np.asarray(y_true, dtype=np.float64)
+        if len(y_true) == 0:
+            return
+        errors = y_true - np.asarray(y_pred, dtype=np.float64)
+        mean = float(y_true.mean())
+        self._combine(
+            count=len(y_true),
+            absolute_error=float(np.abs(errors).sum()),
+            squared_error=float(errors @ errors),
+            mean=mean,
+            sum_of_squares=float(((y_true - mean) ** 2).sum()),
+        )
+
+    def merge(self, other: Self) -> Self:
+        """Add the batches accumulated by another regression accumulator.
+
+        Args:
+            other: The accumulator to merge into this one.
+
+        Returns:
+            This accumulator, updated in place.
+
+        """
+        self._combine(
+            count=other.count,
+            absolute_error=other.absolute_error,
+            squared_error=other.squared_error,
+            mean=other.mean,
+            sum_of_squares=other.sum_of_squares,
+        )
+        return self
+
+    def result(self) -> RegressionMetricResult:
+        """Compute the MAE, MSE and R² of every batch added so far.
+
+        Returns:
+            RegressionMetricResult, R² is 1.0 for a constant target predicted exactly and 0.0 for any other constant
+            target, as with sklearn.
+
+        Raises:
+            ValueError: If no sample was added.
+
+        """
+        if self.count == 0:
+            raise ValueError(f"No samples were added to the {type(self).__name__}.")
+
+        if self.sum_of_squares > 0:
+            r_square = 1 - self.squared_error / self.sum_of_squares
+        else:
+            r_square = 1.0 if self.squared_error == 0 else 0.0
+        return RegressionMetricResult(
+            mean_absolute_error=self.absolute_error / self.count,
+            mean_squared_error=self.squared_error / self.count,
+            r_square=r_square,
+        )
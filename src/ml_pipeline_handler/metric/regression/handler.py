@@ -2,11 +2,14 @@
 
 from typing import Optional
 
+import numpy as np
 from numpy import ndarray
 from pandas import Series
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
 from src.ml_pipeline_handler.metric.base_metric_handler import BaseMetricsHandler
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.bootstrap import BootstrapConfig, BootstrapStatistic
 from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
 
 
@@ -59,7 +62,12 @@ class RegressionMetricHandler(BaseMetricsHandler):
         return r2_score(y_true=y_true, y_pred=y_pred)
 
     def compute_metrics(
-        self, y_true: Series, y_pred: ndarray, y_proba: Optional[ndarray] = None
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        bootstrap: Optional[BootstrapConfig] = None,
+        classes: Optional[ndarray] = None,
     ) -> RegressionMetricResult:
         """Compute all relevant metrics for a given task and return them in a structured datamodel.
 
@@ -67,13 +75,64 @@ class RegressionMetricHandler(BaseMetricsHandler):
             y_true (Series): The ground truth (actual) values.
             y_pred (ndarray): The predicted values.
             y_proba (Optional[ndarray]): The predicted probabilities for the positive class (classification only).
+            bootstrap (Optional[BootstrapConfig]): Also compute bootstrap confidence intervals of every metric.
+            classes (Optional[ndarray]): Not used by regression.
 
         Returns:
             MetricsResults: A datamodel containing all computed metrics.
 
         """
-        del y_proba  # Argument is not used by Regression.
+        del y_proba, classes  # Arguments are not used by Regression.
         mae = RegressionMetricHandler.compute_mean_absolute_error(y_true=y_true, y_pred=y_pred)
         mse = RegressionMetricHandler.compute_mean_squared_error(y_true=y_true, y_pred=y_pred)
         r_square = RegressionMetricHandler.compute_r_square_score(y_true=y_true, y_pred=y_pred)
-        return RegressionMetricResult(mean_absolute_error=mae, mean_squared_error=mse, r_square=r_square)
+        result = RegressionMetricResult(mean_absolute_error=mae, mean_squared_error=mse, r_square=r_square)
+        if bootstrap is not None:
+            result.confidence_intervals = self.compute_confidence_intervals(
+                y_true=y_true, y_pred=y_pred, config=bootstrap
+            )
+        return result
+
+    def bootstrap_statistic(
+        self,
+        y_true: Series,
+        y_pred: ndarray,
+        y_proba: Optional[ndarray] = None,
+        classes: Optional[ndarray] = None,
+    ) -> BootstrapStatistic:
+        """Prepare the computation of the MAE, MSE and R² of weighted resamples of the samples.
+
+        The weighted sums every metric is derived from are computed for all the weight rows with one matrix product.
+
+        Args:
+            y_true (Series): The ground truth (actual) values.
+            y_pred (ndarray): The predicted values.
+            y_proba (Optional[ndarray]): Not used by regression.
+            classes (Optional[ndarray]): Not used by regression.
+
+        Returns:
+            BootstrapStatistic: Callable computing the RegressionMetricResult of every row of a sample weight matrix.
+
+        """
+        del y_proba, classes  # Arguments are not used by Regression.
+        target = np.asarray(y_true, dtype=np.float64)
+        errors = target - np.asarray(y_pred, dtype=np.float64)
+        # Centered, so that the weighted sums of squares do not lose precision on large targets.
+        centered = target - target.mean()
+        columns = np.column_stack([np.ones_like(errors), np.abs(errors), errors**2, centered, centered**2])
+
+        def statistic(weights: ndarray) -> list[BaseMetricResult]:
+            count, absolute_error, squared_error, total, total_of_squares = (weights @ columns).T
+            sum_of_squares = total_of_squares - total**2 / count
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r_square = np.where(
+                    sum_of_squares > 0, 1 - squared_error / sum_of_squares, (squared_error == 0).astype(np.float64)
+                )
+            return [
+                RegressionMetricResult(
+                    mean_absolute_error=float(mae), mean_squared_error=float(mse), r_square=float(r2)
+                )
+                for mae, mse, r2 in zip(absolute_error / count, squared_error / count, r_square, strict=True)
+            ]
+
+        return statistic
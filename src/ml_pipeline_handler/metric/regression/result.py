@@ -1,8 +1,9 @@
 """Regression Metric results module."""
 
 from dataclasses import dataclass
+from typing import Optional
 
-from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult, BootstrapResult, CrossValidationResult
 
 
 @dataclass
@@ -12,3 +13,5 @@ class RegressionMetricResult(BaseMetricResult):
     mean_absolute_error: float
     mean_squared_error: float
     r_square: float
+    cross_validation: Optional[CrossValidationResult] = None
+    confidence_intervals: Optional[BootstrapResult] = None
@@ -0,0 +1,108 @@
+"""Parallelism Module.
+
+The parallelism of a run is set in its PipelineConfig:
+- n_jobs, the number of cores the run may use, -1 for every core. It is the n_jobs of the estimators supporting it
+  and the size of the worker pools fitting several pipelines at once (cross-validation folds, compared algorithms,
+  search trials) and computing bootstrap replicates.
+- backend, the joblib backend of these pools: 'loky' or 'multiprocessing' for worker processes, 'threading' for
+  threads, which suits estimators and numpy code releasing the GIL.
+- blas_threads, the thread limit of the BLAS and OpenMP libraries (set with threadpoolctl), used by the linear models
+  and numpy. None keeps the library defaults.
+
+Nested parallelism shares the cores instead of multiplying them: a pool of k workers gives every worker n_jobs // k
+cores, used as the n_jobs of its estimator and as its BLAS thread limit.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Optional
+
+from joblib import Parallel, effective_n_jobs
+from threadpoolctl import threadpool_limits
+
+from src.ml_pipeline_handler.pipeline.base_config import BACKENDS, PipelineConfig
+
+
+def split_n_jobs(n_jobs: Optional[int], n_tasks: int) -> tuple[int, int]:
+    """Split the cores of a run between the workers of a pool and the work of every worker.
+
+    Args:
+        n_jobs: Number of cores of the run, -1 for every core, None for one.
+        n_tasks: Number of tasks of the pool, it never gets more workers than tasks.
+
+    Returns:
+        The number of workers of the pool and the number of cores of every worker.
+
+    """
+    n_cores = effective_n_jobs(n_jobs)
+    n_workers = max(min(n_cores, n_tasks), 1)
+    return n_workers, max(n_cores // n_workers, 1)
+
+
+@contextmanager
+def blas_limits(blas_threads: Optional[int]) -> Iterator[None]:
+    """Limit the threads of the BLAS and OpenMP libraries inside the context.
+
+    The limits are process-wide: threads of a pool must share the limits set around the pool instead of setting
+    their own.
+
+    Args:
+        blas_threads: Maximum number of threads of every library, None to keep the current limits.
+
+    Yields:
+        None
+
+    """
+    if blas_threads is None:
+        yield
+        return
+    with threadpool_limits(limits=blas_threads):
+        yield
+
+
+def set_estimator_n_jobs(estimator: Any, n_jobs: Optional[int]) -> None:  # noqa: ANN401
+    """Set the n_jobs of an estimator supporting it.
+
+    Args:
+        estimator: The scikit-learn estimator.
+        n_jobs: The number of cores of the estimator.
+
+    Returns:
+        None
+
+    """
+    if "n_jobs" in estimator.get_params(deep=False):
+        estimator.set_params(n_jobs=n_jobs)
+
+
+@contextmanager
+def parallel_pool(config: PipelineConfig, n_tasks: int) -> Iterator[tuple[Parallel, PipelineConfig]]:
+    """Open the worker pool of config.backend sharing the config.n_jobs cores between its workers.
+
+    Worker processes receive large arrays as read-only memory maps and limit their own BLAS threads, worker threads
+    share the BLAS limit set around the pool.
+
+    Args:
+        config: PipelineConfig of the run.
+        n_tasks: Number of tasks of the pool.
+
+    Yields:
+        The pool and the PipelineConfig of its workers, with the n_jobs and blas_threads of one worker.
+
+    Raises:
+        ValueError: If the backend is not one of BACKENDS.
+
+    """
+    if config.backend not in BACKENDS:
+        raise ValueError(f"Backend '{config.backend}' is not one of {BACKENDS}.")
+    n_workers, worker_cores = split_n_jobs(n_jobs=config.n_jobs, n_tasks=n_tasks)
+    blas_threads = min(config.blas_threads or worker_cores, worker_cores)
+
+    if config.backend == "threading":
+        with blas_limits(blas_threads=blas_threads), Parallel(n_jobs=n_workers, backend="threading") as parallel:
+            yield parallel, replace(config, n_jobs=worker_cores, blas_threads=None)
+        return
+
+    with Parallel(n_jobs=n_workers, backend=config.backend, max_nbytes="1M", mmap_mode="r") as parallel:
+        yield parallel, replace(config, n_jobs=worker_cores, blas_threads=blas_threads)
@@ -1,9 +1,15 @@
 """Base Pipeline Config Module."""
 
 from dataclasses import dataclass, field
+from typing import Any, Optional
 
 from src.ml_pipeline_handler.algorithm import AlgorithmType
 
+# joblib backends of the worker pools, see the parallelism module.
+BACKENDS = ("loky", "threading", "multiprocessing")
+# Methods of the sampling stage, see the sampler module.
+SAMPLING_METHODS = ("uniform", "stratified", "reservoir")
+
 
 @dataclass
 class PipelineConfig:
@@ -18,6 +24,20 @@ class PipelineConfig:
     scale_standard: list[str] = field(default_factory=list)
     scale_robust: list[str] = field(default_factory=list)
     scale_minmax: list[str] = field(default_factory=list)
+    dtypes: dict[str, str] = field(default_factory=dict)
+    compact_dtypes: bool = False
+    csv_engine: str = "c"
+    cache_dir: Optional[str] = None
+    chunk_size: int = 100_000
+    cache_stages: bool = False
+    stage_cache_dir: Optional[str] = None
+    model_params: dict[str, Any] = field(default_factory=dict)
+    n_jobs: int = -1
+    backend: str = "loky"
+    blas_threads: Optional[int] = None
+    # Optional sample of the data set: a fraction of the rows in (0, 1) or a number of rows, see the sampler module.
+    sample: Optional[float] = None
+    sample_method: str = "uniform"
 
     def has_pre_processing(self) -> bool:
         """Check whether the pipeline config contains pre_processing.
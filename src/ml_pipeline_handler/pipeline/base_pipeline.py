@@ -1,23 +1,43 @@
 """Base Pipeline module."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from typing import Any, Optional
 
+from joblib import delayed
 from numpy import ndarray
 from pandas import DataFrame, Series
+from sklearn.base import clone, is_classifier
 from sklearn.compose import ColumnTransformer
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold, StratifiedKFold, train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+from sklearn.utils.validation import check_is_fitted
 
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.io.artifact import predict_features
 from src.ml_pipeline_handler.io.loader import load_data
-from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.io.sampler import load_sample
+from src.ml_pipeline_handler.io.stream import split_chunks, stream_training_set
+from src.ml_pipeline_handler.metric.base_metric_handler import BaseMetricsHandler
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult, aggregate_folds
+from src.ml_pipeline_handler.parallelism import blas_limits, parallel_pool, set_estimator_n_jobs
 from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.stage_cache import PreparedData, get_stage_cache, stage_key
+from src.ml_pipeline_handler.telemetry.span import span
 
 
 class BasePipeline(ABC):
     """Base Pipeline Class."""
 
+    test_size: float = 0.3
+    # Whether the pre-processor outputs DataFrames, keeping the dtypes (e.g. categoricals) of the unscaled features for
+    # estimators handling them natively, instead of a single ndarray.
+    keep_dtypes: bool = False
+    metric_handler: BaseMetricsHandler
+
     def __init__(self, config: PipelineConfig) -> None:
         """Initialize any Pipeline.
 
@@ -26,6 +46,8 @@ class BasePipeline(ABC):
 
         """
         self.config = config
+        self.model: Any = None
+        self.pre_processor: Optional[ColumnTransformer] = None
 
         self.x_train: Optional[ndarray] = None
         self.x_test: Optional[ndarray] = None
@@ -34,15 +56,98 @@ class BasePipeline(ABC):
 
         self.x_train_pre_processed: Optional[ndarray] = None
         self.x_test_pre_processed: Optional[ndarray] = None
+        self.prepared: Optional[PreparedData] = None
+
+        self.fit_time = 0.0
+        self.predict_time = 0.0
 
     def load_data_set(self) -> tuple[DataFrame, Series]:
-        """Call load_data function from io module.
+        """Call load_data function from io module, parsing only the configured features and target.
+
+        With config.sample set, the sampling stage streams the file and loads only a sample of its rows instead.
 
         Returns:
             tuple[DataFrame, Series] of the features and target.
 
         """
-        return load_data(data_path=self.config.data_path, target_column=self.config.target_column)
+        if self.config.sample is not None:
+            return self.load_sample(size=self.config.sample)
+
+        with span("load_data") as stage:
+            features, target = load_data(
+                data_path=self.config.data_path,
+                target_column=self.config.target_column,
+                features=self.config.features,
+                dtypes=self.config.dtypes or None,
+                compact=self.config.compact_dtypes,
+                engine=self.config.csv_engine,
+                cache_dir=self.config.cache_dir,
+            )
+            stage.set_rows(rows=len(target))
+        return features, target
+
+    def load_sample(self, size: float) -> tuple[DataFrame, Series]:
+        """Call load_sample function from io module, sampling the rows of the data set with config.sample_method.
+
+        The sample is cached in memory and in config.cache_dir when set.
+
+        Args:
+            size: A fraction of the rows in (0, 1), or a number of rows, usually config.sample.
+
+        Returns:
+            tuple[DataFrame, Series] of the features and target of the sampled rows.
+
+        """
+        with span("sample", method=self.config.sample_method, size=size) as stage:
+            features, target = load_sample(
+                data_path=self.config.data_path,
+                target_column=self.config.target_column,
+                features=self.config.features,
+                size=size,
+                method=self.config.sample_method,
+                chunk_size=self.config.chunk_size,
+                random_state=self.config.random_state,
+                dtypes=self.config.dtypes or None,
+                compact=self.config.compact_dtypes,
+                engine=self.config.csv_engine,
+                cache_dir=self.config.cache_dir,
+            )
+            stage.set_rows(rows=len(target))
+        return features, target
+
+    def stream_data_set(
+        self, chunk_size: int, test_size: float
+    ) -> Iterator[tuple[DataFrame, DataFrame, Series, Series]]:
+        """Call stream_training_set function from io module, yielding split batches without loading the full dataset.
+
+        With config.sample set, the batches are split from the sample instead.
+
+        Args:
+            chunk_size: The number of rows read per batch.
+            test_size: float of the test size [0.0 - 1.0]
+
+        Returns:
+            Iterator of tuple[DataFrame, DataFrame, Series, Series]: x_train, x_test, y_train, y_test of each batch.
+
+        """
+        if self.config.sample is not None:
+            features, target = self.load_sample(size=self.config.sample)
+            chunks = (
+                (features.iloc[offset : offset + chunk_size], target.iloc[offset : offset + chunk_size])
+                for offset in range(0, len(target), chunk_size)
+            )
+            return split_chunks(chunks=chunks, test_size=test_size, random_state=self.config.random_state)
+
+        return stream_training_set(
+            data_path=self.config.data_path,
+            target_column=self.config.target_column,
+            features=self.config.features,
+            chunk_size=chunk_size,
+            test_size=test_size,
+            random_state=self.config.random_state,
+            dtypes=self.config.dtypes or None,
+            engine=self.config.csv_engine,
+        )
 
     def create_training_set(
         self, features: DataFrame, target: Series, test_size: float
@@ -58,34 +163,47 @@ class BasePipeline(ABC):
             tuple[ndarray, ndarray, Series, Series]: x_train, x_test, y_train, y_test.
 
         """
-        features = features[self.config.features]
-        x_train, x_test, y_train, y_test = train_test_split(
-            features, target, test_size=test_size, random_state=self.config.random_state
-        )
+        with span("split", rows=len(target)):
+            features = features[self.config.features]
+            x_train, x_test, y_train, y_test = train_test_split(
+                features, target, test_size=test_size, random_state=self.config.random_state
+            )
         return x_train, x_test, y_train, y_test
 
     def get_pre_processor(self) -> ColumnTransformer:
         """Assemble and return a ColumnTransformer based on the pipeline config.
 
+        Unscaled features are passed through after the scaled ones. The scalers work in place (copy=False) on the
+        column subsets the ColumnTransformer selects for them, which are already copies of the input. With keep_dtypes,
+        the output is a DataFrame with the original column names and the dtypes of the passed through features.
+
         Returns:
             ColumnTransformer to transform the data.
 
         """
-        scaler_standard = Pipeline(steps=[("scaler_standard", StandardScaler())])
-        scaler_robust = Pipeline(steps=[("scaler_robust", RobustScaler())])
-        scaler_minmax = Pipeline(steps=[("scaler_minmax", MinMaxScaler())])
+        scaler_standard = Pipeline(steps=[("scaler_standard", StandardScaler(copy=False))])
+        scaler_robust = Pipeline(steps=[("scaler_robust", RobustScaler(copy=False))])
+        scaler_minmax = Pipeline(steps=[("scaler_minmax", MinMaxScaler(copy=False))])
 
-        return ColumnTransformer(
+        pre_processor = ColumnTransformer(
             transformers=[
                 ("scaler_standard", scaler_standard, self.config.scale_standard),
                 ("scaler_robust", scaler_robust, self.config.scale_robust),
                 ("scaler_minmax", scaler_minmax, self.config.scale_minmax),
-            ]
+            ],
+            remainder="passthrough",
+            verbose_feature_names_out=not self.keep_dtypes,
         )
+        if self.keep_dtypes:
+            pre_processor.set_output(transform="pandas")
+        return pre_processor
 
     def pre_process_data(self, x_train: ndarray, x_test: ndarray) -> tuple[ndarray, ndarray]:
         """Preprocessed the data based on the ColumnTransformer.
 
+        Nothing is fitted or copied when no scaling is configured. The transformed arrays of the prepared stage are
+        reused when called on its split.
+
         Args:
             x_train: ndarray, training data.
             x_test: ndarray, testing data.
@@ -95,24 +213,203 @@ class BasePipeline(ABC):
              else x_train, x_test.
 
         """
-        pre_processor = self.get_pre_processor()
-
-        self.x_train_pre_processed = pre_processor.fit_transform(X=x_train)
-        self.x_test_pre_processed = pre_processor.transform(X=x_test)
+        if self.prepared is not None and x_train is self.prepared.x_train and x_test is self.prepared.x_test:
+            self.x_train_pre_processed = self.prepared.x_train_pre_processed
+            self.x_test_pre_processed = self.prepared.x_test_pre_processed
+            self.pre_processor = self.prepared.pre_processor
+            return self.prepared.pre_processed()
 
         if not self.config.has_pre_processing():
+            self.pre_processor = None
+            self.x_train_pre_processed = None
+            self.x_test_pre_processed = None
             return x_train, x_test
 
+        with span("pre_process", rows=len(x_train) + len(x_test)):
+            self.pre_processor = self.get_pre_processor()
+            self.x_train_pre_processed = self.pre_processor.fit_transform(X=x_train)
+            self.x_test_pre_processed = self.pre_processor.transform(X=x_test)
         return self.x_train_pre_processed, self.x_test_pre_processed  # type: ignore[return-value]
 
-    @abstractmethod
+    def prepare_data(self, test_size: float) -> PreparedData:
+        """Run the split-and-preprocess stage: load the data set, split it and fit the ColumnTransformer if needed.
+
+        Args:
+            test_size: float of the test size [0.0 - 1.0]
+
+        Returns:
+            PreparedData of the split, the fitted pre-processor and the transformed arrays.
+
+        """
+        features, target = self.load_data_set()
+        x_train, x_test, y_train, y_test = self.create_training_set(
+            features=features, target=target, test_size=test_size
+        )
+        prepared = PreparedData(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test)
+        if self.config.has_pre_processing():
+            with span("pre_process", rows=len(x_train) + len(x_test)):
+                prepared.pre_processor = self.get_pre_processor()
+                prepared.x_train_pre_processed = prepared.pre_processor.fit_transform(X=x_train)
+                prepared.x_test_pre_processed = prepared.pre_processor.transform(X=x_test)
+        return prepared
+
     def predict(self) -> tuple[ndarray, Optional[ndarray]]:
-        """Predict the target values based on the features.
+        """Load the data set, split it, fit the model and predict the target values of the testing set.
+
+        With cache_stages set, the split and the fitted pre-processor are reused from the stage cache when another
+        pipeline already prepared them for the same data set, features, scalers, test size and random state.
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+        with span("pipeline", algorithm=AlgorithmType(self.config.algorithm).value):
+            if not self.config.cache_stages:
+                features, target = self.load_data_set()
+                x_train, x_test, y_train, y_test = self.create_training_set(
+                    features=features, target=target, test_size=self.test_size
+                )
+                return self.fit_predict(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test)
+
+            self.prepared = get_stage_cache(cache_dir=self.config.stage_cache_dir).get_or_compute(
+                key=stage_key(config=self.config, test_size=self.test_size, keep_dtypes=self.keep_dtypes),
+                compute=lambda: self.prepare_data(test_size=self.test_size),
+            )
+            return self.fit_predict(
+                x_train=self.prepared.x_train,
+                x_test=self.prepared.x_test,
+                y_train=self.prepared.y_train,
+                y_test=self.prepared.y_test,
+            )
+
+    def fit_predict(
+        self, x_train: DataFrame, x_test: DataFrame, y_train: Series, y_test: Series
+    ) -> tuple[ndarray, Optional[ndarray]]:
+        """Fit the model on a training set and predict the target values of the testing set.
+
+        The pre-processing and fitting time is kept in fit_time, the prediction time in predict_time. The BLAS and
+        OpenMP threads are limited to config.blas_threads.
+
+        Args:
+            x_train: DataFrame, training features.
+            x_test: DataFrame, testing features.
+            y_train: Series, training target.
+            y_test: Series, testing target.
 
         Returns:
             ndarray, of the prediction results.
 
         """
+        self.x_train, self.x_test, self.y_train, self.y_test = x_train, x_test, y_train, y_test
+
+        with blas_limits(blas_threads=self.config.blas_threads):
+            start = time.perf_counter()
+            x_train_to_use, x_test_to_use = self.pre_process_data(x_train=self.x_train, x_test=self.x_test)
+            with span("fit", rows=len(y_train)):
+                self.model.fit(X=x_train_to_use, y=self.y_train)
+            self.fit_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with span("predict", rows=len(x_test)):
+                prediction = self.model.predict(X=x_test_to_use)
+                probability = self.predict_probability(x=x_test_to_use)
+            self.predict_time = time.perf_counter() - start
+        return prediction, probability
+
+    def predict_probability(self, x: ndarray) -> Optional[ndarray]:
+        """Predict the class probabilities of the pre-processed features, None for models without probabilities.
+
+        Args:
+            x: ndarray, the pre-processed features.
+
+        Returns:
+            Optional[ndarray] of the predicted probabilities.
+
+        """
+        del x  # Argument is only used by classifiers.
+        return None
+
+    def cross_validate(self, n_folds: int = 5, n_jobs: Optional[int] = None) -> BaseMetricResult:
+        """Evaluate the pipeline with k-fold cross-validation, the folds are fitted in parallel.
+
+        The folds are stratified for classifiers. The data set is loaded once and handed to the workers of the
+        config.backend pool (as read-only memory maps for worker processes), every fold fits a fresh copy of the
+        pipeline with its share of the cores.
+
+        Args:
+            n_folds: Number of folds.
+            n_jobs: Optional number of cores, defaults to config.n_jobs.
+
+        Returns:
+            BaseMetricResult with the mean of every metric over the folds, and the per-fold values, standard
+            deviation and timings in its cross_validation field.
+
+        """
+        features, target = self.load_data_set()
+        features = features[self.config.features]
+        splitter_class = StratifiedKFold if is_classifier(self.model) else KFold
+        splitter = splitter_class(n_splits=n_folds, shuffle=True, random_state=self.config.random_state)
+
+        config = self.config if n_jobs is None else replace(self.config, n_jobs=n_jobs)
+        with parallel_pool(config=config, n_tasks=n_folds) as (parallel, fold_config):
+            outcomes = parallel(
+                delayed(fit_fold)(
+                    pipeline=self.fresh_copy(config=fold_config),
+                    features=features,
+                    target=target,
+                    train_index=train_index,
+                    test_index=test_index,
+                )
+                for train_index, test_index in splitter.split(X=features, y=target)
+            )
+        return aggregate_folds(
+            results=[result for result, _, _ in outcomes],
+            fit_time=[fit_time for _, fit_time, _ in outcomes],
+            predict_time=[predict_time for _, _, predict_time in outcomes],
+        )
+
+    def fresh_copy(self, config: Optional[PipelineConfig] = None) -> "BasePipeline":
+        """Create an unfitted copy of the pipeline, with the same config and estimator parameters but no data.
+
+        Args:
+            config: Optional PipelineConfig of the copy, e.g. with the n_jobs of a worker, defaults to the config of
+                the pipeline.
+
+        Returns:
+            The unfitted copy of the pipeline.
+
+        """
+        pipeline = type(self)(config=config or self.config)
+        pipeline.model = clone(self.model)
+        if config is not None:
+            set_estimator_n_jobs(estimator=pipeline.model, n_jobs=config.n_jobs)
+        return pipeline
+
+    def predict_batch(self, x: DataFrame) -> ndarray:
+        """Predict the target values of a batch of new data with the fitted model, without retraining.
+
+        Args:
+            x: DataFrame containing at least the configured features.
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+        check_is_fitted(estimator=self.model)
+        return predict_features(model=self.model, pre_processor=self.pre_processor, features=self.config.features, x=x)
+
+    def predict_stream(self, frames: Iterable[DataFrame]) -> Iterator[ndarray]:
+        """Predict the target values of a stream of batches of new data with the fitted model, without retraining.
+
+        Args:
+            frames: Iterable of DataFrames containing at least the configured features.
+
+        Returns:
+            Iterator of ndarray, of the prediction results of every batch.
+
+        """
+        for x in frames:
+            yield self.predict_batch(x=x)
 
     @abstractmethod
     def compute_metrics(self, prediction: ndarray, probability: Optional[ndarray] = None) -> BaseMetricResult:
@@ -126,3 +423,32 @@ class BasePipeline(ABC):
             BaseMetricResult, containing metric information.
 
         """
+
+
+def fit_fold(
+    pipeline: BasePipeline, features: DataFrame, target: Series, train_index: ndarray, test_index: ndarray
+) -> tuple[BaseMetricResult, float, float]:
+    """Fit a pipeline on one cross-validation fold and compute its metrics.
+
+    Args:
+        pipeline: The unfitted pipeline.
+        features: DataFrame of the features of the full data set.
+        target: Series of the target of the full data set.
+        train_index: ndarray of the positions of the training rows of the fold.
+        test_index: ndarray of the positions of the testing rows of the fold.
+
+    Returns:
+        The metrics, the fitting time and the prediction time of the fold.
+
+    """
+    prediction, probability = pipeline.fit_predict(
+        x_train=features.iloc[train_index],
+        x_test=features.iloc[test_index],
+        y_train=target.iloc[train_index],
+        y_test=target.iloc[test_index],
+    )
+    return (
+        pipeline.compute_metrics(prediction=prediction, probability=probability),
+        pipeline.fit_time,
+        pipeline.predict_time,
+    )
@@ -0,0 +1,68 @@
+"""Histogram Gradient Boosting Classifier Pipeline Module.
+
+This module implements a pipeline class for histogram-based gradient boosting classification, which bins the
+features once and fits its trees on the bins with multithreaded (OpenMP) histogram building, scaling to millions of
+rows. Categorical features (category dtype, e.g. with compact_dtypes or dtypes) are split on natively, and the
+boosting stops early once the loss on a held-out stratified validation fraction of the training set stops improving.
+"""
+
+from typing import Optional
+
+from numpy import ndarray
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.metric_factory import MetricFactory
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+
+
+class HistGradientBoostingClassifierPipeline(BasePipeline):
+    """Histogram Gradient Boosting Classifier Pipeline Class."""
+
+    keep_dtypes = True
+
+    def __init__(self, config: PipelineConfig) -> None:
+        """Initialize the Histogram Gradient Boosting Classifier Pipeline.
+
+        Args:
+            config: PipelineConfig, contains configuration information for a pipeline.
+
+        """
+        super().__init__(config=config)
+        self.model = HistGradientBoostingClassifier(
+            categorical_features="from_dtype",
+            early_stopping=True,
+            validation_fraction=0.1,
+            n_iter_no_change=10,
+            random_state=config.random_state,
+        )
+        self.metric_handler = MetricFactory.get_metrics_handler(model_type=ModelType.CLASSIFICATION)
+
+    def predict_probability(self, x: ndarray) -> Optional[ndarray]:
+        """Predict the class probabilities of the pre-processed features.
+
+        Args:
+            x: ndarray, the pre-processed features.
+
+        Returns:
+            Optional[ndarray] of the predicted probabilities.
+
+        """
+        return self.model.predict_proba(X=x)
+
+    def compute_metrics(self, prediction: ndarray, probability: Optional[ndarray] = None) -> BaseMetricResult:
+        """Compute the metrics of the given model.
+
+        Args:
+            prediction: ndarray, the prediction of the model.
+            probability: Optional[ndarray], used for probability in classification models.
+
+        Returns:
+            BaseMetricResult, containing metric information.
+
+        """
+        return self.metric_handler.compute_metrics(
+            y_true=self.y_test, y_pred=prediction, y_proba=probability, classes=self.model.classes_
+        )
@@ -31,22 +31,17 @@ class LogisticRegressionClassifierPipeline(BasePipeline):
         self.model = LogisticRegression(random_state=config.random_state, max_iter=1000)
         self.metric_handler = MetricFactory.get_metrics_handler(model_type=ModelType.CLASSIFICATION)
 
-    def predict(self) -> tuple[ndarray, Optional[ndarray]]:
-        """Predict the target values based on the features.
+    def predict_probability(self, x: ndarray) -> Optional[ndarray]:
+        """Predict the class probabilities of the pre-processed features.
+
+        Args:
+            x: ndarray, the pre-processed features.
 
         Returns:
-            ndarray, of the prediction results.
+            Optional[ndarray] of the predicted probabilities.
 
         """
-        features, target = self.load_data_set()
-        self.x_train, self.x_test, self.y_train, self.y_test = self.create_training_set(
-            features=features, target=target, test_size=0.3
-        )
-
-        x_train_to_use, x_test_to_use = self.pre_process_data(x_train=self.x_train, x_test=self.x_test)
-
-        self.model.fit(X=x_train_to_use, y=self.y_train)
-        return self.model.predict(X=x_test_to_use), self.model.predict_proba(X=x_test_to_use)
+        return self.model.predict_proba(X=x)
 
     def compute_metrics(self, prediction: ndarray, probability: Optional[ndarray] = None) -> BaseMetricResult:
         """Compute the metrics of the given model.
@@ -59,4 +54,6 @@ class LogisticRegressionClassifierPipeline(BasePipeline):
             BaseMetricResult, containing metric information.
 
         """
-        return self.metric_handler.compute_metrics(y_true=self.y_test, y_pred=prediction, y_proba=probability)
+        return self.metric_handler.compute_metrics(
+            y_true=self.y_test, y_pred=prediction, y_proba=probability, classes=self.model.classes_
+        )
@@ -0,0 +1,56 @@
+"""SGD Classifier Pipeline Module.
+
+This module implements an incremental pipeline class for stochastic gradient descent classification models.
+It trains out-of-core on batches streamed from the dataset, for tables that do not fit in memory.
+"""
+
+from typing import Optional
+
+from numpy import ndarray
+from pandas import Series
+from sklearn.linear_model import SGDClassifier
+
+from src.ml_pipeline_handler.metric.metric_factory import MetricFactory
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.incremental_pipeline import IncrementalPipeline
+
+
+class SGDClassifierPipeline(IncrementalPipeline):
+    """SGD Classifier Pipeline Class."""
+
+    def __init__(self, config: PipelineConfig) -> None:
+        """Initialize the SGD Classifier Pipeline.
+
+        Args:
+            config: PipelineConfig, contains configuration information for a pipeline.
+
+        """
+        super().__init__(config=config)
+        self.model = SGDClassifier(loss="log_loss", random_state=config.random_state)
+        self.metric_handler = MetricFactory.get_metrics_handler(model_type=ModelType.CLASSIFICATION)
+
+    def partial_fit_model(self, x: ndarray, y: Series) -> None:
+        """Update the classifier with one batch, declaring every class seen while fitting the scalers.
+
+        Args:
+            x: ndarray, the pre-processed batch of features.
+            y: Series, the batch of targets.
+
+        Returns:
+            None
+
+        """
+        self.model.partial_fit(X=x, y=y, classes=self.classes)
+
+    def predict_probability(self, x: ndarray) -> Optional[ndarray]:
+        """Predict the class probabilities of a batch.
+
+        Args:
+            x: ndarray, the pre-processed batch of features.
+
+        Returns:
+            Optional[ndarray] of the predicted probabilities.
+
+        """
+        return self.model.predict_proba(X=x)
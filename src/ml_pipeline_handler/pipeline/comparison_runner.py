@@ -0,0 +1,124 @@
+"""Comparison Runner Module.
+
+This module trains several algorithms on the same data and ranks them. The data set is loaded and split once, and
+the algorithms are fitted concurrently in the config.backend pool, sharing the config.n_jobs cores; the shared
+training and testing arrays are handed to worker processes as read-only memory maps instead of being copied into every
+worker.
+"""
+
+import time
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from joblib import delayed
+from loguru import logger
+from pandas import DataFrame, Series
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.parallelism import parallel_pool
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+@dataclass
+class ComparisonResult:
+    """Comparison Result Data Class."""
+
+    algorithm: AlgorithmType
+    metrics: Optional[BaseMetricResult]
+    wall_time: float
+    error: Optional[str] = None
+
+
+def _score(result: ComparisonResult) -> float:
+    """Rank a comparison result, lower is better.
+
+    Args:
+        result: The comparison result of one algorithm.
+
+    Returns:
+        The negated accuracy for classification, the negated R² for regression and infinity for failed runs.
+
+    """
+    if isinstance(result.metrics, ClassificationMetricResult):
+        return -result.metrics.accuracy
+    if isinstance(result.metrics, RegressionMetricResult):
+        return -result.metrics.r_square
+    return float("inf")
+
+
+def fit_and_score(
+    config: PipelineConfig, x_train: DataFrame, x_test: DataFrame, y_train: Series, y_test: Series
+) -> ComparisonResult:
+    """Fit the pipeline of a config on a shared training set and compute its metrics on the shared testing set.
+
+    Args:
+        config: PipelineConfig of the algorithm to fit.
+        x_train: DataFrame, training features.
+        x_test: DataFrame, testing features.
+        y_train: Series, training target.
+        y_test: Series, testing target.
+
+    Returns:
+        ComparisonResult with the metrics and the wall time of fitting, predicting and scoring, or the error.
+
+    """
+    start = time.perf_counter()
+    try:
+        pipeline = PipelineFactory.build_pipeline(config=config)
+        prediction, probability = pipeline.fit_predict(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test)
+        metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"Algorithm {config.algorithm} failed: {e!r}")
+        return ComparisonResult(
+            algorithm=config.algorithm, metrics=None, wall_time=time.perf_counter() - start, error=repr(e)
+        )
+    return ComparisonResult(algorithm=config.algorithm, metrics=metrics, wall_time=time.perf_counter() - start)
+
+
+def compare_algorithms(
+    config: PipelineConfig, algorithms: Optional[list[AlgorithmType]] = None, n_jobs: Optional[int] = None
+) -> list[ComparisonResult]:
+    """Fit several algorithms on one shared split of the data set and rank them.
+
+    Args:
+        config: PipelineConfig shared by every algorithm, its algorithm field is ignored.
+        algorithms: Optional list of algorithms to compare, defaults to every AlgorithmType.
+        n_jobs: Optional number of cores, defaults to config.n_jobs.
+
+    Returns:
+        Leaderboard of ComparisonResult, best first: classification results ranked by accuracy, regression results by
+        R² and failed runs last.
+
+    """
+    algorithms = algorithms or list(AlgorithmType)
+    loader = PipelineFactory.build_pipeline(config=replace(config, algorithm=algorithms[0]))
+
+    start = time.perf_counter()
+    features, target = loader.load_data_set()
+    x_train, x_test, y_train, y_test = loader.create_training_set(
+        features=features, target=target, test_size=loader.test_size
+    )
+    del features, target
+    logger.info(f"Loaded and split {config.data_path} once in {time.perf_counter() - start:.3f}s")
+
+    config = config if n_jobs is None else replace(config, n_jobs=n_jobs)
+    with parallel_pool(config=config, n_tasks=len(algorithms)) as (parallel, worker_config):
+        results = parallel(
+            delayed(fit_and_score)(
+                config=replace(worker_config, algorithm=AlgorithmType(algorithm)),
+                x_train=x_train,
+                x_test=x_test,
+                y_train=y_train,
+                y_test=y_test,
+            )
+            for algorithm in algorithms
+        )
+
+    leaderboard = sorted(results, key=_score)
+    for rank, result in enumerate(leaderboard, start=1):
+        logger.info(f"#{rank} {result.algorithm.value} ({result.wall_time:.3f}s): {result.metrics or result.error}")
+    return leaderboard
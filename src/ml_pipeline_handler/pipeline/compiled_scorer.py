@@ -0,0 +1,203 @@
+"""Compiled Scorer Module.
+
+This module compiles a fitted pre-processor and estimator into a low-latency scoring path for single rows. The fitted
+Standard, Robust and MinMax scalers are folded into one affine transform (a column selection, a scale and an offset
+vector), and linear estimators are further collapsed with it into a single dot product, so scoring one record skips
+the DataFrame handling, validation and dispatch of the ColumnTransformer and the estimator.
+"""
+
+import warnings
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import numpy as np
+from numpy import ndarray
+from sklearn.base import is_classifier
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+
+from src.ml_pipeline_handler.io.artifact import ModelArtifact
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.pipeline.incremental_pipeline import IncrementalPreProcessor
+
+
+def _scaler_affine(scaler: Any, n_columns: int) -> tuple[ndarray, ndarray]:  # noqa: ANN401
+    """Express a fitted scaler as x * scale + offset.
+
+    Args:
+        scaler: The fitted StandardScaler, RobustScaler or MinMaxScaler.
+        n_columns: The number of columns the scaler was fitted on.
+
+    Returns:
+        The scale and offset vectors of the scaler.
+
+    """
+    if isinstance(scaler, Pipeline):
+        if len(scaler.steps) != 1:
+            raise NotImplementedError(f"Only single step scaler pipelines can be compiled, got {scaler.steps}.")
+        scaler = scaler.steps[0][1]
+
+    ones, zeros = np.ones(n_columns), np.zeros(n_columns)
+    if isinstance(scaler, StandardScaler):
+        scale = ones if scaler.scale_ is None else 1 / scaler.scale_
+        return scale, zeros if scaler.mean_ is None else -scaler.mean_ * scale
+    if isinstance(scaler, RobustScaler):
+        scale = ones if scaler.scale_ is None else 1 / scaler.scale_
+        return scale, zeros if scaler.center_ is None else -scaler.center_ * scale
+    if isinstance(scaler, MinMaxScaler) and not scaler.clip:
+        return scaler.scale_, scaler.min_
+    raise NotImplementedError(f"Scaler {scaler} cannot be compiled into an affine transform.")
+
+
+def compile_pre_processor(pre_processor: Optional[Any], features: list[str]) -> tuple[ndarray, ndarray, ndarray]:  # noqa: ANN401
+    """Fold a fitted pre-processor into a column selection followed by an affine transform.
+
+    Args:
+        pre_processor: The fitted ColumnTransformer or IncrementalPreProcessor, None for raw features.
+        features: The features the pre-processor was fitted on, in input order.
+
+    Returns:
+        The indices of the input features feeding every output column, and the scale and offset of every output
+        column.
+
+    """
+    groups: list[tuple[Any, list[str]]] = []
+    if pre_processor is None:
+        groups.append(("passthrough", features))
+    elif isinstance(pre_processor, ColumnTransformer):
+        for _, transformer, columns in pre_processor.transformers_:
+            if transformer == "drop" or len(columns) == 0:
+                continue
+            groups.append(
+                (
+                    transformer,
+                    [features[column] if isinstance(column, (int, np.integer)) else column for column in columns],
+                )
+            )
+    elif isinstance(pre_processor, IncrementalPreProcessor):
+        scaled = [column for _, columns in pre_processor.scalers for column in columns]
+        groups.extend((scaler, columns) for scaler, columns in pre_processor.scalers)
+        groups.append(("passthrough", [feature for feature in features if feature not in scaled]))
+    else:
+        raise NotImplementedError(f"Pre-processor {pre_processor} cannot be compiled.")
+
+    source: list[int] = []
+    scale: list[ndarray] = []
+    offset: list[ndarray] = []
+    for transformer, columns in groups:
+        source.extend(features.index(column) for column in columns)
+        if transformer == "passthrough":
+            scale.append(np.ones(len(columns)))
+            offset.append(np.zeros(len(columns)))
+        else:
+            group_scale, group_offset = _scaler_affine(scaler=transformer, n_columns=len(columns))
+            scale.append(group_scale)
+            offset.append(group_offset)
+
+    return np.array(source, dtype=np.intp), np.concatenate(scale), np.concatenate(offset)
+
+
+class CompiledScorer:
+    """Compiled Scorer Class."""
+
+    def __init__(self, model: Any, pre_processor: Optional[Any], features: list[str]) -> None:  # noqa: ANN401
+        """Compile a fitted estimator and pre-processor.
+
+        Linear estimators (anything exposing coef_ and intercept_, e.g. LinearRegression, LogisticRegression and the
+        SGD models) are collapsed with the affine transform into one weight matrix over the input features. Other
+        estimators score the transformed row with their own predict.
+
+        Args:
+            model: The fitted estimator.
+            pre_processor: The fitted ColumnTransformer or IncrementalPreProcessor, None for raw features.
+            features: The features the model was trained on, in input order.
+
+        """
+        self.model = model
+        self.features = features
+        self.source, self.scale, self.offset = compile_pre_processor(pre_processor=pre_processor, features=features)
+        self.is_classifier = is_classifier(model)
+
+        self.weights: Optional[ndarray] = None
+        self.bias: Optional[ndarray] = None
+        if hasattr(model, "coef_") and hasattr(model, "intercept_"):
+            coef = np.atleast_2d(model.coef_)
+            self.weights = np.zeros(shape=(len(features), coef.shape[0]))
+            np.add.at(self.weights, self.source, (coef * self.scale).T)
+            self.bias = coef @ self.offset + np.atleast_1d(model.intercept_)
+
+    @classmethod
+    def from_pipeline(cls, pipeline: BasePipeline) -> "CompiledScorer":
+        """Compile a fitted pipeline.
+
+        Args:
+            pipeline: The fitted pipeline.
+
+        Returns:
+            The CompiledScorer of the pipeline.
+
+        """
+        return cls(model=pipeline.model, pre_processor=pipeline.pre_processor, features=pipeline.config.features)
+
+    @classmethod
+    def from_artifact(cls, artifact: ModelArtifact) -> "CompiledScorer":
+        """Compile a loaded model artifact.
+
+        Args:
+            artifact: The loaded model artifact.
+
+        Returns:
+            The CompiledScorer of the artifact.
+
+        """
+        return cls(model=artifact.model, pre_processor=artifact.pre_processor, features=artifact.features)
+
+    def to_array(self, row: Mapping[str, float] | ndarray) -> ndarray:
+        """Convert a record to an array of the features in training order.
+
+        Args:
+            row: A mapping of feature name to value, or the feature values in training order.
+
+        Returns:
+            ndarray of the feature values.
+
+        """
+        if isinstance(row, Mapping):
+            return np.fromiter((row[feature] for feature in self.features), dtype=np.float64, count=len(self.features))
+        return np.asarray(row, dtype=np.float64)
+
+    def predict(self, x: ndarray) -> ndarray:
+        """Predict the target values of a 2-D array of feature values in training order.
+
+        Args:
+            x: ndarray of shape (n_rows, n_features).
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+        if self.weights is not None and self.bias is not None:
+            decision = x @ self.weights + self.bias
+            if not self.is_classifier:
+                return decision[:, 0] if decision.shape[1] == 1 else decision
+            if decision.shape[1] == 1:
+                return self.model.classes_[(decision[:, 0] > 0).astype(np.intp)]
+            return self.model.classes_[decision.argmax(axis=1)]
+
+        with warnings.catch_warnings():
+            # The estimator may have been fitted on a DataFrame, the compiled path scores plain arrays.
+            warnings.filterwarnings(action="ignore", message="X does not have valid feature names")
+            return self.model.predict(x[:, self.source] * self.scale + self.offset)
+
+    def predict_one(self, row: Mapping[str, float] | ndarray) -> Any:  # noqa: ANN401
+        """Predict the target value of a single record.
+
+        Args:
+            row: A mapping of feature name to value, or the feature values in training order.
+
+        Returns:
+            The predicted value or class label.
+
+        """
+        return self.predict(x=self.to_array(row=row)[np.newaxis, :])[0]
@@ -0,0 +1,286 @@
+"""Incremental Pipeline module.
+
+This module implements a base pipeline for estimators that support partial_fit. The data is streamed from the CSV
+file in chunks, the scalers and the estimator are fitted batch by batch, so training never holds the full dataset in
+memory.
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Optional
+
+import numpy as np
+from numpy import ndarray
+from pandas import DataFrame, Series, concat
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.parallelism import blas_limits
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.telemetry.span import span
+
+
+class IncrementalPreProcessor:
+    """Incremental Pre-Processor Class.
+
+    Scales groups of columns with scalers fitted batch by batch and passes the unscaled columns through.
+    """
+
+    def __init__(self, scalers: list[tuple[StandardScaler | MinMaxScaler, list[str]]]) -> None:
+        """Initialize the pre-processor with unfitted scalers.
+
+        Args:
+            scalers: List of tuples of a scaler supporting partial_fit and the columns it scales.
+
+        """
+        self.scalers = scalers
+
+    def partial_fit(self, x: DataFrame) -> None:
+        """Update the scalers with one batch.
+
+        Args:
+            x: DataFrame, a batch of features.
+
+        Returns:
+            None
+
+        """
+        for scaler, columns in self.scalers:
+            scaler.partial_fit(X=x[columns])
+
+    def transform(self, x: DataFrame) -> ndarray:
+        """Transform a batch with the fitted scalers, passing the unscaled features through.
+
+        Args:
+            x: DataFrame, a batch of features.
+
+        Returns:
+            ndarray of the scaled features followed by the unscaled features.
+
+        """
+        if not self.scalers:
+            return x.to_numpy()
+
+        scaled = [column for _, columns in self.scalers for column in columns]
+        remainder = [column for column in x.columns if column not in scaled]
+        return np.hstack(
+            [scaler.transform(X=x[columns]) for scaler, columns in self.scalers] + [x[remainder].to_numpy()]
+        )
+
+
+class IncrementalPipeline(BasePipeline):
+    """Incremental Pipeline Class.
+
+    Concrete pipelines set `model` to an estimator supporting partial_fit and `metric_handler` to the matching
+    metric handler.
+    """
+
+    n_epochs: int = 5
+
+    def __init__(self, config: PipelineConfig) -> None:
+        """Initialize any Incremental Pipeline.
+
+        Args:
+            config: PipelineConfig, contains configuration information for a pipeline.
+
+        """
+        super().__init__(config=config)
+        self.metric_handler: Any = None
+        self.pre_processor: Optional[IncrementalPreProcessor] = None
+        self.classes: Optional[ndarray] = None
+
+    def get_incremental_pre_processor(self) -> IncrementalPreProcessor:
+        """Assemble an IncrementalPreProcessor based on the pipeline config.
+
+        Returns:
+            IncrementalPreProcessor with unfitted scalers.
+
+        Raises:
+            ValueError: If a RobustScaler is configured, its quantiles cannot be computed incrementally.
+
+        """
+        if self.config.scale_robust:
+            raise ValueError(
+                f"RobustScaler cannot be fitted incrementally, scale {self.config.scale_robust} with scale_standard or "
+                f"scale_minmax instead."
+            )
+
+        scalers: list[tuple[StandardScaler | MinMaxScaler, list[str]]] = []
+        if self.config.scale_standard:
+            scalers.append((StandardScaler(), self.config.scale_standard))
+        if self.config.scale_minmax:
+            scalers.append((MinMaxScaler(), self.config.scale_minmax))
+        return IncrementalPreProcessor(scalers=scalers)
+
+    def fit_pre_processor(self, batches: Iterable[tuple[DataFrame, Series]]) -> IncrementalPreProcessor:
+        """Fit the scalers on the training batches and collect the target classes in a single pass.
+
+        Args:
+            batches: Iterable of tuples of the features and target of every training batch.
+
+        Returns:
+            The fitted IncrementalPreProcessor.
+
+        """
+        pre_processor = self.get_incremental_pre_processor()
+        classes: set[Any] = set()
+
+        for x_train, y_train in batches:
+            if x_train.empty:
+                continue
+            pre_processor.partial_fit(x=x_train)
+            classes.update(y_train.unique())
+
+        self.pre_processor = pre_processor
+        self.classes = np.array(sorted(classes))
+        return pre_processor
+
+    def partial_fit_model(self, x: ndarray, y: Series) -> None:
+        """Update the estimator with one batch.
+
+        Args:
+            x: ndarray, the pre-processed batch of features.
+            y: Series, the batch of targets.
+
+        Returns:
+            None
+
+        """
+        self.model.partial_fit(X=x, y=y)
+
+    def fit_batches(self, batches: Callable[[], Iterable[tuple[DataFrame, Series]]]) -> IncrementalPreProcessor:
+        """Fit the scalers in a first pass over the training batches, then the model in n_epochs passes.
+
+        Args:
+            batches: Callable returning a new iterable over the features and target of every training batch.
+
+        Returns:
+            The fitted IncrementalPreProcessor.
+
+        """
+        pre_processor = self.fit_pre_processor(batches=batches())
+
+        for _ in range(self.n_epochs):
+            for x_train, y_train in batches():
+                if not x_train.empty:
+                    self.partial_fit_model(x=pre_processor.transform(x=x_train), y=y_train)
+
+        return pre_processor
+
+    def predict_batches(
+        self, pre_processor: IncrementalPreProcessor, batches: Iterable[tuple[DataFrame, Series]]
+    ) -> tuple[ndarray, Optional[ndarray]]:
+        """Predict the target values of the testing batches, keeping their target as y_test.
+
+        Args:
+            pre_processor: The fitted IncrementalPreProcessor.
+            batches: Iterable of tuples of the features and target of every testing batch.
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+        predictions: list[ndarray] = []
+        probabilities: list[ndarray] = []
+        targets: list[Series] = []
+        for x_test, y_test in batches:
+            if x_test.empty:
+                continue
+            x_test_to_use = pre_processor.transform(x=x_test)
+            predictions.append(self.model.predict(X=x_test_to_use))
+            probability = self.predict_probability(x=x_test_to_use)
+            if probability is not None:
+                probabilities.append(probability)
+            targets.append(y_test)
+
+        self.y_test = concat(targets)
+        return np.concatenate(predictions), np.concatenate(probabilities) if probabilities else None
+
+    def predict(self) -> tuple[ndarray, Optional[ndarray]]:
+        """Train the model on batches streamed from the data set and predict the target values of the test batches.
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+
+        def train_batches() -> Iterator[tuple[DataFrame, Series]]:
+            for x_train, _, y_train, _ in self.stream_data_set(
+                chunk_size=self.config.chunk_size, test_size=self.test_size
+            ):
+                yield x_train, y_train
+
+        with (
+            blas_limits(blas_threads=self.config.blas_threads),
+            span("pipeline", algorithm=AlgorithmType(self.config.algorithm).value),
+        ):
+            with span("fit"):
+                pre_processor = self.fit_batches(batches=train_batches)
+            test_batches = (
+                (x_test, y_test)
+                for _, x_test, _, y_test in self.stream_data_set(
+                    chunk_size=self.config.chunk_size, test_size=self.test_size
+                )
+            )
+            with span("predict") as stage:
+                prediction, probability = self.predict_batches(pre_processor=pre_processor, batches=test_batches)
+                stage.set_rows(rows=len(prediction))
+        return prediction, probability
+
+    def fit_predict(
+        self, x_train: DataFrame, x_test: DataFrame, y_train: Series, y_test: Series
+    ) -> tuple[ndarray, Optional[ndarray]]:
+        """Train the model on chunk_size batches of an in-memory training set and predict the testing set.
+
+        The fitting time is kept in fit_time, the prediction time in predict_time. The BLAS and OpenMP threads are
+        limited to config.blas_threads.
+
+        Args:
+            x_train: DataFrame, training features.
+            x_test: DataFrame, testing features.
+            y_train: Series, training target.
+            y_test: Series, testing target.
+
+        Returns:
+            ndarray, of the prediction results.
+
+        """
+        self.x_train, self.x_test, self.y_train = x_train, x_test, y_train
+        chunk_size = self.config.chunk_size
+
+        def train_batches() -> Iterator[tuple[DataFrame, Series]]:
+            for offset in range(0, len(x_train), chunk_size):
+                yield x_train.iloc[offset : offset + chunk_size], y_train.iloc[offset : offset + chunk_size]
+
+        with blas_limits(blas_threads=self.config.blas_threads):
+            start = time.perf_counter()
+            with span("fit", rows=len(y_train)):
+                pre_processor = self.fit_batches(batches=train_batches)
+            self.fit_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            test_batches = (
+                (x_test.iloc[offset : offset + chunk_size], y_test.iloc[offset : offset + chunk_size])
+                for offset in range(0, len(x_test), chunk_size)
+            )
+            with span("predict", rows=len(x_test)):
+                prediction, probability = self.predict_batches(pre_processor=pre_processor, batches=test_batches)
+            self.predict_time = time.perf_counter() - start
+        return prediction, probability
+
+    def compute_metrics(self, prediction: ndarray, probability: Optional[ndarray] = None) -> BaseMetricResult:
+        """Compute the metrics of the given model.
+
+        Args:
+            prediction: ndarray, the prediction of the model.
+            probability: Optional[ndarray], used for probability in classification models.
+
+        Returns:
+            BaseMetricResult, containing metric information.
+
+        """
+        return self.metric_handler.compute_metrics(
+            y_true=self.y_test, y_pred=prediction, y_proba=probability, classes=getattr(self.model, "classes_", None)
+        )
@@ -0,0 +1,219 @@
+"""Learning Curve Module.
+
+This module measures how the metrics of an algorithm grow with the size of its training set. The data set is loaded,
+split and pre-processed once (the scalers are fitted on the full training set), the training rows are shuffled once
+and the model is fitted on nested prefixes of the shuffled rows, every prefix scored on the same testing set.
+
+The training sizes are fitted in parallel in the config.backend pool, sharing the config.n_jobs cores, and worker
+processes receive the shuffled arrays as read-only memory maps. Estimators whose warm start reuses their previous
+solution as a starting point (the iterative linear solvers) fit the sizes in one chain instead, every size starting
+from the coefficients of the previous one. Ensembles are refitted from scratch: their warm start keeps the trees (and
+the bins, for histogram gradient boosting) fitted on the smaller prefixes, which is not the model of the larger size.
+"""
+
+import time
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import numpy as np
+from joblib import delayed
+from loguru import logger
+from numpy import ndarray
+from pandas import DataFrame, Series
+from sklearn.base import is_classifier
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.parallelism import blas_limits, parallel_pool
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.pipeline.stage_cache import PreparedData, get_stage_cache, stage_key
+from src.ml_pipeline_handler.telemetry.span import span
+
+DEFAULT_FRACTIONS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0)
+# Algorithms whose warm start initializes the solver with the previous coefficients.
+WARM_START_ALGORITHMS = frozenset(
+    {AlgorithmType.LOGISTIC_REGRESSION, AlgorithmType.SGD_CLASSIFIER, AlgorithmType.SGD_REGRESSOR}
+)
+
+
+@dataclass
+class LearningCurvePoint:
+    """Learning Curve Point Data Class, the metrics of the model fitted on one training size."""
+
+    fraction: float
+    n_rows: int
+    metrics: Optional[BaseMetricResult]
+    fit_time: float
+    predict_time: float
+    warm_start: bool = False
+    error: Optional[str] = None
+
+
+def training_sizes(fractions: list[float], n_rows: int) -> list[tuple[float, int]]:
+    """Compute the number of training rows of every fraction of the training set.
+
+    Args:
+        fractions: The fractions of the training set, in (0, 1].
+        n_rows: The number of rows of the full training set.
+
+    Returns:
+        List of the fraction and number of rows (at least one) of every distinct size, smallest first.
+
+    Raises:
+        ValueError: If a fraction is not in (0, 1].
+
+    """
+    invalid = [fraction for fraction in fractions if not 0 < fraction <= 1]
+    if invalid:
+        raise ValueError(f"Training fractions {invalid} are not in (0, 1].")
+    sizes = {max(round(fraction * n_rows), 1): fraction for fraction in sorted(fractions, reverse=True)}
+    return sorted(((fraction, size) for size, fraction in sizes.items()), key=lambda item: item[1])
+
+
+def shuffled_order(target: Series, *, classification: bool, random_state: int) -> ndarray:
+    """Shuffle the positions of the training rows so that every prefix is a random subset of the training set.
+
+    Classification rows are interleaved by class, so that every prefix keeps the class shares of the training set.
+
+    Args:
+        target: Series of the training target.
+        classification: Whether the target is a class.
+        random_state: int, seed of the shuffle.
+
+    Returns:
+        ndarray of the shuffled row positions.
+
+    """
+    rng = np.random.default_rng(seed=random_state)
+    if not classification:
+        return rng.permutation(len(target))
+
+    # The k-th row of a class of n rows is placed at (k + u) / n, u uniform, of the order.
+    ranks = target.groupby(target.to_numpy()).cumcount().to_numpy()
+    counts = target.map(target.value_counts()).to_numpy()
+    order = rng.permutation(len(target))
+    keys = (ranks[order] + rng.random(len(target))) / counts[order]
+    return order[np.argsort(keys, kind="stable")]
+
+
+def fit_sizes(
+    pipeline: BasePipeline,
+    x_train: ndarray | DataFrame,
+    x_test: ndarray | DataFrame,
+    y_train: Series,
+    y_test: Series,
+    *,
+    sizes: list[tuple[float, int]],
+    warm_start: bool,
+) -> list[LearningCurvePoint]:
+    """Fit the estimator of a pipeline on the first rows of the shuffled training set for every size.
+
+    Args:
+        pipeline: The unfitted pipeline, its estimator is fitted and its metric handler computes the metrics.
+        x_train: The pre-processed and shuffled training features.
+        x_test: The pre-processed testing features.
+        y_train: Series, the shuffled training target.
+        y_test: Series, the testing target.
+        sizes: List of the fraction and number of rows of every size, smallest first.
+        warm_start: Whether every size starts from the solution of the previous one.
+
+    Returns:
+        List of the LearningCurvePoint of every size, with the error of the sizes that failed.
+
+    """
+    if warm_start:
+        pipeline.model.set_params(warm_start=True)
+
+    points = []
+    with blas_limits(blas_threads=pipeline.config.blas_threads):
+        for fraction, n_rows in sizes:
+            point = LearningCurvePoint(
+                fraction=fraction, n_rows=n_rows, metrics=None, fit_time=0.0, predict_time=0.0, warm_start=warm_start
+            )
+            try:
+                start = time.perf_counter()
+                with span("fit", rows=n_rows):
+                    pipeline.model.fit(X=x_train[:n_rows], y=y_train.iloc[:n_rows])
+                point.fit_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                with span("predict", rows=len(y_test)):
+                    prediction = pipeline.model.predict(X=x_test)
+                    probability = pipeline.predict_probability(x=x_test)
+                point.predict_time = time.perf_counter() - start
+                point.metrics = pipeline.metric_handler.compute_metrics(
+                    y_true=y_test,
+                    y_pred=prediction,
+                    y_proba=probability,
+                    classes=getattr(pipeline.model, "classes_", None),
+                )
+            except (ValueError, TypeError) as e:
+                logger.error(f"Fitting {n_rows} rows failed: {e!r}")
+                point.error = repr(e)
+            points.append(point)
+    return points
+
+
+def learning_curve(
+    config: PipelineConfig, fractions: Optional[list[float]] = None, n_jobs: Optional[int] = None
+) -> list[LearningCurvePoint]:
+    """Fit the algorithm of a config on growing nested prefixes of the training set and score every size.
+
+    With cache_stages set, the split and the fitted pre-processor are reused from the stage cache.
+
+    Args:
+        config: PipelineConfig of the algorithm.
+        fractions: Optional list of the fractions of the training set to fit on, defaults to DEFAULT_FRACTIONS.
+        n_jobs: Optional number of cores, defaults to config.n_jobs.
+
+    Returns:
+        List of the LearningCurvePoint of every training size, smallest first. The fit time of warm started sizes is
+        the time of continuing from the previous size.
+
+    """
+    pipeline = PipelineFactory.build_pipeline(config=config)
+
+    start = time.perf_counter()
+    prepared: PreparedData
+    if config.cache_stages:
+        prepared = get_stage_cache(cache_dir=config.stage_cache_dir).get_or_compute(
+            key=stage_key(config=config, test_size=pipeline.test_size, keep_dtypes=pipeline.keep_dtypes),
+            compute=lambda: pipeline.prepare_data(test_size=pipeline.test_size),
+        )
+    else:
+        prepared = pipeline.prepare_data(test_size=pipeline.test_size)
+    x_train, x_test = prepared.pre_processed()
+    order = shuffled_order(
+        target=prepared.y_train, classification=is_classifier(pipeline.model), random_state=config.random_state
+    )
+    x_train = x_train.iloc[order] if isinstance(x_train, DataFrame) else x_train[order]
+    y_train = prepared.y_train.iloc[order]
+    sizes = training_sizes(fractions=list(fractions or DEFAULT_FRACTIONS), n_rows=len(y_train))
+    logger.info(f"Loaded, split and pre-processed {config.data_path} once in {time.perf_counter() - start:.3f}s")
+
+    warm_start = AlgorithmType(config.algorithm) in WARM_START_ALGORITHMS
+    tasks = [sizes] if warm_start else [[size] for size in sizes]
+    config = config if n_jobs is None else replace(config, n_jobs=n_jobs)
+    with parallel_pool(config=config, n_tasks=len(tasks)) as (parallel, worker_config):
+        results = parallel(
+            delayed(fit_sizes)(
+                pipeline=pipeline.fresh_copy(config=worker_config),
+                x_train=x_train,
+                x_test=x_test,
+                y_train=y_train,
+                y_test=prepared.y_test,
+                sizes=task,
+                warm_start=warm_start,
+            )
+            for task in tasks
+        )
+
+    points = [point for task_points in results for point in task_points]
+    for point in points:
+        logger.info(
+            f"{point.n_rows} rows ({point.fraction:.0%}): fit {point.fit_time:.3f}s, predict {point.predict_time:.3f}s"
+            f"{' (warm start)' if point.warm_start else ''}: {point.metrics or point.error}"
+        )
+    return points
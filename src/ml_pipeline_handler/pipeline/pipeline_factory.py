@@ -2,23 +2,52 @@
 
 This module implements a factory class for constructing specific pipelines
 based on the provided configuration. The pipelines support algorithms such as
-linear regression, classification(logistic regression and random forest), and
-regression using decision trees.
+linear regression, classification(logistic regression and random forest),
+regression using decision trees, histogram gradient boosting, and incremental
+(out-of-core) SGD models.
+The pipeline classes are registered by module path and imported only when their
+algorithm is built.
 """
 
+from importlib import import_module
+
 from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.parallelism import set_estimator_n_jobs
 from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
 from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
-from src.ml_pipeline_handler.pipeline.classification.decision_tree_classifier_pipeline import (
-    DecisionTreeClassifierPipeline,
-)
-from src.ml_pipeline_handler.pipeline.classification.logistic_regression_classifier_pipeline import (
-    LogisticRegressionClassifierPipeline,
-)
-from src.ml_pipeline_handler.pipeline.classification.random_forest_pipeline import RandomForestClassifierPipeline
-from src.ml_pipeline_handler.pipeline.regression.decision_tree_regressor_pipeline import DecisionTreeRegressorPipeline
-from src.ml_pipeline_handler.pipeline.regression.linear_regression_pipeline import LinearRegressionPipeline
-from src.ml_pipeline_handler.pipeline.regression.random_forest_regressor_pipeline import RandomForestRegressorPipeline
+
+# Module (relative to this package) and class of the pipeline of every algorithm. A pipeline module is imported when
+# its algorithm is first built, so importing the factory does not import the estimators of every algorithm.
+PIPELINE_REGISTRY: dict[AlgorithmType, tuple[str, str]] = {
+    AlgorithmType.LINEAR_REGRESSION: ("regression.linear_regression_pipeline", "LinearRegressionPipeline"),
+    AlgorithmType.LOGISTIC_REGRESSION: (
+        "classification.logistic_regression_classifier_pipeline",
+        "LogisticRegressionClassifierPipeline",
+    ),
+    AlgorithmType.DECISION_TREE_CLASSIFIER: (
+        "classification.decision_tree_classifier_pipeline",
+        "DecisionTreeClassifierPipeline",
+    ),
+    AlgorithmType.RANDOM_FOREST: ("classification.random_forest_pipeline", "RandomForestClassifierPipeline"),
+    AlgorithmType.DECISION_TREE_REGRESSOR: (
+        "regression.decision_tree_regressor_pipeline",
+        "DecisionTreeRegressorPipeline",
+    ),
+    AlgorithmType.RANDOM_FOREST_REGRESSOR: (
+        "regression.random_forest_regressor_pipeline",
+        "RandomForestRegressorPipeline",
+    ),
+    AlgorithmType.SGD_REGRESSOR: ("regression.sgd_regressor_pipeline", "SGDRegressorPipeline"),
+    AlgorithmType.SGD_CLASSIFIER: ("classification.sgd_classifier_pipeline", "SGDClassifierPipeline"),
+    AlgorithmType.HIST_GRADIENT_BOOSTING_REGRESSOR: (
+        "regression.hist_gradient_boosting_regressor_pipeline",
+        "HistGradientBoostingRegressorPipeline",
+    ),
+    AlgorithmType.HIST_GRADIENT_BOOSTING_CLASSIFIER: (
+        "classification.hist_gradient_boosting_classifier_pipeline",
+        "HistGradientBoostingClassifierPipeline",
+    ),
+}
 
 
 class PipelineFactory:
@@ -26,7 +55,24 @@ class PipelineFactory:
 
     @classmethod
     def build_pipeline(cls, config: PipelineConfig) -> BasePipeline:
-        """Build a pipeline based on the configuration.
+        """Build a pipeline based on the configuration, with the n_jobs and model_params of the config on its estimator.
+
+        Args:
+            config: PipelineConfig, contains configuration information for a pipeline.
+
+        Returns:
+            BasePipeline object that contains a specific model type.
+
+        """
+        pipeline = cls.create_pipeline(config=config)
+        set_estimator_n_jobs(estimator=pipeline.model, n_jobs=config.n_jobs)
+        if config.model_params:
+            pipeline.model.set_params(**config.model_params)
+        return pipeline
+
+    @classmethod
+    def create_pipeline(cls, config: PipelineConfig) -> BasePipeline:
+        """Create the pipeline of the configured algorithm, with its default estimator.
 
         Args:
             config: PipelineConfig, contains configuration information for a pipeline.
@@ -34,21 +80,26 @@ class PipelineFactory:
         Returns:
             BasePipeline object that contains a specific model type.
 
+        """
+        return cls.get_pipeline_class(algorithm=config.algorithm)(config=config)
+
+    @classmethod
+    def get_pipeline_class(cls, algorithm: AlgorithmType | str) -> type[BasePipeline]:
+        """Import the pipeline class of an algorithm from the registry.
+
+        Args:
+            algorithm: The algorithm, or its name.
+
+        Returns:
+            The BasePipeline subclass of the algorithm.
+
         Raises:
             NotImplementedError: If the specified algorithm is not supported.
 
         """
-        if config.algorithm == AlgorithmType.LINEAR_REGRESSION:
-            return LinearRegressionPipeline(config=config)
-        if config.algorithm == AlgorithmType.DECISION_TREE_CLASSIFIER:
-            return DecisionTreeClassifierPipeline(config=config)
-        if config.algorithm == AlgorithmType.RANDOM_FOREST:
-            return RandomForestClassifierPipeline(config=config)
-        if config.algorithm == AlgorithmType.LOGISTIC_REGRESSION:
-            return LogisticRegressionClassifierPipeline(config=config)
-        if config.algorithm == AlgorithmType.DECISION_TREE_REGRESSOR:
-            return DecisionTreeRegressorPipeline(config=config)
-        if config.algorithm == AlgorithmType.RANDOM_FOREST_REGRESSOR:
-            return RandomForestRegressorPipeline(config=config)
-
-        raise NotImplementedError(f"Algorithm '{config.algorithm}' is not implemented.")
+        try:
+            module_name, class_name = PIPELINE_REGISTRY[AlgorithmType(algorithm)]
+        except (ValueError, KeyError):
+            raise NotImplementedError(f"Algorithm '{algorithm}' is not implemented.") from None
+        pipeline_class: type[BasePipeline] = getattr(import_module(f"{__package__}.{module_name}"), class_name)
+        return pipeline_class
@@ -31,23 +31,6 @@ class DecisionTreeRegressorPipeline(BasePipeline):
         self.model = DecisionTreeRegressor(random_state=config.random_state)
         self.metric_handler = MetricFactory.get_metrics_handler(model_type=ModelType.REGRESSION)
 
-    def predict(self) -> tuple[ndarray, Optional[ndarray]]:
-        """Predict the target values based on the features.
-
-        Returns:
-            ndarray, of the prediction results.
-
-        """
-        features, target = self.load_data_set()
-        self.x_train, self.x_test, self.y_train, self.y_test = self.create_training_set(
-            features=features, target=target, test_size=0.3
-        )
-
-        x_train_to_use, x_test_to_use = self.pre_process_data(x_train=self.x_train, x_test=self.x_test)
-
-        self.model.fit(X=x_train_to_use, y=self.y_train)
-        return self.model.predict(X=x_test_to_use), None
-
     def compute_metrics(self, prediction: ndarray, probability: Optional[ndarray] = None) -> BaseMetricResult:
         """Compute the metrics of the given model.
 
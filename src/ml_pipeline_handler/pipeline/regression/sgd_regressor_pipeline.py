@@ -0,0 +1,27 @@
+"""SGD Regressor Pipeline Module.
+
+This module implements an incremental pipeline class for stochastic gradient descent regression models.
+It trains out-of-core on batches streamed from the dataset, for tables that do not fit in memory.
+"""
+
+from sklearn.linear_model import SGDRegressor
+
+from src.ml_pipeline_handler.metric.metric_factory import MetricFactory
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.incremental_pipeline import IncrementalPipeline
+
+
+class SGDRegressorPipeline(IncrementalPipeline):
+    """SGD Regressor Pipeline Class."""
+
+    def __init__(self, config: PipelineConfig) -> None:
+        """Initialize the SGD Regressor Pipeline.
+
+        Args:
+            config: PipelineConfig, contains configuration information for a pipeline.
+
+        """
+        super().__init__(config=config)
+        self.model = SGDRegressor(random_state=config.random_state)
+        self.metric_handler = MetricFactory.get_metrics_handler(model_type=ModelType.REGRESSION)
@@ -0,0 +1,150 @@
+"""Forest Retraining Module.
+
+This module retrains a saved random forest on new data instead of refitting it on the whole history: the slim model
+artifact is loaded, its oldest trees are optionally dropped (a sliding window over the data batches) and new trees are
+fitted on the new data with warm_start, then the updated forest is scored on a held-out split of the new data and saved
+as a new artifact.
+
+The saved pre-processor is applied to the new data as is, without refitting or updating it: the split thresholds of
+the kept trees are expressed in its scaled feature space, so moving the scalers would shift the inputs of every kept
+tree, and trees do not depend on the scale of their features, so the new trees lose nothing by sharing it.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+import numpy as np
+from loguru import logger
+from sklearn.base import is_classifier
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.io.artifact import ModelArtifact
+from src.ml_pipeline_handler.io.saver import save_artifact
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.parallelism import set_estimator_n_jobs
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.pipeline.stage_cache import PreparedData
+from src.ml_pipeline_handler.telemetry.span import span
+
+FOREST_ALGORITHMS = frozenset({AlgorithmType.RANDOM_FOREST, AlgorithmType.RANDOM_FOREST_REGRESSOR})
+
+
+@dataclass
+class RetrainResult:
+    """Retrain Result Data Class."""
+
+    pipeline: BasePipeline
+    metrics: BaseMetricResult
+    n_trees_dropped: int
+    n_trees_added: int
+
+
+def artifact_config(artifact: ModelArtifact, **overrides: Any) -> PipelineConfig:  # noqa: ANN401
+    """Rebuild the PipelineConfig a model artifact was trained with.
+
+    Args:
+        artifact: The model artifact, its config metadata holds the fields of the PipelineConfig.
+        overrides: Fields to change, e.g. the data_path of the new data and the out_file of the new artifact.
+
+    Returns:
+        The PipelineConfig of the artifact, with the overridden fields. Fields missing from older artifacts keep their
+        defaults.
+
+    """
+    names = {config_field.name for config_field in fields(PipelineConfig)}
+    config = {name: value for name, value in artifact.config.items() if name in names}
+    return PipelineConfig(**{**config, "algorithm": AlgorithmType(artifact.algorithm), **overrides})
+
+
+def forest_seed(trees: list[Any]) -> int:
+    """Derive the random_state of a warm started forest from the seeds of the trees it keeps.
+
+    A warm start seeds the new trees with the draws of random_state that follow the draws of the kept trees. Once the
+    oldest trees are dropped, these draws are the seeds of kept trees again, so every retraining would repeat the
+    bootstrap and feature draws of the trees it keeps. The kept trees change with every retraining, and so does the
+    derived seed.
+
+    Args:
+        trees: The fitted trees kept in the forest.
+
+    Returns:
+        The seed of the forest, in [0, 2**32).
+
+    """
+    entropy = [tree.random_state for tree in trees]
+    return int(np.random.SeedSequence(entropy=entropy).generate_state(n_words=1)[0])
+
+
+def retrain_forest(
+    artifact: ModelArtifact, config: PipelineConfig, *, n_new_trees: int, drop_oldest: int = 0
+) -> RetrainResult:
+    """Add trees fitted on new data to the forest of a model artifact, replacing its oldest trees if requested.
+
+    The new data set is split like any training run: the new trees are fitted on its training set, the updated forest
+    is scored on its testing set and saved with save_artifact to config.out_file.
+
+    Args:
+        artifact: The model artifact of a random forest pipeline.
+        config: PipelineConfig of the new data, usually artifact_config of the artifact with a new data_path.
+        n_new_trees: Number of trees fitted on the new data.
+        drop_oldest: Number of the oldest trees of the forest to drop before adding the new ones.
+
+    Returns:
+        RetrainResult with the updated pipeline and its metrics on the testing set of the new data.
+
+    Raises:
+        ValueError: If the artifact is not a random forest, the numbers of trees are invalid or the new data of a
+            classifier does not have the classes of the forest.
+
+    """
+    if AlgorithmType(artifact.algorithm) not in FOREST_ALGORITHMS:
+        raise ValueError(f"Algorithm '{artifact.algorithm}' is not a random forest, it cannot be warm started.")
+    forest = artifact.model
+    if n_new_trees < 1 or not 0 <= drop_oldest < len(forest.estimators_):
+        raise ValueError(
+            f"Cannot add {n_new_trees} tree(s) and drop {drop_oldest} of the {len(forest.estimators_)} trees, at "
+            f"least one tree must be added and one kept."
+        )
+
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    pipeline.model = forest
+    set_estimator_n_jobs(estimator=forest, n_jobs=config.n_jobs)
+
+    features, target = pipeline.load_data_set()
+    x_train, x_test, y_train, y_test = pipeline.create_training_set(
+        features=features, target=target, test_size=pipeline.test_size
+    )
+    if is_classifier(forest) and set(y_train.unique()) != set(forest.classes_):
+        raise ValueError(
+            f"The training set of the new data has the classes {sorted(y_train.unique())}, the forest was trained on "
+            f"{forest.classes_.tolist()}: the trees of a forest must share their classes."
+        )
+
+    # fit_predict reuses the prepared split and pre-processor instead of fitting a new pre-processor.
+    pipeline.prepared = PreparedData(
+        x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test, pre_processor=artifact.pre_processor
+    )
+    if artifact.pre_processor is not None:
+        with span("pre_process", rows=len(x_train) + len(x_test)):
+            pipeline.prepared.x_train_pre_processed = artifact.pre_processor.transform(x_train)
+            pipeline.prepared.x_test_pre_processed = artifact.pre_processor.transform(x_test)
+
+    # The trees are kept in fitting order, the oldest first.
+    forest.estimators_ = forest.estimators_[drop_oldest:]
+    forest.set_params(
+        warm_start=True,
+        n_estimators=len(forest.estimators_) + n_new_trees,
+        random_state=forest_seed(trees=forest.estimators_),
+    )
+    prediction, probability = pipeline.fit_predict(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test)
+    forest.set_params(warm_start=False)
+    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+    logger.info(
+        f"Dropped {drop_oldest} and added {n_new_trees} tree(s) fitted on {len(y_train)} rows of {config.data_path} "
+        f"in {pipeline.fit_time:.3f}s, the forest has {len(forest.estimators_)} trees, testing metrics: {metrics}"
+    )
+
+    save_artifact(model=pipeline, file_name=config.out_file)
+    return RetrainResult(pipeline=pipeline, metrics=metrics, n_trees_dropped=drop_oldest, n_trees_added=n_new_trees)
@@ -0,0 +1,196 @@
+"""Stage Cache Module.
+
+This module memoizes the split-and-preprocess stage shared by the pipelines. The stage output (the train/test split,
+the fitted ColumnTransformer and the transformed arrays) only depends on the data set, the features, the scalers, the
+test size and the random state, so pipelines sharing these settings reuse it instead of splitting the data and fitting
+the scalers again. Entries are kept in an in-memory LRU and, when a directory is given, in an LRU of pickle files on
+disk that later processes can reuse.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+from numpy import ndarray
+from pandas import DataFrame, Series
+from sklearn.compose import ColumnTransformer
+
+from src.ml_pipeline_handler.io.cache import fingerprint
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+
+
+@dataclass
+class PreparedData:
+    """Prepared Data Class, the output of the split-and-preprocess stage."""
+
+    x_train: DataFrame
+    x_test: DataFrame
+    y_train: Series
+    y_test: Series
+    x_train_pre_processed: Optional[ndarray] = None
+    x_test_pre_processed: Optional[ndarray] = None
+    pre_processor: Optional[ColumnTransformer] = None
+
+    def pre_processed(self) -> tuple[ndarray, ndarray]:
+        """Return the features to train and test on.
+
+        Returns:
+            The transformed x_train, x_test when the stage has a pre-processor, else the raw x_train, x_test.
+
+        """
+        if self.pre_processor is None:
+            return self.x_train, self.x_test  # type: ignore[return-value]
+        return self.x_train_pre_processed, self.x_test_pre_processed  # type: ignore[return-value]
+
+
+def stage_key(config: PipelineConfig, test_size: float, *, keep_dtypes: bool = False) -> str:
+    """Compute the cache key of the split-and-preprocess stage of a pipeline config.
+
+    Args:
+        config: PipelineConfig of the pipeline.
+        test_size: float of the test size [0.0 - 1.0]
+        keep_dtypes: Whether the pre-processor of the pipeline outputs DataFrames, see BasePipeline.keep_dtypes.
+
+    Returns:
+        The hexadecimal key, built from the data set fingerprint and every setting the stage output depends on.
+
+    """
+    settings = {
+        "data_set": fingerprint(data_path=config.data_path),
+        "target_column": config.target_column,
+        "features": config.features,
+        "scale_standard": config.scale_standard,
+        "scale_robust": config.scale_robust,
+        "scale_minmax": config.scale_minmax,
+        "dtypes": config.dtypes,
+        "compact_dtypes": config.compact_dtypes,
+        "sample": config.sample,
+        "sample_method": config.sample_method,
+        "test_size": test_size,
+        "random_state": config.random_state,
+        "keep_dtypes": keep_dtypes,
+    }
+    return hashlib.blake2b(json.dumps(settings, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+class StageCache:
+    """Split-and-preprocess Stage Cache."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 4) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Optional directory of the on-disk entries, created when missing. Only memory is used when None.
+            max_entries: Maximum number of entries kept in memory and on disk, least recently used ones are evicted.
+
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, PreparedData] = OrderedDict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], PreparedData]) -> PreparedData:
+        """Return the cached stage output of a key, computing and storing it on a miss.
+
+        Args:
+            key: The key returned by stage_key.
+            compute: Callable running the stage.
+
+        Returns:
+            The PreparedData of the key.
+
+        """
+        if key in self.entries:
+            logger.info(f"Stage cache hit in memory for {key}")
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        prepared = self._read(key=key)
+        if prepared is None:
+            logger.info(f"Stage cache miss for {key}")
+            prepared = compute()
+            self._write(key=key, prepared=prepared)
+
+        self.entries[key] = prepared
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return prepared
+
+    def clear(self) -> None:
+        """Drop the in-memory entries, the on-disk entries are kept.
+
+        Returns:
+            None
+
+        """
+        self.entries.clear()
+
+    def _read(self, key: str) -> Optional[PreparedData]:
+        """Read an entry from disk.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The PreparedData of the entry, None when there is no on-disk entry.
+
+        """
+        if self.cache_dir is None:
+            return None
+        file_path = self.cache_dir / f"{key}.pkl"
+        if not file_path.exists():
+            return None
+
+        logger.info(f"Stage cache hit on disk for {key}")
+        os.utime(file_path)
+        with file_path.open(mode="rb") as f:
+            return pickle.load(f)  # noqa: S301
+
+    def _write(self, key: str, prepared: PreparedData) -> None:
+        """Write an entry to disk atomically and evict the least recently used entries above max_entries.
+
+        Args:
+            key: The key of the entry.
+            prepared: The stage output to store.
+
+        Returns:
+            None
+
+        """
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = self.cache_dir / f"{key}.pkl.{os.getpid()}.tmp"
+        with tmp_path.open(mode="wb") as f:
+            pickle.dump(obj=prepared, file=f, protocol=5)
+        tmp_path.replace(self.cache_dir / f"{key}.pkl")
+
+        entries = sorted(self.cache_dir.glob("*.pkl"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for file_path in entries[self.max_entries :]:
+            logger.info(f"Evicting stage cache entry {file_path.stem}")
+            file_path.unlink(missing_ok=True)
+
+
+_stage_caches: dict[Optional[str], StageCache] = {}
+
+
+def get_stage_cache(cache_dir: Optional[str] = None) -> StageCache:
+    """Return the process-wide stage cache of a directory.
+
+    Args:
+        cache_dir: Optional directory of the on-disk entries, None for the memory-only cache.
+
+    Returns:
+        The StageCache shared by every pipeline of this process using the same directory.
+
+    """
+    if cache_dir not in _stage_caches:
+        _stage_caches[cache_dir] = StageCache(cache_dir=cache_dir)
+    return _stage_caches[cache_dir]
@@ -0,0 +1 @@
+"""Hyperparameter Search module."""
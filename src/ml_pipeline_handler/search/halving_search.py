@@ -0,0 +1,292 @@
+"""Successive Halving Search Module.
+
+This module tunes the estimator of a pipeline with successive halving: a random sample of candidates from the search
+space of the algorithm is scored with cross-validation on a small resource (training rows or trees), only the best
+1 / factor of them are kept and the resource is multiplied by factor, until one candidate is left, the trial budget is
+spent or a round stops improving the best score.
+
+The cross-validation folds are split and pre-processed once and shared by every trial; the trials of a round run in
+parallel in the config.backend pool, sharing the n_jobs cores, and worker processes receive the fold arrays as
+read-only memory maps.
+"""
+
+import math
+import time
+import warnings
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional
+
+import numpy as np
+from joblib import delayed
+from loguru import logger
+from numpy import ndarray
+from pandas import DataFrame, Series
+from sklearn.base import BaseEstimator, clone, is_classifier
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.model_selection import KFold, ParameterSampler, StratifiedKFold
+
+from src.ml_pipeline_handler.io.saver import save_model
+from src.ml_pipeline_handler.metric.base_result import BaseMetricResult
+from src.ml_pipeline_handler.parallelism import blas_limits, parallel_pool, set_estimator_n_jobs
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.search.search_space import SearchSpace, get_search_space
+
+Fold = tuple[ndarray | DataFrame, ndarray | DataFrame, ndarray, ndarray]
+
+
+@dataclass
+class SearchConfig:
+    """Search Config Dataclass.
+
+    Attributes:
+        n_candidates: Number of candidates sampled from the search space for the first round.
+        factor: Proportion of candidates kept (1 / factor) and resource growth between rounds.
+        n_folds: Number of cross-validation folds every candidate is scored on.
+        max_trials: Optional budget of candidate evaluations over all rounds.
+        n_jobs: Optional number of cores, defaults to the n_jobs of the PipelineConfig.
+        tol: Minimum improvement of the best score between rounds, the search stops early below it.
+        search_space: Optional search space, defaults to the declared space of the algorithm.
+
+    """
+
+    n_candidates: int = 27
+    factor: int = 3
+    n_folds: int = 3
+    max_trials: Optional[int] = None
+    n_jobs: Optional[int] = None
+    tol: float = 1e-4
+    search_space: Optional[SearchSpace] = None
+
+
+@dataclass
+class Trial:
+    """Trial Data Class, one evaluation of a candidate in a round, wall_time being the time of its own evaluation."""
+
+    params: dict[str, Any]
+    round: int
+    resource: int
+    score: float
+    wall_time: float
+    error: Optional[str] = None
+
+
+@dataclass
+class SearchResult:
+    """Search Result Data Class."""
+
+    best_params: dict[str, Any]
+    best_score: float
+    pipeline: BasePipeline
+    metrics: BaseMetricResult
+    trials: list[Trial] = field(default_factory=list)
+
+
+def prepare_folds(pipeline: BasePipeline, x_train: DataFrame, y_train: Series, n_folds: int) -> list[Fold]:
+    """Split the training set into cross-validation folds and pre-process them once for every trial.
+
+    Args:
+        pipeline: The pipeline whose pre-processor config is applied to the folds.
+        x_train: DataFrame, training features.
+        y_train: Series, training target.
+        n_folds: Number of folds.
+
+    Returns:
+        List of the x_fit, x_validation, y_fit and y_validation arrays of every fold, the fit rows in random order.
+        The features stay DataFrames for pipelines keeping their dtypes.
+
+    """
+    splitter_class = StratifiedKFold if is_classifier(pipeline.model) else KFold
+    splitter = splitter_class(n_splits=n_folds, shuffle=True, random_state=pipeline.config.random_state)
+    rng = np.random.default_rng(seed=pipeline.config.random_state)
+    target = y_train.to_numpy()
+
+    folds = []
+    for fit_index, validation_index in splitter.split(X=x_train, y=target):
+        # Shuffled, so that the first n rows of a fold are a random subset for the 'n_samples' resource.
+        fit_index = rng.permutation(fit_index)  # noqa: PLW2901
+        x_fit, x_validation = x_train.iloc[fit_index], x_train.iloc[validation_index]
+        if pipeline.config.has_pre_processing():
+            pre_processor = pipeline.get_pre_processor()
+            x_fit, x_validation = pre_processor.fit_transform(X=x_fit), pre_processor.transform(X=x_validation)
+        if not pipeline.keep_dtypes:
+            x_fit, x_validation = np.asarray(x_fit), np.asarray(x_validation)
+        folds.append((x_fit, x_validation, target[fit_index], target[validation_index]))
+    return folds
+
+
+def evaluate_trial(
+    estimator: BaseEstimator,
+    params: dict[str, Any],
+    resource_name: str,
+    resource: int,
+    folds: list[Fold],
+    *,
+    n_jobs: Optional[int] = 1,
+    blas_threads: Optional[int] = None,
+) -> tuple[float, float, Optional[str]]:
+    """Score a candidate with cross-validation on the given resource.
+
+    Args:
+        estimator: The unfitted estimator of the pipeline.
+        params: The candidate parameters.
+        resource_name: 'n_samples' to fit on the first resource rows of every fold, else the estimator parameter
+            set to resource.
+        resource: The resource of the round.
+        folds: The pre-processed cross-validation folds.
+        n_jobs: The n_jobs of the estimator, its share of the cores of the search.
+        blas_threads: Optional BLAS and OpenMP thread limit of the fits.
+
+    Returns:
+        The mean validation score (accuracy or R²), the wall time of the evaluation and None, or -inf, the wall time
+        and the error when the candidate failed.
+
+    """
+    start = time.perf_counter()
+    estimator = clone(estimator).set_params(**params)
+    set_estimator_n_jobs(estimator=estimator, n_jobs=n_jobs)
+    if resource_name != "n_samples":
+        estimator.set_params(**{resource_name: resource})
+
+    scores = []
+    try:
+        with blas_limits(blas_threads=blas_threads):
+            for x_fit, x_validation, y_fit, y_validation in folds:
+                n_rows = resource if resource_name == "n_samples" else len(x_fit)
+                with warnings.catch_warnings():
+                    warnings.simplefilter(action="ignore", category=ConvergenceWarning)
+                    estimator.fit(X=x_fit[:n_rows], y=y_fit[:n_rows])
+                scores.append(estimator.score(X=x_validation, y=y_validation))
+    except (ValueError, TypeError) as e:
+        return -math.inf, time.perf_counter() - start, repr(e)
+    return float(np.mean(scores)), time.perf_counter() - start, None
+
+
+def resource_schedule(space: SearchSpace, n_candidates: int, factor: int, n_rows: int) -> list[int]:
+    """Compute the resource of every round, growing by factor up to the maximum resource.
+
+    Args:
+        space: The search space, holding the resource bounds.
+        n_candidates: Number of candidates of the first round.
+        factor: Resource growth between rounds.
+        n_rows: Number of fit rows of the smallest fold, the maximum of the 'n_samples' resource.
+
+    Returns:
+        List of the resource of every round.
+
+    """
+    max_resource = n_rows if space.resource == "n_samples" else (space.max_resource or 100)
+    max_resource = min(max_resource, space.max_resource or max_resource)
+    n_rounds = 1
+    while factor**n_rounds <= n_candidates:
+        n_rounds += 1
+    min_resource = min(max(max_resource // factor ** (n_rounds - 1), space.min_resource), max_resource)
+    return [min(min_resource * factor**round_index, max_resource) for round_index in range(n_rounds)]
+
+
+def halving_search(config: PipelineConfig, search_config: Optional[SearchConfig] = None) -> SearchResult:
+    """Tune the estimator of a pipeline with successive halving, then refit and save the best pipeline.
+
+    The data set is split once into training and testing sets: candidates are scored by cross-validation on the
+    training set only, the best candidate is refitted on the full training set, evaluated on the testing set and saved
+    with save_model to config.out_file.
+
+    Args:
+        config: PipelineConfig of the pipeline to tune, its model_params are used as fixed parameters.
+        search_config: Optional SearchConfig, defaults to SearchConfig().
+
+    Returns:
+        SearchResult with the best parameters, their cross-validation score, the fitted pipeline, its testing
+        metrics and every trial.
+
+    """
+    search_config = search_config or SearchConfig()
+    space = search_config.search_space or get_search_space(algorithm=config.algorithm)
+    pipeline = PipelineFactory.build_pipeline(config=config)
+
+    prepared = pipeline.prepare_data(test_size=pipeline.test_size)
+    folds = prepare_folds(
+        pipeline=pipeline, x_train=prepared.x_train, y_train=prepared.y_train, n_folds=search_config.n_folds
+    )
+
+    candidates = list(
+        ParameterSampler(
+            param_distributions=space.params, n_iter=search_config.n_candidates, random_state=config.random_state
+        )
+    )
+    schedule = resource_schedule(
+        space=space,
+        n_candidates=len(candidates),
+        factor=search_config.factor,
+        n_rows=min(len(fold[0]) for fold in folds),
+    )
+    budget = search_config.max_trials if search_config.max_trials is not None else math.inf
+
+    trials: list[Trial] = []
+    best_params, best_score = candidates[0], -math.inf
+    pool_config = config if search_config.n_jobs is None else replace(config, n_jobs=search_config.n_jobs)
+    with parallel_pool(config=pool_config, n_tasks=len(candidates)) as (parallel, worker_config):
+        for round_index, resource in enumerate(schedule):
+            candidates = candidates[: int(min(len(candidates), budget - len(trials)))]
+            if not candidates:
+                logger.info(f"Trial budget of {search_config.max_trials} spent, stopping the search")
+                break
+
+            start = time.perf_counter()
+            outcomes = parallel(
+                delayed(evaluate_trial)(
+                    estimator=pipeline.model,
+                    params=params,
+                    resource_name=space.resource,
+                    resource=resource,
+                    folds=folds,
+                    n_jobs=worker_config.n_jobs,
+                    blas_threads=worker_config.blas_threads,
+                )
+                for params in candidates
+            )
+            wall_time = time.perf_counter() - start
+            round_trials = [
+                Trial(
+                    params=params,
+                    round=round_index,
+                    resource=resource,
+                    score=score,
+                    wall_time=trial_time,
+                    error=error,
+                )
+                for params, (score, trial_time, error) in zip(candidates, outcomes, strict=True)
+            ]
+            trials.extend(round_trials)
+
+            round_trials.sort(key=lambda trial: trial.score, reverse=True)
+            round_best = round_trials[0]
+            logger.info(
+                f"Round {round_index}: {len(round_trials)} candidate(s) on {space.resource}={resource} in "
+                f"{wall_time:.3f}s, best score {round_best.score:.4f} with {round_best.params}"
+            )
+
+            improved = round_best.score > best_score + search_config.tol
+            best_params, best_score = round_best.params, round_best.score
+            if round_index > 0 and not improved:
+                logger.info(f"Round {round_index} did not improve the best score by {search_config.tol}, stopping")
+                break
+
+            candidates = [trial.params for trial in round_trials[: max(len(round_trials) // search_config.factor, 1)]]
+            if len(round_trials) == 1:
+                break
+
+    fixed_params = dict(best_params)
+    if space.resource != "n_samples":
+        fixed_params[space.resource] = schedule[-1]
+    best = PipelineFactory.build_pipeline(config=replace(config, model_params={**config.model_params, **fixed_params}))
+    best.prepared = prepared
+    prediction, probability = best.fit_predict(
+        x_train=prepared.x_train, x_test=prepared.x_test, y_train=prepared.y_train, y_test=prepared.y_test
+    )
+    metrics = best.compute_metrics(prediction=prediction, probability=probability)
+    logger.info(f"Best parameters {fixed_params} (cv score {best_score:.4f}), testing metrics: {metrics}")
+
+    save_model(model=best, file_name=config.out_file)
+    return SearchResult(best_params=fixed_params, best_score=best_score, pipeline=best, metrics=metrics, trials=trials)
@@ -0,0 +1,100 @@
+"""Search Space Module.
+
+This module declares the hyperparameter search space of every algorithm, and the resource successive halving grows
+between rounds: the number of training rows, or the number of trees for the forest and boosting models.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+
+
+@dataclass
+class SearchSpace:
+    """Search Space Data Class.
+
+    Attributes:
+        params: Mapping of estimator parameter name to the list of values to sample from.
+        resource: The resource grown by successive halving, 'n_samples' (training rows) or an estimator parameter
+            such as 'n_estimators'.
+        min_resource: The smallest resource a candidate is evaluated with.
+        max_resource: The largest resource, None for all the training rows of a fold.
+
+    """
+
+    params: dict[str, list[Any]] = field(default_factory=dict)
+    resource: str = "n_samples"
+    min_resource: int = 30
+    max_resource: Optional[int] = None
+
+
+TREE_PARAMS: dict[str, list[Any]] = {
+    "max_depth": [None, 3, 5, 8, 12, 16],
+    "min_samples_split": [2, 5, 10, 20],
+    "min_samples_leaf": [1, 2, 5, 10],
+}
+
+FOREST_PARAMS: dict[str, list[Any]] = {
+    "max_depth": [None, 8, 16, 32],
+    "min_samples_leaf": [1, 2, 5],
+    "max_features": ["sqrt", 0.5, 1.0],
+    "bootstrap": [True, False],
+}
+
+BOOSTING_PARAMS: dict[str, list[Any]] = {
+    "learning_rate": [0.03, 0.1, 0.3],
+    "max_leaf_nodes": [15, 31, 63],
+    "min_samples_leaf": [10, 20, 50],
+    "l2_regularization": [0.0, 0.1, 1.0],
+}
+
+SGD_PARAMS: dict[str, list[Any]] = {
+    "alpha": [1e-6, 1e-5, 1e-4, 1e-3, 1e-2],
+    "penalty": ["l2", "l1", "elasticnet"],
+    "learning_rate": ["optimal", "invscaling", "adaptive"],
+    "eta0": [0.001, 0.01, 0.1],
+}
+
+SEARCH_SPACES: dict[AlgorithmType, SearchSpace] = {
+    AlgorithmType.LINEAR_REGRESSION: SearchSpace(params={"fit_intercept": [True, False], "positive": [True, False]}),
+    AlgorithmType.LOGISTIC_REGRESSION: SearchSpace(
+        params={"C": [0.001, 0.01, 0.1, 1.0, 10.0, 100.0], "class_weight": [None, "balanced"]}
+    ),
+    AlgorithmType.DECISION_TREE_CLASSIFIER: SearchSpace(params={**TREE_PARAMS, "criterion": ["gini", "entropy"]}),
+    AlgorithmType.DECISION_TREE_REGRESSOR: SearchSpace(
+        params={**TREE_PARAMS, "criterion": ["squared_error", "friedman_mse", "absolute_error"]}
+    ),
+    AlgorithmType.RANDOM_FOREST: SearchSpace(
+        params=FOREST_PARAMS, resource="n_estimators", min_resource=10, max_resource=200
+    ),
+    AlgorithmType.RANDOM_FOREST_REGRESSOR: SearchSpace(
+        params=FOREST_PARAMS, resource="n_estimators", min_resource=10, max_resource=200
+    ),
+    AlgorithmType.SGD_REGRESSOR: SearchSpace(params=SGD_PARAMS),
+    AlgorithmType.SGD_CLASSIFIER: SearchSpace(params=SGD_PARAMS),
+    AlgorithmType.HIST_GRADIENT_BOOSTING_REGRESSOR: SearchSpace(
+        params=BOOSTING_PARAMS, resource="max_iter", min_resource=10, max_resource=300
+    ),
+    AlgorithmType.HIST_GRADIENT_BOOSTING_CLASSIFIER: SearchSpace(
+        params=BOOSTING_PARAMS, resource="max_iter", min_resource=10, max_resource=300
+    ),
+}
+
+
+def get_search_space(algorithm: AlgorithmType) -> SearchSpace:
+    """Return the search space of an algorithm.
+
+    Args:
+        algorithm: The algorithm to tune.
+
+    Returns:
+        The SearchSpace of the algorithm.
+
+    Raises:
+        NotImplementedError: If no search space is declared for the algorithm.
+
+    """
+    if algorithm not in SEARCH_SPACES:
+        raise NotImplementedError(f"No search space is declared for algorithm '{algorithm}'.")
+    return SEARCH_SPACES[algorithm]
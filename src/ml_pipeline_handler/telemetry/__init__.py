@@ -0,0 +1 @@
+"""Telemetry module, per-stage timing and memory instrumentation."""
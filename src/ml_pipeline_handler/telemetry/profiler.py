@@ -0,0 +1,201 @@
+"""Stage Profiler Module.
+
+This module profiles a run stage by stage with cProfile: the StageProfiler is an instrumentation sink keeping one
+profiler per stage (load, preprocess, fit, predict, metrics, save, and other for the code outside of these stages) and
+switching between them as the spans of the pipeline start and end. Only one cProfile profiler can be active at a time,
+so switching splits the time of every function by stage without nesting profilers.
+
+On close, the profiles of every stage are merged into a .pstats file (for pstats, snakeviz or gprof2dot), written as
+collapsed stacks (for flamegraph.pl, inferno or speedscope) and the top functions of every stage by cumulative time
+are logged. cProfile only records caller/callee pairs, not full stacks, so the collapsed stacks share the time of a
+function among its callers in proportion to the time spent under each of them.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from src.ml_pipeline_handler.telemetry.record import SpanRecord
+from src.ml_pipeline_handler.telemetry.sinks import BaseSink
+
+OTHER_STAGE = "other"
+STAGE_GROUPS = {
+    "load_data": "load",
+    "load_model": "load",
+    "sample": "load",
+    "split": "preprocess",
+    "pre_process": "preprocess",
+    "fit": "fit",
+    "predict": "predict",
+    "metrics": "metrics",
+    "bootstrap": "metrics",
+    "save_model": "save",
+    "save_artifact": "save",
+}
+# Call paths below this share of the profiled time are left out of the collapsed stacks.
+MIN_STACK_SHARE = 1e-3
+# The collapsed stacks count microseconds.
+STACK_UNIT = 1e-6
+
+FunctionKey = tuple[str, int, str]
+
+
+def function_name(function: FunctionKey) -> str:
+    """Format a profiled function as a frame of a collapsed stack.
+
+    Args:
+        function: The (file name, line number, function name) key of the function in the profile.
+
+    Returns:
+        The frame, e.g. 'base_pipeline.py:230(fit_predict)', without the semicolons separating frames.
+
+    """
+    file_name, line_number, name = function
+    frame = name if file_name == "~" else f"{Path(file_name).name}:{line_number}({name})"
+    return frame.replace(";", ",")
+
+
+def collapse_stats(stats: dict[FunctionKey, Any], prefix: str, min_time: float) -> dict[str, float]:
+    """Build collapsed stacks from the caller/callee times of a profile.
+
+    Args:
+        stats: The raw stats of a profile, pstats.Stats.stats.
+        prefix: The root frame of every stack, e.g. the name of the stage.
+        min_time: Minimum time of a call path, shorter paths are left out.
+
+    Returns:
+        Mapping of semicolon-separated stack to the time spent in its leaf function, in seconds.
+
+    """
+    children: dict[FunctionKey, list[tuple[FunctionKey, float]]] = defaultdict(list)
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            children[caller].append((function, cumulative_time))
+
+    stacks: dict[str, float] = defaultdict(float)
+
+    def visit(function: FunctionKey, share: float, path: list[FunctionKey], stack: str) -> None:
+        _, _, total_time, cumulative_time, _ = stats[function]
+        scale = share / cumulative_time if cumulative_time > 0 else 0.0
+        stacks[stack] += total_time * scale
+        for child, child_time in children[function]:
+            if child not in path and child_time * scale >= min_time:
+                stack_of_child = f"{stack};{function_name(function=child)}"
+                visit(function=child, share=child_time * scale, path=[*path, child], stack=stack_of_child)
+
+    for function, (_, _, _, cumulative_time, callers) in stats.items():
+        if not callers and cumulative_time >= min_time:
+            stack = f"{prefix};{function_name(function=function)}"
+            visit(function=function, share=cumulative_time, path=[function], stack=stack)
+    return stacks
+
+
+class StageProfiler(BaseSink):
+    """Stage Profiler sink, profiling every stage of the pipeline with its own cProfile profiler.
+
+    Profiling starts when the sink is created. Only the spans of the main thread switch the profiler, spans of worker
+    threads are profiled as part of the stage of the main thread.
+    """
+
+    def __init__(self, file_name: str, top_n: int = 20) -> None:
+        """Initialize the sink and start profiling.
+
+        Args:
+            file_name: The output file the profile is written next to, as <name>.pstats and <name>.collapsed.
+            top_n: Number of functions logged per stage, by cumulative time.
+
+        """
+        self.pstats_path = Path(file_name).with_suffix(".pstats")
+        self.collapsed_path = Path(file_name).with_suffix(".collapsed")
+        self.top_n = top_n
+        self.profilers: dict[str, cProfile.Profile] = defaultdict(cProfile.Profile)
+        self.stages = [OTHER_STAGE]
+        self.profilers[OTHER_STAGE].enable()
+
+    def switch(self, stage: str) -> None:
+        """Stop the profiler of the current stage and start the profiler of another one.
+
+        Args:
+            stage: The stage to profile from now on.
+
+        Returns:
+            None
+
+        """
+        self.profilers[self.stages[-1]].disable()
+        self.profilers[stage].enable()
+
+    def start(self, name: str) -> None:
+        """Start profiling the stage of a span.
+
+        Args:
+            name: The name of the span.
+
+        Returns:
+            None
+
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        stage = STAGE_GROUPS.get(name, self.stages[-1])
+        self.switch(stage=stage)
+        self.stages.append(stage)
+
+    def export(self, record: SpanRecord) -> None:  # noqa: ARG002
+        """Resume profiling the stage enclosing the span.
+
+        Args:
+            record: The span record.
+
+        Returns:
+            None
+
+        """
+        if threading.current_thread() is not threading.main_thread() or len(self.stages) == 1:
+            return
+        self.profilers[self.stages[-1]].disable()
+        self.stages.pop()
+        self.profilers[self.stages[-1]].enable()
+
+    def close(self) -> None:
+        """Stop profiling, write the .pstats and collapsed stacks files and log the top functions of every stage.
+
+        Returns:
+            None
+
+        """
+        self.profilers[self.stages[-1]].disable()
+        stage_stats = {}
+        for stage, profiler in self.profilers.items():
+            profiler.create_stats()
+            stage_stats[stage] = profiler.stats
+        stage_times = {
+            stage: sum(total_time for _, _, total_time, _, _ in stats.values()) for stage, stats in stage_stats.items()
+        }
+
+        # pstats.Stats takes the stats over from the profilers, so it is only built after collecting them.
+        merged = pstats.Stats()
+        merged.add(*self.profilers.values())
+        merged.dump_stats(self.pstats_path)
+
+        min_time = sum(stage_times.values()) * MIN_STACK_SHARE
+        lines: list[str] = []
+        for stage, stats in stage_stats.items():
+            stacks = collapse_stats(stats=stats, prefix=stage, min_time=min_time)
+            lines.extend(
+                f"{stack} {round(seconds / STACK_UNIT)}" for stack, seconds in stacks.items() if seconds >= STACK_UNIT
+            )
+        self.collapsed_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        for stage in sorted(stage_times, key=stage_times.__getitem__, reverse=True):
+            buffer = io.StringIO()
+            profile = pstats.Stats(self.profilers[stage], stream=buffer)
+            profile.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+            logger.info(f"Profile of stage {stage} ({stage_times[stage]:.3f}s):\n{buffer.getvalue()}")
+        logger.info(f"Profile written to {self.pstats_path} and {self.collapsed_path}")
@@ -0,0 +1,42 @@
+"""Span Record Module."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class SpanRecord:
+    """Span Record Data Class, the measurements of one finished stage.
+
+    Attributes:
+        name: The name of the stage, e.g. 'fit'.
+        trace_id: The id shared by a root span and every span nested in it, 32 hexadecimal digits.
+        span_id: The id of the span, 16 hexadecimal digits.
+        parent_id: The span_id of the enclosing span, None for a root span.
+        start_time: The start of the span, in seconds since the epoch.
+        wall_time: The elapsed time, in seconds.
+        cpu_time: The CPU time of the process (every thread) during the span, in seconds.
+        rss_mb: The resident set size at the end of the span, None when the platform does not expose it.
+        peak_rss_mb: The peak resident set size of the process at the end of the span (a high-water mark since the
+            start of the process, not reset per span), None when the platform does not expose it.
+        peak_traced_mb: The peak memory allocated through Python and numpy during the span, None unless memory
+            tracing is enabled.
+        rows: The number of rows processed by the stage, when known.
+        attributes: Additional attributes of the stage, e.g. the algorithm.
+        error: The type of the exception raised in the span, None when it succeeded.
+
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: float
+    wall_time: float
+    cpu_time: float
+    rss_mb: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    peak_traced_mb: Optional[float] = None
+    rows: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
@@ -0,0 +1,323 @@
+"""Instrumentation Sinks Module.
+
+This module exports the span records: as JSON lines, as a Prometheus textfile (for the node exporter's textfile
+collector), as OTLP/JSON trace requests written to a file (a local stand-in for an OpenTelemetry collector, in the
+format of the collector's file exporter), or to the OpenTelemetry SDK when it is installed.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import asdict
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from src.ml_pipeline_handler.telemetry.record import SpanRecord
+
+SERVICE_NAME = "ml_pipeline_handler"
+# OTLP span kind INTERNAL and status code ERROR.
+OTLP_SPAN_KIND_INTERNAL = 1
+OTLP_STATUS_CODE_ERROR = 2
+
+
+class BaseSink(ABC):
+    """Base Instrumentation Sink."""
+
+    def start(self, name: str) -> None:  # noqa: B027
+        """Notify the sink that a span starts, before its measurements start.
+
+        Args:
+            name: The name of the stage.
+
+        Returns:
+            None
+
+        """
+
+    @abstractmethod
+    def export(self, record: SpanRecord) -> None:
+        """Export the record of a finished span.
+
+        Args:
+            record: The span record.
+
+        Returns:
+            None
+
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:  # noqa: B027
+        """Flush the exported records, called when instrumentation is shut down.
+
+        Returns:
+            None
+
+        """
+
+
+class JsonLogSink(BaseSink):
+    """Structured JSON log sink, appending one JSON object per span to a file."""
+
+    def __init__(self, file_name: str) -> None:
+        """Initialize the sink.
+
+        Args:
+            file_name: The path of the JSON lines file, created when missing.
+
+        """
+        self.file_path = Path(file_name)
+
+    def export(self, record: SpanRecord) -> None:
+        """Append the record as one JSON line.
+
+        Args:
+            record: The span record.
+
+        Returns:
+            None
+
+        """
+        with self.file_path.open(mode="a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(record), default=str) + "\n")
+
+
+class PrometheusTextfileSink(BaseSink):
+    """Prometheus textfile sink, aggregating the spans per stage into counters and gauges.
+
+    The file is rewritten atomically after every span, so the textfile collector never reads a partial file.
+    """
+
+    def __init__(self, file_name: str, prefix: str = "ml_pipeline_stage") -> None:
+        """Initialize the sink.
+
+        Args:
+            file_name: The path of the .prom file.
+            prefix: The prefix of the metric names.
+
+        """
+        self.file_path = Path(file_name)
+        self.prefix = prefix
+        self.counters: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.gauges: dict[str, dict[str, float]] = defaultdict(dict)
+
+    def export(self, record: SpanRecord) -> None:
+        """Add the record to the per-stage metrics and rewrite the file.
+
+        Args:
+            record: The span record.
+
+        Returns:
+            None
+
+        """
+        self.counters["runs_total"][record.name] += 1
+        self.counters["seconds_total"][record.name] += record.wall_time
+        self.counters["cpu_seconds_total"][record.name] += record.cpu_time
+        self.counters["rows_total"][record.name] += record.rows or 0
+        if record.error is not None:
+            self.counters["errors_total"][record.name] += 1
+        self.gauges["last_seconds"][record.name] = record.wall_time
+        if record.peak_rss_mb is not None:
+            self.gauges["peak_rss_bytes"][record.name] = record.peak_rss_mb * 1024 * 1024
+        if record.peak_traced_mb is not None:
+            self.gauges["peak_traced_bytes"][record.name] = record.peak_traced_mb * 1024 * 1024
+        self.write()
+
+    def write(self) -> None:
+        """Write every metric in the Prometheus text exposition format.
+
+        Returns:
+            None
+
+        """
+        lines = []
+        for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+            for metric, values in metrics.items():
+                name = f"{self.prefix}_{metric}"
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(f'{name}{{stage="{stage}"}} {value!r}' for stage, value in sorted(values.items()))
+
+        tmp_path = self.file_path.with_name(f"{self.file_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        tmp_path.replace(self.file_path)
+
+
+def otlp_value(value: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Convert an attribute value to an OTLP/JSON AnyValue.
+
+    Args:
+        value: The attribute value.
+
+    Returns:
+        The AnyValue mapping, 64-bit integers are strings as in the OTLP/JSON encoding.
+
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def span_attributes(record: SpanRecord) -> dict[str, Any]:
+    """Collect the measurements and attributes of a record as span attributes.
+
+    Args:
+        record: The span record.
+
+    Returns:
+        Mapping of attribute name to value, the unset measurements left out.
+
+    """
+    measurements = {
+        "cpu_time_s": record.cpu_time,
+        "rss_mb": record.rss_mb,
+        "peak_rss_mb": record.peak_rss_mb,
+        "peak_traced_mb": record.peak_traced_mb,
+        "rows": record.rows,
+    }
+    return {**{key: value for key, value in measurements.items() if value is not None}, **record.attributes}
+
+
+class OtlpJsonSink(BaseSink):
+    """OTLP/JSON file sink, a local stand-in for an OpenTelemetry collector.
+
+    Every span is appended as one OTLP/JSON ExportTraceServiceRequest line, as written by the collector's file
+    exporter, which an OpenTelemetry collector (otlpjsonfile receiver) or any OTLP/JSON consumer can ingest.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """Initialize the sink.
+
+        Args:
+            file_name: The path of the OTLP/JSON lines file, created when missing.
+
+        """
+        self.file_path = Path(file_name)
+
+    def export(self, record: SpanRecord) -> None:
+        """Append the record as one OTLP/JSON trace request.
+
+        Args:
+            record: The span record.
+
+        Returns:
+            None
+
+        """
+        start_ns = int(record.start_time * 1e9)
+        otlp_span: dict[str, Any] = {
+            "traceId": record.trace_id,
+            "spanId": record.span_id,
+            "name": record.name,
+            "kind": OTLP_SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(start_ns + int(record.wall_time * 1e9)),
+            "attributes": [
+                {"key": key, "value": otlp_value(value)} for key, value in span_attributes(record=record).items()
+            ],
+        }
+        if record.parent_id is not None:
+            otlp_span["parentSpanId"] = record.parent_id
+        if record.error is not None:
+            otlp_span["status"] = {"code": OTLP_STATUS_CODE_ERROR, "message": record.error}
+
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": otlp_value(SERVICE_NAME)}]},
+                    "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": [otlp_span]}],
+                }
+            ]
+        }
+        with self.file_path.open(mode="a", encoding="utf-8") as f:
+            f.write(json.dumps(request) + "\n")
+
+
+class OpenTelemetrySink(BaseSink):
+    """OpenTelemetry sink, replaying the spans through the tracer of the installed OpenTelemetry SDK.
+
+    Spans end before the span enclosing them, so the records of a trace are buffered until its root span ends and
+    then started top-down, every span in the context of its parent.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the sink with the global tracer provider, configured by the application."""
+        self.trace = import_module("opentelemetry.trace")
+        self.tracer = self.trace.get_tracer(SERVICE_NAME)
+        self.pending: dict[str, list[SpanRecord]] = defaultdict(list)
+
+    def export(self, record: SpanRecord) -> None:
+        """Buffer the record, and replay its trace when it is a root span.
+
+        Args:
+            record: The span record.
+
+        Returns:
+            None
+
+        """
+        self.pending[record.trace_id].append(record)
+        if record.parent_id is None:
+            self.replay(records=self.pending.pop(record.trace_id), parent_id=None, context=None)
+
+    def replay(self, records: list[SpanRecord], parent_id: Any, context: Any) -> None:  # noqa: ANN401
+        """Start and end the spans of a trace whose parent is parent_id, then their children.
+
+        Args:
+            records: The records of the trace.
+            parent_id: The span_id of the parent, None for the root span.
+            context: The OpenTelemetry context of the parent span.
+
+        Returns:
+            None
+
+        """
+        for record in records:
+            if record.parent_id != parent_id:
+                continue
+            start_ns = int(record.start_time * 1e9)
+            otel_span = self.tracer.start_span(
+                name=record.name, context=context, start_time=start_ns, attributes=span_attributes(record=record)
+            )
+            if record.error is not None:
+                otel_span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, record.error))
+            self.replay(records=records, parent_id=record.span_id, context=self.trace.set_span_in_context(otel_span))
+            otel_span.end(end_time=start_ns + int(record.wall_time * 1e9))
+
+    def close(self) -> None:
+        """Replay the traces whose root span never ended.
+
+        Returns:
+            None
+
+        """
+        for records in self.pending.values():
+            span_ids = {record.span_id for record in records}
+            for parent_id in {record.parent_id for record in records if record.parent_id not in span_ids}:
+                self.replay(records=records, parent_id=parent_id, context=None)
+        self.pending.clear()
+
+
+def get_opentelemetry_sink(file_name: str) -> BaseSink:
+    """Return the OpenTelemetry sink, falling back to the OTLP/JSON file stand-in when the SDK is not installed.
+
+    Args:
+        file_name: The path of the OTLP/JSON lines file of the stand-in.
+
+    Returns:
+        OpenTelemetrySink when opentelemetry is installed, else OtlpJsonSink writing to file_name.
+
+    """
+    if find_spec("opentelemetry") is None:
+        logger.warning(f"opentelemetry is not installed, writing the spans as OTLP/JSON to {file_name}.")
+        return OtlpJsonSink(file_name=file_name)
+    return OpenTelemetrySink()
@@ -0,0 +1,334 @@
+"""Instrumentation Span Module.
+
+This module measures the stages of a pipeline with spans, context managers recording the wall time, the CPU time, the
+resident and (optionally) traced memory and the row count of a stage, and handing the record to the configured sinks.
+Spans nest: a span opened inside another one shares its trace_id and records it as parent.
+
+Instrumentation is disabled until configure_instrumentation is called with at least one sink. While disabled, span
+returns a shared no-op context manager, so instrumented code only pays for one function call per stage.
+
+Example usage:
+configure_instrumentation(sinks=[JsonLogSink(file_name="spans.jsonl")])
+with span("fit", rows=len(x_train), algorithm="random_forest"):
+    model.fit(X=x_train, y=y_train)
+shutdown_instrumentation()
+"""
+
+import os
+import secrets
+import sys
+import time
+import tracemalloc
+from contextvars import ContextVar
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Self
+
+from loguru import logger
+
+from src.ml_pipeline_handler.telemetry.record import SpanRecord
+from src.ml_pipeline_handler.telemetry.sinks import BaseSink
+
+_resource = import_module("resource") if find_spec("resource") is not None else None
+_PAGE_BYTES = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+_MAXRSS_BYTES = 1 if sys.platform == "darwin" else 1024
+_MB = 1024 * 1024
+
+_sinks: list[BaseSink] = []
+_trace_memory = False
+_started_tracemalloc = False
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def rss_mb() -> Optional[float]:
+    """Read the resident set size of the process.
+
+    Returns:
+        The resident set size in megabytes, None when /proc/self/statm is not available.
+
+    """
+    try:
+        return int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1]) * _PAGE_BYTES / _MB
+    except OSError:
+        return None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Read the peak resident set size of the process since it started.
+
+    Returns:
+        The peak resident set size in megabytes, None when the resource module is not available.
+
+    """
+    if _resource is None:
+        return None
+    return _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_BYTES / _MB
+
+
+class Span:
+    """Instrumentation Span, measuring the stage run inside its context."""
+
+    __slots__ = (
+        "attributes",
+        "name",
+        "parent",
+        "rows",
+        "span_id",
+        "start_cpu",
+        "start_time",
+        "start_wall",
+        "token",
+        "trace_id",
+        "traced_peak",
+    )
+
+    def __init__(self, name: str, rows: Optional[int] = None, attributes: Optional[dict[str, Any]] = None) -> None:
+        """Initialize a span, measuring starts on entering its context.
+
+        Args:
+            name: The name of the stage.
+            rows: Optional number of rows processed by the stage, can also be set inside the context.
+            attributes: Optional additional attributes of the stage.
+
+        """
+        self.name = name
+        self.rows = rows
+        self.attributes = attributes or {}
+        self.parent: Optional[Span] = None
+        self.trace_id = ""
+        self.span_id = ""
+        self.start_time = 0.0
+        self.start_wall = 0.0
+        self.start_cpu = 0.0
+        self.traced_peak = 0
+        self.token: Any = None
+
+    def set_rows(self, rows: int) -> None:
+        """Set the number of rows processed by the stage.
+
+        Args:
+            rows: The number of rows.
+
+        Returns:
+            None
+
+        """
+        self.rows = rows
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Set an additional attribute of the stage.
+
+        Args:
+            key: The name of the attribute.
+            value: The value of the attribute, a string, number or boolean.
+
+        Returns:
+            None
+
+        """
+        self.attributes[key] = value
+
+    def __enter__(self) -> Self:
+        """Start measuring the stage.
+
+        Returns:
+            The span.
+
+        """
+        self.parent = _current_span.get()
+        self.trace_id = self.parent.trace_id if self.parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.token = _current_span.set(self)
+        for sink in _sinks:
+            try:
+                sink.start(name=self.name)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Instrumentation sink {type(sink).__name__} failed to start span {self.name}")
+
+        if _trace_memory and tracemalloc.is_tracing():
+            # The peak is reset for this span, the enclosing span keeps the peak it reached so far.
+            if self.parent is not None:
+                self.parent.traced_peak = max(self.parent.traced_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        self.start_time = time.time()
+        self.start_cpu = time.process_time()
+        self.start_wall = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop measuring the stage and export its record to every sink.
+
+        Args:
+            exc_type: The type of the exception raised in the context, if any.
+            exc_value: The exception raised in the context, if any.
+            traceback: The traceback of the exception, if any.
+
+        Returns:
+            None
+
+        """
+        wall_time = time.perf_counter() - self.start_wall
+        cpu_time = time.process_time() - self.start_cpu
+        _current_span.reset(self.token)
+
+        peak_traced_mb = None
+        if _trace_memory and tracemalloc.is_tracing():
+            self.traced_peak = max(self.traced_peak, tracemalloc.get_traced_memory()[1])
+            peak_traced_mb = self.traced_peak / _MB
+            if self.parent is not None:
+                self.parent.traced_peak = max(self.parent.traced_peak, self.traced_peak)
+
+        record = SpanRecord(
+            name=self.name,
+            trace_id=self.trace_id,
+            span_id=self.span_id,
+            parent_id=self.parent.span_id if self.parent is not None else None,
+            start_time=self.start_time,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            rss_mb=rss_mb(),
+            peak_rss_mb=peak_rss_mb(),
+            peak_traced_mb=peak_traced_mb,
+            rows=self.rows,
+            attributes=self.attributes,
+            error=exc_type.__name__ if exc_type is not None else None,
+        )
+        for sink in _sinks:
+            try:
+                sink.export(record=record)
+            except Exception:  # noqa: BLE001
+                # A failing sink must not fail the pipeline.
+                logger.exception(f"Instrumentation sink {type(sink).__name__} failed to export span {self.name}")
+
+
+class NullSpan:
+    """No-op Span, returned by span while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def set_rows(self, rows: int) -> None:
+        """Ignore the number of rows.
+
+        Args:
+            rows: The number of rows.
+
+        Returns:
+            None
+
+        """
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Ignore the attribute.
+
+        Args:
+            key: The name of the attribute.
+            value: The value of the attribute.
+
+        Returns:
+            None
+
+        """
+
+    def __enter__(self) -> Self:
+        """Do nothing.
+
+        Returns:
+            The span.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Do nothing.
+
+        Args:
+            exc_type: The type of the exception raised in the context, if any.
+            exc_value: The exception raised in the context, if any.
+            traceback: The traceback of the exception, if any.
+
+        Returns:
+            None
+
+        """
+
+
+NULL_SPAN = NullSpan()
+
+
+def span(name: str, rows: Optional[int] = None, **attributes: Any) -> Span | NullSpan:  # noqa: ANN401
+    """Create a span measuring the stage run inside its context.
+
+    Args:
+        name: The name of the stage.
+        rows: Optional number of rows processed by the stage.
+        **attributes: Additional attributes of the stage, strings, numbers or booleans.
+
+    Returns:
+        A Span, or the shared no-op NullSpan while instrumentation is disabled.
+
+    """
+    if not _sinks:
+        return NULL_SPAN
+    return Span(name=name, rows=rows, attributes=attributes)
+
+
+def instrumentation_enabled() -> bool:
+    """Check whether spans are recorded.
+
+    Returns:
+        True when at least one sink is configured.
+
+    """
+    return bool(_sinks)
+
+
+def configure_instrumentation(sinks: list[BaseSink], *, trace_memory: bool = False) -> None:
+    """Enable instrumentation, exporting the spans to the given sinks.
+
+    Args:
+        sinks: The sinks receiving the record of every finished span.
+        trace_memory: Whether to measure the peak memory allocated in every span with tracemalloc, which slows
+            allocation-heavy code down.
+
+    Returns:
+        None
+
+    """
+    global _trace_memory, _started_tracemalloc  # noqa: PLW0603
+    shutdown_instrumentation()
+    _sinks.extend(sinks)
+    _trace_memory = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+
+
+def shutdown_instrumentation() -> None:
+    """Flush and close the sinks and disable instrumentation.
+
+    Returns:
+        None
+
+    """
+    global _trace_memory, _started_tracemalloc  # noqa: PLW0603
+    for sink in _sinks:
+        sink.close()
+    _sinks.clear()
+    if _started_tracemalloc:
+        tracemalloc.stop()
+    _trace_memory = False
+    _started_tracemalloc = False
@@ -0,0 +1,203 @@
+"""Model artifact test module."""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from src.cli import predict_cli
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.io.loader import load_model
+from src.ml_pipeline_handler.io.saver import save_artifact, save_model, save_predictions
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+def build_fitted_pipeline(algorithm: AlgorithmType, **kwargs):
+    """Build and fit a pipeline on the Iris dataset.
+
+    Returns:
+        The fitted pipeline.
+    """
+    config = PipelineConfig(
+        data_path="src/data/Iris.csv",
+        features=["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"],
+        target_column="Species",
+        algorithm=algorithm,
+        out_file="models/artifact.pkl",
+        random_state=42,
+        **kwargs,
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    pipeline.predict()
+    return pipeline
+
+
+def test_artifact_round_trip(tmp_path: Path) -> None:
+    """Test that a loaded artifact predicts like the fitted pipeline and holds no data.
+
+    Returns:
+        None
+    """
+    pipeline = build_fitted_pipeline(algorithm=AlgorithmType.RANDOM_FOREST)
+    save_artifact(model=pipeline, file_name=str(tmp_path / "model.art"))
+    save_model(model=pipeline, file_name=str(tmp_path / "model.pkl"))
+
+    artifact = load_model(file_name=str(tmp_path / "model.art"))
+
+    assert artifact.algorithm == AlgorithmType.RANDOM_FOREST
+    assert artifact.features == pipeline.config.features
+    assert artifact.config["random_state"] == 42
+    assert artifact.pre_processor is None
+    assert np.array_equal(artifact.model.predict(X=pipeline.x_test), pipeline.model.predict(X=pipeline.x_test))
+    assert (tmp_path / "model.art").stat().st_size < (tmp_path / "model.pkl").stat().st_size
+
+
+def test_artifact_keeps_fitted_pre_processor(tmp_path: Path) -> None:
+    """Test that the fitted pre-processor is stored in the artifact.
+
+    Returns:
+        None
+    """
+    pipeline = build_fitted_pipeline(algorithm=AlgorithmType.LOGISTIC_REGRESSION, scale_standard=["SepalLengthCm"])
+    save_artifact(model=pipeline, file_name=str(tmp_path / "model.art"))
+
+    artifact = load_model(file_name=str(tmp_path / "model.art"))
+
+    assert np.allclose(artifact.pre_processor.transform(X=pipeline.x_test), pipeline.x_test_pre_processed)
+
+
+def test_save_artifact_requires_fitted_pipeline(tmp_path: Path) -> None:
+    """Test that an unfitted pipeline cannot be saved as an artifact.
+
+    Returns:
+        None
+    """
+    config = PipelineConfig(
+        data_path="src/data/Iris.csv",
+        features=["SepalLengthCm"],
+        target_column="Species",
+        algorithm=AlgorithmType.DECISION_TREE_CLASSIFIER,
+        out_file="models/artifact.pkl",
+        random_state=42,
+    )
+    with pytest.raises(ValueError, match="not fitted"):
+        save_artifact(model=PipelineFactory.build_pipeline(config=config), file_name=str(tmp_path / "model.art"))
+
+
+def test_load_model_rejects_other_files(tmp_path: Path) -> None:
+    """Test that loading a plain pickle as an artifact raises a ValueError.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "model.pkl"
+    path.write_bytes(pickle.dumps(obj={"not": "an artifact"}))
+    with pytest.raises(ValueError, match="not a model artifact"):
+        load_model(file_name=str(path))
+
+
+def test_load_model_memory_mapped(tmp_path: Path) -> None:
+    """Test that memory-mapped loading predicts like in-memory loading and maps the large arrays read-only.
+
+    Returns:
+        None
+    """
+    pipeline = build_fitted_pipeline(algorithm=AlgorithmType.LOGISTIC_REGRESSION)
+    wide_coef = np.zeros(shape=(3, 2048))
+    pipeline.model.wide_coef_ = wide_coef
+    save_artifact(model=pipeline, file_name=str(tmp_path / "model.art"))
+
+    artifact = load_model(file_name=str(tmp_path / "model.art"), mmap=True)
+
+    assert not artifact.model.wide_coef_.flags.writeable
+    assert np.array_equal(artifact.model.wide_coef_, wide_coef)
+    assert np.array_equal(artifact.model.predict(X=pipeline.x_test), pipeline.model.predict(X=pipeline.x_test))
+
+
+def test_predict_batch_and_stream(tmp_path: Path) -> None:
+    """Test that batch and stream scoring of the pipeline and of its artifact match the fitted model.
+
+    Returns:
+        None
+    """
+    pipeline = build_fitted_pipeline(algorithm=AlgorithmType.LOGISTIC_REGRESSION, scale_minmax=["PetalWidthCm"])
+    save_artifact(model=pipeline, file_name=str(tmp_path / "model.art"))
+    artifact = load_model(file_name=str(tmp_path / "model.art"))
+    data = pd.read_csv("src/data/Iris.csv")
+    expected = pipeline.model.predict(X=pipeline.pre_processor.transform(X=data[pipeline.config.features]))
+
+    assert np.array_equal(pipeline.predict_batch(x=data), expected)
+    assert np.array_equal(artifact.predict_batch(x=data), expected)
+    assert np.array_equal(np.concatenate(list(artifact.predict_stream(frames=[data[:100], data[100:]]))), expected)
+
+
+def test_predict_cli(tmp_path: Path) -> None:
+    """Test that the predict subcommand scores a CSV file in chunks.
+
+    Returns:
+        None
+    """
+    pipeline = build_fitted_pipeline(algorithm=AlgorithmType.DECISION_TREE_CLASSIFIER)
+    save_artifact(model=pipeline, file_name=str(tmp_path / "model.art"))
+
+    predict_cli(
+        argv=[
+            "--model",
+            str(tmp_path / "model.art"),
+            "--input",
+            "src/data/Iris.csv",
+            "--output",
+            str(tmp_path / "predictions.csv"),
+            "--chunk_size",
+            "40",
+        ]
+    )
+
+    predictions = pd.read_csv(tmp_path / "predictions.csv")
+    expected = pipeline.model.predict(X=pd.read_csv("src/data/Iris.csv")[pipeline.config.features])
+    assert predictions["Species"].tolist() == expected.tolist()
+
+
+def test_predict_cli_evaluate(tmp_path: Path) -> None:
+    """Test that the predict subcommand accumulates the metrics chunk by chunk with --evaluate.
+
+    Returns:
+        None
+    """
+    pipeline = build_fitted_pipeline(algorithm=AlgorithmType.DECISION_TREE_CLASSIFIER)
+    save_artifact(model=pipeline, file_name=str(tmp_path / "model.art"))
+    messages: list[str] = []
+    handler_id = logger.add(lambda message: messages.append(str(message)), format="{message}")
+
+    try:
+        predict_cli(
+            argv=[
+                "--model",
+                str(tmp_path / "model.art"),
+                "--input",
+                "src/data/Iris.csv",
+                "--output",
+                str(tmp_path / "predictions.csv"),
+                "--chunk_size",
+                "40",
+                "--evaluate",
+            ]
+        )
+    finally:
+        logger.remove(handler_id)
+
+    assert any(message.startswith("Metrics: ClassificationMetricResult(accuracy=") for message in messages)
+
+
+def test_save_predictions_rejects_unknown_extension(tmp_path: Path) -> None:
+    """Test that predictions can only be written to CSV or Parquet files.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Unsupported predictions file extension"):
+        save_predictions(frames=[], file_name=str(tmp_path / "predictions.txt"))
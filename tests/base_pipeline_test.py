@@ -0,0 +1,47 @@
+"""Base pipeline pre-processing test module."""
+
+from dataclasses import replace
+
+import numpy as np
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+CONFIG = PipelineConfig(
+    data_path="src/data/housing.csv",
+    features=["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"],
+    target_column="SalePrice",
+    algorithm=AlgorithmType.LINEAR_REGRESSION,
+    out_file="models/whatever.pkl",
+    random_state=42,
+)
+
+
+def test_pre_process_data_without_scaling_is_a_no_op() -> None:
+    """Test that nothing is fitted or copied when no scaling is configured."""
+    pipeline = PipelineFactory.build_pipeline(config=CONFIG)
+    features, target = pipeline.load_data_set()
+    x_train, x_test, _, _ = pipeline.create_training_set(features=features, target=target, test_size=0.3)
+
+    x_train_to_use, x_test_to_use = pipeline.pre_process_data(x_train=x_train, x_test=x_test)
+
+    assert x_train_to_use is x_train
+    assert x_test_to_use is x_test
+    assert pipeline.pre_processor is None
+    assert pipeline.x_train_pre_processed is None
+
+
+def test_pre_process_data_passes_unscaled_features_through() -> None:
+    """Test that unscaled features are kept after the scaled ones and that the input frames are not modified."""
+    pipeline = PipelineFactory.build_pipeline(config=replace(CONFIG, scale_standard=["GrLivArea", "TotalBsmtSF"]))
+    features, target = pipeline.load_data_set()
+    x_train, x_test, _, _ = pipeline.create_training_set(features=features, target=target, test_size=0.3)
+    x_train_before = x_train.copy()
+
+    x_train_to_use, _ = pipeline.pre_process_data(x_train=x_train, x_test=x_test)
+
+    assert x_train_to_use.shape == x_train.shape
+    np.testing.assert_allclose(x_train_to_use[:, 2:], x_train[["OverallQual", "GarageCars", "GarageArea"]])
+    np.testing.assert_allclose(x_train_to_use[:, :2].mean(axis=0), 0.0, atol=1e-9)
+    assert x_train.equals(x_train_before)
@@ -0,0 +1,28 @@
+"""Pipeline benchmark suite test module."""
+
+import copy
+from pathlib import Path
+
+from benchmarks.pipeline_suite import compare, run_suite
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+
+
+def test_run_suite_and_compare(tmp_path: Path) -> None:
+    """Test that the suite reports every stage of both tasks and that a slower copy is flagged as a regression."""
+    report = run_suite(
+        rows=[300],
+        algorithms=[AlgorithmType.DECISION_TREE_CLASSIFIER, AlgorithmType.LINEAR_REGRESSION],
+        data_dir=tmp_path,
+        repeats=1,
+    )
+    names = {result["name"] for result in report["results"]}
+
+    assert {"load_data[classification]", "fit[linear_regression]", "compute_metrics[regression]"} <= names
+    assert "load_model[decision_tree_classifier]" in names
+    assert all(result["peak_mb"] is not None for result in report["results"])
+    assert len(list(tmp_path.glob("*.csv"))) == 2
+
+    slower = copy.deepcopy(report)
+    slower["results"][0]["seconds"] *= 2
+    assert compare(baseline=report, current=report, tolerance=0.1) == []
+    assert compare(baseline=report, current=slower, tolerance=0.1) == ["load_data[classification] (300 rows)"]
@@ -0,0 +1,91 @@
+"""Bootstrap confidence intervals test module."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, mean_absolute_error, r2_score, roc_auc_score
+
+from src.ml_pipeline_handler.metric.bootstrap import BootstrapConfig
+from src.ml_pipeline_handler.metric.classification.handler import ClassificationMetricHandler
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.metric.regression.handler import RegressionMetricHandler
+
+
+def resample(n_samples: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Draw the row indices of a bootstrap replicate and the matching weight row.
+
+    Returns:
+        The row indices, and ndarray of shape (1, n_samples) of how often every row is drawn.
+
+    """
+    indices = np.random.default_rng(seed=seed).integers(0, n_samples, size=n_samples)
+    return indices, np.bincount(indices, minlength=n_samples)[np.newaxis].astype(np.float64)
+
+
+def test_classification_statistic_matches_resampled_data() -> None:
+    """Test that the weighted metrics equal the metrics of the resampled rows, with tied probabilities."""
+    rng = np.random.default_rng(seed=0)
+    y_true = rng.integers(0, 3, size=400)
+    y_proba = np.round(rng.dirichlet(alpha=[1, 1, 1], size=400), 1) + 0.01
+    y_proba /= y_proba.sum(axis=1, keepdims=True)
+    y_pred = y_proba.argmax(axis=1)
+    indices, weights = resample(n_samples=400, seed=1)
+
+    handler = ClassificationMetricHandler(model_type=ModelType.CLASSIFICATION)
+    result = handler.bootstrap_statistic(y_true=y_true, y_pred=y_pred, y_proba=y_proba)(weights)[0]
+
+    assert result.roc_auc == pytest.approx(roc_auc_score(y_true[indices], y_proba[indices], multi_class="ovr"))
+    assert result.f1_macro == pytest.approx(f1_score(y_true[indices], y_pred[indices], average="macro"))
+
+
+def test_regression_statistic_matches_resampled_data() -> None:
+    """Test that the weighted regression metrics equal the metrics of the resampled rows."""
+    rng = np.random.default_rng(seed=2)
+    y_true = rng.normal(loc=1e6, size=300)
+    y_pred = y_true + rng.normal(size=300)
+    indices, weights = resample(n_samples=300, seed=3)
+
+    handler = RegressionMetricHandler(model_type=ModelType.REGRESSION)
+    result = handler.bootstrap_statistic(y_true=y_true, y_pred=y_pred)(weights)[0]
+
+    assert result.mean_absolute_error == pytest.approx(mean_absolute_error(y_true[indices], y_pred[indices]))
+    assert result.r_square == pytest.approx(r2_score(y_true[indices], y_pred[indices]))
+
+
+def test_compute_metrics_with_bootstrap() -> None:
+    """Test that the intervals cover the point estimates and are reproducible over blocks and threads."""
+    rng = np.random.default_rng(seed=4)
+    y_true = rng.integers(0, 2, size=2000)
+    scores = np.clip(0.3 * y_true + 0.7 * rng.random(size=2000), 0, 1)
+    y_proba = np.column_stack([1 - scores, scores])
+    config = BootstrapConfig(n_boot=200, block_bytes=20 * 2000 * 8, n_jobs=2, random_state=0)
+
+    handler = ClassificationMetricHandler(model_type=ModelType.CLASSIFICATION)
+    result = handler.compute_metrics(y_true=y_true, y_pred=scores > 0.5, y_proba=y_proba, bootstrap=config)
+    intervals = result.confidence_intervals
+
+    assert intervals is not None
+    assert intervals.n_boot == 200
+    assert intervals.lower["accuracy"] < result.accuracy < intervals.upper["accuracy"]
+    assert intervals.lower["roc_auc"] < result.roc_auc < intervals.upper["roc_auc"]
+    assert intervals == handler.compute_confidence_intervals(
+        y_true=y_true, y_pred=scores > 0.5, y_proba=y_proba, config=config
+    )
+
+
+def test_bootstrap_uses_the_classes_of_the_model() -> None:
+    """Test that a class of the model missing from the scored labels keeps its probability column."""
+    rng = np.random.default_rng(seed=5)
+    y_true = rng.choice([0, 2], size=300)
+    y_proba = np.full((300, 3), 0.1)
+    y_proba[np.arange(300), y_true] = 0.8
+    config = BootstrapConfig(n_boot=50, random_state=0)
+
+    handler = ClassificationMetricHandler(model_type=ModelType.CLASSIFICATION)
+    intervals = handler.compute_confidence_intervals(
+        y_true=y_true, y_pred=y_true, y_proba=y_proba, config=config, classes=np.arange(3)
+    )
+
+    assert intervals.lower["roc_auc"] == pytest.approx(1.0)
+    assert intervals.upper["roc_auc"] == pytest.approx(1.0)
+    with pytest.raises(ValueError, match="one column per class"):
+        handler.bootstrap_statistic(y_true=y_true, y_pred=y_true, y_proba=y_proba)
@@ -0,0 +1,85 @@
+"""Classification metrics engine test module."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support, roc_auc_score
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.classification.engine import ClassificationMetricsEngine, binary_auc
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+def test_engine_matches_sklearn_on_multiclass_labels() -> None:
+    """Test the engine against sklearn on random string labels of three classes, with tied probabilities."""
+    rng = np.random.default_rng(seed=0)
+    classes = np.array(["a", "b", "c"])
+    y_true = classes[rng.integers(0, 3, size=500)]
+    y_pred = np.where(rng.random(500) < 0.7, y_true, classes[rng.integers(0, 3, size=500)])
+    y_proba = rng.dirichlet(alpha=[1, 1, 1], size=500)
+
+    result = ClassificationMetricsEngine.compute(y_true=y_true, y_pred=y_pred, y_proba=y_proba)
+
+    precision, recall, f1, support = precision_recall_fscore_support(y_true=y_true, y_pred=y_pred)
+    assert result.classes == ["a", "b", "c"]
+    assert result.accuracy == pytest.approx(accuracy_score(y_true=y_true, y_pred=y_pred))
+    assert result.confusion_matrix == confusion_matrix(y_true=y_true, y_pred=y_pred).tolist()
+    np.testing.assert_allclose(result.precision, precision)
+    np.testing.assert_allclose(result.recall, recall)
+    np.testing.assert_allclose(result.f1, f1)
+    assert result.support == support.tolist()
+    assert result.f1_macro == pytest.approx(np.mean(f1))
+    assert result.f1_weighted == pytest.approx(np.average(f1, weights=support))
+    assert result.roc_auc == pytest.approx(roc_auc_score(y_true=y_true, y_score=y_proba, multi_class="ovr"))
+
+
+def test_binary_auc_matches_sklearn() -> None:
+    """Test the rank based AUC against sklearn, including tied scores."""
+    rng = np.random.default_rng(seed=1)
+    labels = rng.integers(0, 2, size=300)
+    scores = (labels + rng.normal(size=300)).round(decimals=1)
+
+    assert binary_auc(scores=scores, positives=labels == 1) == pytest.approx(roc_auc_score(labels, scores))
+    assert np.isnan(binary_auc(scores=scores, positives=np.zeros(300, dtype=bool)))
+
+
+def test_engine_uses_the_classes_of_the_model() -> None:
+    """Test that a class of the model missing from the scored labels keeps its probability column."""
+    rng = np.random.default_rng(seed=2)
+    y_true = rng.choice([0, 2], size=200)
+    y_proba = np.zeros((200, 3))
+    y_proba[np.arange(200), y_true] = rng.uniform(0.5, 1.0, size=200)
+    y_proba[:, 1] = 1 - y_proba.sum(axis=1)
+
+    result = ClassificationMetricsEngine.compute(y_true=y_true, y_pred=y_true, y_proba=y_proba, classes=np.arange(3))
+
+    assert result.classes == [0, 1, 2]
+    assert result.support == [int((y_true == 0).sum()), 0, int((y_true == 2).sum())]
+    assert result.roc_auc == pytest.approx(1.0)
+    with pytest.raises(ValueError, match="one column per class"):
+        ClassificationMetricsEngine.compute(y_true=y_true, y_pred=y_true, y_proba=y_proba)
+    with pytest.raises(ValueError, match="not in the classes"):
+        ClassificationMetricsEngine.compute(y_true=y_true, y_pred=y_true, y_proba=y_proba, classes=np.array([0, 1]))
+
+
+def test_iris_pipeline_computes_multiclass_metrics() -> None:
+    """Test that the metrics of a three-class pipeline are computed from its probabilities."""
+    config = PipelineConfig(
+        data_path="src/data/Iris.csv",
+        features=["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"],
+        target_column="Species",
+        algorithm=AlgorithmType.LOGISTIC_REGRESSION,
+        out_file="models/logistic_regression.pkl",
+        random_state=42,
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    prediction, probability = pipeline.predict()
+
+    result = pipeline.compute_metrics(prediction=prediction, probability=probability)
+
+    assert isinstance(result, ClassificationMetricResult)
+    assert len(result.classes) == 3
+    assert result.accuracy > 0.9
+    assert result.roc_auc > 0.9
+    assert np.array(result.confusion_matrix).sum() == len(prediction)
@@ -0,0 +1,64 @@
+from dataclasses import replace
+
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.comparison_runner import compare_algorithms, fit_and_score
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+@pytest.fixture
+def config() -> PipelineConfig:
+    return PipelineConfig(
+        data_path="src/data/housing.csv",
+        features=["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"],
+        target_column="SalePrice",
+        algorithm=AlgorithmType.LINEAR_REGRESSION,
+        out_file="models/whatever.pkl",
+        random_state=42,
+        scale_standard=["GrLivArea", "TotalBsmtSF"],
+    )
+
+
+def test_compare_algorithms_ranks_by_r_square(config: PipelineConfig) -> None:
+    algorithms = [
+        AlgorithmType.LINEAR_REGRESSION,
+        AlgorithmType.DECISION_TREE_REGRESSOR,
+        AlgorithmType.RANDOM_FOREST_REGRESSOR,
+    ]
+    leaderboard = compare_algorithms(config=config, algorithms=algorithms, n_jobs=2)
+
+    assert sorted(result.algorithm for result in leaderboard) == sorted(algorithms)
+    assert all(result.error is None for result in leaderboard)
+    assert all(isinstance(result.metrics, RegressionMetricResult) for result in leaderboard)
+    r_squares = [result.metrics.r_square for result in leaderboard]  # type: ignore[union-attr]
+    assert r_squares == sorted(r_squares, reverse=True)
+
+
+def test_compare_algorithms_matches_sequential_pipeline(config: PipelineConfig) -> None:
+    (result,) = compare_algorithms(config=config, algorithms=[AlgorithmType.LINEAR_REGRESSION], n_jobs=1)
+
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    prediction, probability = pipeline.predict()
+    expected = pipeline.compute_metrics(prediction=prediction, probability=probability)
+
+    assert result.metrics == expected
+
+
+def test_fit_and_score_reports_failures(config: PipelineConfig) -> None:
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    features, target = pipeline.load_data_set()
+    x_train, x_test, y_train, y_test = pipeline.create_training_set(features=features, target=target, test_size=0.3)
+
+    result = fit_and_score(
+        config=replace(config, algorithm=AlgorithmType.SGD_REGRESSOR, scale_robust=["GarageArea"]),
+        x_train=x_train,
+        x_test=x_test,
+        y_train=y_train,
+        y_test=y_test,
+    )
+
+    assert result.metrics is None
+    assert "RobustScaler" in (result.error or "")
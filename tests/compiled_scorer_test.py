@@ -0,0 +1,81 @@
+"""Compiled scorer test module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.compiled_scorer import CompiledScorer
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+HOUSING_FEATURES = ["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"]
+IRIS_FEATURES = ["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"]
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "data_path", "features", "target_column"),
+    [
+        (AlgorithmType.LINEAR_REGRESSION, "src/data/housing.csv", HOUSING_FEATURES, "SalePrice"),
+        (AlgorithmType.DECISION_TREE_REGRESSOR, "src/data/housing.csv", HOUSING_FEATURES, "SalePrice"),
+        (AlgorithmType.LOGISTIC_REGRESSION, "src/data/Iris.csv", IRIS_FEATURES, "Species"),
+        (AlgorithmType.RANDOM_FOREST, "src/data/Iris.csv", IRIS_FEATURES, "Species"),
+    ],
+)
+def test_compiled_scorer_matches_pipeline(
+    algorithm: AlgorithmType, data_path: str, features: list[str], target_column: str
+) -> None:
+    """Test that the compiled path predicts like the fitted ColumnTransformer and estimator.
+
+    Returns:
+        None
+    """
+    config = PipelineConfig(
+        data_path=data_path,
+        features=features,
+        target_column=target_column,
+        algorithm=algorithm,
+        out_file="models/compiled.pkl",
+        random_state=42,
+        scale_standard=features[:2],
+        scale_robust=features[2:3],
+        scale_minmax=features[3:],
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    pipeline.predict()
+    scorer = CompiledScorer.from_pipeline(pipeline=pipeline)
+    data = pd.read_csv(data_path)
+    expected = pipeline.predict_batch(x=data)
+
+    predictions = scorer.predict(x=data[features].to_numpy(dtype=np.float64))
+    if pipeline.metric_handler.model_type == "classification":
+        assert np.array_equal(predictions, expected)
+    else:
+        assert np.allclose(predictions, expected)
+
+    record = data.iloc[7][features]
+    assert scorer.predict_one(row=record.to_dict()) == pytest.approx(expected[7])
+    assert scorer.predict_one(row=record.to_numpy(dtype=np.float64)) == pytest.approx(expected[7])
+
+
+def test_compiled_scorer_collapses_linear_models() -> None:
+    """Test that linear models are folded into a single weight matrix over the input features.
+
+    Returns:
+        None
+    """
+    config = PipelineConfig(
+        data_path="src/data/housing.csv",
+        features=HOUSING_FEATURES,
+        target_column="SalePrice",
+        algorithm=AlgorithmType.LINEAR_REGRESSION,
+        out_file="models/compiled.pkl",
+        random_state=42,
+        scale_standard=HOUSING_FEATURES,
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    pipeline.predict()
+    scorer = CompiledScorer.from_pipeline(pipeline=pipeline)
+
+    assert scorer.weights.shape == (len(HOUSING_FEATURES), 1)
+    assert scorer.bias.shape == (1,)
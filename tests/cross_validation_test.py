@@ -0,0 +1,59 @@
+"""Cross-validation test module."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+def test_cross_validate_regression() -> None:
+    """Test that the result holds the mean of the per-fold metrics, their std and the timings of every fold."""
+    config = PipelineConfig(
+        data_path="src/data/housing.csv",
+        features=["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"],
+        target_column="SalePrice",
+        algorithm=AlgorithmType.LINEAR_REGRESSION,
+        out_file="models/whatever.pkl",
+        random_state=42,
+        scale_standard=["GrLivArea", "TotalBsmtSF"],
+    )
+    result = PipelineFactory.build_pipeline(config=config).cross_validate(n_folds=4, n_jobs=2)
+
+    assert isinstance(result, RegressionMetricResult)
+    cross_validation = result.cross_validation
+    assert cross_validation is not None
+    assert len(cross_validation.folds) == 4
+    assert len(cross_validation.fit_time) == len(cross_validation.predict_time) == 4
+    r_squares = [fold["r_square"] for fold in cross_validation.folds]
+    assert result.r_square == pytest.approx(np.mean(r_squares))
+    assert cross_validation.std["r_square"] == pytest.approx(np.std(r_squares, ddof=1))
+
+
+def test_cross_validate_classification_is_stratified(tmp_path: Path) -> None:
+    """Test that every fold of an imbalanced binary data set contains both classes."""
+    rng = np.random.default_rng(seed=0)
+    data = pd.DataFrame({"feature1": rng.normal(size=300), "feature2": rng.normal(size=300)})
+    data["label"] = (data["feature1"] > 1.3).astype(int)
+    data_path = tmp_path / "data.csv"
+    data.to_csv(data_path, index=False)
+
+    config = PipelineConfig(
+        data_path=str(data_path),
+        features=["feature1", "feature2"],
+        target_column="label",
+        algorithm=AlgorithmType.DECISION_TREE_CLASSIFIER,
+        out_file="models/whatever.pkl",
+        random_state=42,
+    )
+    result = PipelineFactory.build_pipeline(config=config).cross_validate(n_folds=5, n_jobs=1)
+
+    assert isinstance(result, ClassificationMetricResult)
+    assert result.cross_validation is not None
+    assert all(fold["accuracy"] > 0.9 for fold in result.cross_validation.folds)
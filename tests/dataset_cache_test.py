@@ -0,0 +1,95 @@
+"""Dataset cache test module."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from src.ml_pipeline_handler.io.cache import DatasetCache, fingerprint
+from src.ml_pipeline_handler.io.loader import load_data
+
+
+def write_csv(path: Path, rows: int = 5) -> str:
+    """Write a small CSV file with a numeric, a string and a target column.
+
+    Returns:
+        The path of the CSV file.
+    """
+    lines = ["num,text,target"] + [f"{i}.5,{'ab'[i % 2]},{i % 2}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Test that cached columns are equal to the parsed ones and memory-mapped.
+
+    Returns:
+        None
+    """
+    data_path = write_csv(tmp_path / "data.csv")
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"))
+
+    first = cache.load(data_path=data_path, columns=["num", "text"])
+    second = cache.load(data_path=data_path)
+
+    assert first["text"].tolist() == ["a", "b", "a", "b", "a"]
+    assert second["num"].tolist() == first["num"].tolist()
+    assert second["target"].tolist() == [0, 1, 0, 1, 0]
+    assert isinstance(second["num"].to_numpy().base, np.memmap)
+
+
+def test_cache_evicts_stale_entries(tmp_path: Path) -> None:
+    """Test that rewriting the CSV invalidates the old entry and evicts it.
+
+    Returns:
+        None
+    """
+    data_path = write_csv(tmp_path / "data.csv")
+    cache_dir = tmp_path / "cache"
+    cache = DatasetCache(cache_dir=str(cache_dir))
+    cache.load(data_path=data_path)
+    old_key = fingerprint(data_path=data_path)
+
+    write_csv(tmp_path / "data.csv", rows=7)
+    os.utime(data_path, ns=(0, 0))
+    data = cache.load(data_path=data_path)
+
+    assert len(data) == 7
+    assert [entry.name for entry in cache_dir.iterdir()] == [fingerprint(data_path=data_path)]
+    assert fingerprint(data_path=data_path) != old_key
+
+
+def test_load_data_through_cache(tmp_path: Path) -> None:
+    """Test that load_data returns the same features and target with and without the cache.
+
+    Returns:
+        None
+    """
+    data_path = write_csv(tmp_path / "data.csv")
+    x, y = load_data(data_path=data_path, target_column="target", features=["num"])
+    x_cached, y_cached = load_data(
+        data_path=data_path, target_column="target", features=["num"], cache_dir=str(tmp_path / "cache")
+    )
+    assert x_cached.equals(x)
+    assert y_cached.equals(y)
+
+
+def test_load_data_through_cache_with_dtypes(tmp_path: Path) -> None:
+    """Test that explicit dtypes are applied when parsing, so cached loads keep the values of uncached loads.
+
+    Returns:
+        None
+    """
+    data_path = tmp_path / "data.csv"
+    data_path.write_text("zip,num,target\n00123,1.5,0\n04567,2.5,1\n00123,3.5,0\n")
+    x, y = load_data(data_path=str(data_path), target_column="target", dtypes={"zip": "str"})
+    assert x["zip"].tolist() == ["00123", "04567", "00123"]
+
+    cache_dir = str(tmp_path / "cache")
+    load_data(data_path=str(data_path), target_column="target", cache_dir=cache_dir)
+    for _ in range(2):
+        x_cached, y_cached = load_data(
+            data_path=str(data_path), target_column="target", dtypes={"zip": "str"}, cache_dir=cache_dir
+        )
+        assert x_cached.equals(x)
+        assert y_cached.equals(y)
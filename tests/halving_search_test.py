@@ -0,0 +1,60 @@
+"""Successive halving search test module."""
+
+from pathlib import Path
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.search.halving_search import SearchConfig, halving_search, resource_schedule
+from src.ml_pipeline_handler.search.search_space import SEARCH_SPACES, SearchSpace
+
+
+def build_config(algorithm: AlgorithmType, out_file: Path) -> PipelineConfig:
+    return PipelineConfig(
+        data_path="src/data/housing.csv",
+        features=["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"],
+        target_column="SalePrice",
+        algorithm=algorithm,
+        out_file=str(out_file),
+        random_state=42,
+        scale_standard=["GrLivArea", "TotalBsmtSF"],
+    )
+
+
+def test_every_algorithm_has_a_search_space() -> None:
+    """Test that a search space is declared for every algorithm and its parameters exist on the estimator."""
+    for algorithm in AlgorithmType:
+        pipeline = PipelineFactory.build_pipeline(config=build_config(algorithm=algorithm, out_file=Path("x.pkl")))
+        space = SEARCH_SPACES[algorithm]
+        assert set(space.params) <= set(pipeline.model.get_params())
+
+
+def test_resource_schedule_grows_by_factor() -> None:
+    """Test that the resource grows by factor between rounds and never exceeds the maximum."""
+    assert resource_schedule(space=SearchSpace(min_resource=30), n_candidates=27, factor=3, n_rows=900) == [
+        33,
+        99,
+        297,
+        891,
+    ]
+    trees = SearchSpace(resource="n_estimators", min_resource=10, max_resource=200)
+    assert resource_schedule(space=trees, n_candidates=9, factor=3, n_rows=900) == [22, 66, 198]
+
+
+def test_halving_search_saves_the_best_pipeline(tmp_path: Path) -> None:
+    """Test that the search respects the trial budget, sets the best parameters and saves the refitted pipeline."""
+    out_file = tmp_path / "best.pkl"
+    config = build_config(algorithm=AlgorithmType.DECISION_TREE_REGRESSOR, out_file=out_file)
+
+    result = halving_search(config=config, search_config=SearchConfig(n_candidates=9, max_trials=12, n_jobs=2))
+
+    assert len(result.trials) <= 12
+    assert {trial.round for trial in result.trials} == {0, 1}
+    assert all(trial.wall_time > 0 for trial in result.trials)
+    assert len({trial.wall_time for trial in result.trials}) == len(result.trials)
+    assert result.best_score > 0.5
+    assert isinstance(result.metrics, RegressionMetricResult)
+    for name, value in result.best_params.items():
+        assert result.pipeline.model.get_params()[name] == value
+    assert out_file.exists()
@@ -0,0 +1,60 @@
+"""Histogram gradient boosting pipeline test module."""
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+def test_hist_gradient_boosting_regressor_handles_categoricals() -> None:
+    """Test that category columns reach the estimator through the scalers and are split on natively."""
+    config = PipelineConfig(
+        data_path="src/data/housing.csv",
+        features=["BldgType", "HouseStyle", "OverallQual", "GrLivArea", "YearBuilt", "GarageCars"],
+        target_column="SalePrice",
+        algorithm=AlgorithmType.HIST_GRADIENT_BOOSTING_REGRESSOR,
+        out_file="models/hist_gradient_boosting_regressor.pkl",
+        random_state=42,
+        scale_standard=["GrLivArea"],
+        dtypes={"BldgType": "category", "HouseStyle": "category"},
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    prediction, probability = pipeline.predict()
+    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+
+    assert isinstance(metrics, RegressionMetricResult)
+    assert metrics.r_square > 0.7
+    assert probability is None
+    categorical = dict(zip(pipeline.model.feature_names_in_, pipeline.model.is_categorical_, strict=True))
+    assert categorical == {
+        "GrLivArea": False,
+        "BldgType": True,
+        "HouseStyle": True,
+        "OverallQual": False,
+        "YearBuilt": False,
+        "GarageCars": False,
+    }
+    assert pipeline.model.validation_score_.size == pipeline.model.n_iter_ + 1
+
+
+def test_hist_gradient_boosting_classifier_stops_early() -> None:
+    """Test that the classifier stops before max_iter once the validation loss stops improving."""
+    config = PipelineConfig(
+        data_path="src/data/Iris.csv",
+        features=["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"],
+        target_column="Species",
+        algorithm=AlgorithmType.HIST_GRADIENT_BOOSTING_CLASSIFIER,
+        out_file="models/hist_gradient_boosting_classifier.pkl",
+        random_state=42,
+        model_params={"max_iter": 500},
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    prediction, probability = pipeline.predict()
+    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+
+    assert isinstance(metrics, ClassificationMetricResult)
+    assert metrics.accuracy > 0.9
+    assert probability is not None
+    assert probability.shape == (len(prediction), 3)
+    assert pipeline.model.n_iter_ < 500
@@ -0,0 +1,66 @@
+"""Import time test module."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_pipeline import BasePipeline
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+ROOT = Path(__file__).parents[1]
+# Budgets of the summed import time, with headroom for slow machines: --help imported in ~35ms and a linear regression
+# pipeline in ~0.5s when they were set, --help took ~0.6s while the factory imported every pipeline.
+HELP_BUDGET_S = 0.2
+PIPELINE_BUDGET_S = 2.0
+
+
+def import_times(*args: str) -> tuple[dict[str, float], str]:
+    """Run python -X importtime, return the self import time of every module in seconds and the output."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            self_time, _, module = line.removeprefix("import time:").split("|")
+            if self_time.strip().isdigit():
+                times[module.strip()] = int(self_time) / 1e6
+    return times, result.stdout
+
+
+def test_cli_help_does_not_import_heavy_modules() -> None:
+    """Test that --help only imports argparse and the algorithm names."""
+    times, _ = import_times("src/cli.py", "--help")
+    assert not {"numpy", "pandas", "sklearn", "scipy", "joblib", "loguru"} & times.keys()
+    assert sum(times.values()) < HELP_BUDGET_S
+
+
+def test_pipeline_imports_only_its_estimators() -> None:
+    """Test that building one algorithm does not import the estimator modules of the other algorithms."""
+    code = (
+        "import sys; from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory; "
+        "PipelineFactory.get_pipeline_class(algorithm='linear_regression'); print(*sys.modules, sep='\\n')"
+    )
+    # Modules imported with importlib.import_module are not reported by -X importtime, sys.modules lists them.
+    times, output = import_times("-c", code)
+    modules = set(output.split())
+    assert "src.ml_pipeline_handler.pipeline.regression.linear_regression_pipeline" in modules
+    assert not {"sklearn.tree", "sklearn.ensemble", "src.ml_pipeline_handler.pipeline.incremental_pipeline"} & modules
+    assert sum(times.values()) < PIPELINE_BUDGET_S
+
+
+def test_registry_covers_every_algorithm() -> None:
+    """Test that every algorithm resolves to a pipeline class and unknown names are rejected."""
+    for algorithm in AlgorithmType:
+        assert issubclass(PipelineFactory.get_pipeline_class(algorithm=algorithm), BasePipeline)
+    with pytest.raises(NotImplementedError, match="not implemented"):
+        PipelineFactory.get_pipeline_class(algorithm="unknown")
@@ -0,0 +1,67 @@
+"""Learning curve test module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.learning_curve import learning_curve, shuffled_order, training_sizes
+
+
+def test_learning_curve_fits_every_size_in_parallel() -> None:
+    """Test that every training size of a forest is fitted from scratch and scored on the same testing set."""
+    config = PipelineConfig(
+        data_path="src/data/housing.csv",
+        features=["OverallQual", "GrLivArea", "GarageCars", "TotalBsmtSF"],
+        target_column="SalePrice",
+        algorithm=AlgorithmType.RANDOM_FOREST_REGRESSOR,
+        out_file="models/whatever.pkl",
+        random_state=42,
+        scale_robust=["GrLivArea"],
+        model_params={"n_estimators": 20},
+    )
+    points = learning_curve(config=config, fractions=[0.1, 1.0, 0.5], n_jobs=2)
+
+    assert [point.n_rows for point in points] == [102, 511, 1022]
+    assert [point.fraction for point in points] == [0.1, 0.5, 1.0]
+    assert all(point.error is None and not point.warm_start for point in points)
+    assert all(isinstance(point.metrics, RegressionMetricResult) for point in points)
+    assert points[-1].metrics.r_square > points[0].metrics.r_square  # type: ignore[union-attr]
+
+
+def test_learning_curve_warm_starts_linear_solvers() -> None:
+    """Test that logistic regression fits the sizes in one warm started chain, with the class shares in every size."""
+    config = PipelineConfig(
+        data_path="src/data/Iris.csv",
+        features=["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"],
+        target_column="Species",
+        algorithm=AlgorithmType.LOGISTIC_REGRESSION,
+        out_file="models/whatever.pkl",
+        random_state=42,
+        scale_standard=["SepalLengthCm", "SepalWidthCm", "PetalLengthCm", "PetalWidthCm"],
+    )
+    points = learning_curve(config=config, fractions=[0.1, 0.5, 1.0])
+
+    assert all(point.warm_start and point.error is None for point in points)
+    assert all(isinstance(point.metrics, ClassificationMetricResult) for point in points)
+    assert points[-1].metrics.accuracy > 0.9  # type: ignore[union-attr]
+
+
+def test_shuffled_prefixes_keep_the_class_shares() -> None:
+    """Test that every prefix of a classification order is close to the class shares of the training set."""
+    target = pd.Series(np.repeat(["a", "b", "c"], [800, 150, 50]))
+    order = shuffled_order(target=target, classification=True, random_state=0)
+
+    assert sorted(order) == list(range(len(target)))
+    counts = target.iloc[order[:100]].value_counts().to_dict()
+    assert counts == {"a": 80, "b": 15, "c": 5}
+
+
+def test_training_sizes_are_validated() -> None:
+    """Test that fractions map to distinct sizes of at least one row and must be in (0, 1]."""
+    assert training_sizes(fractions=[1.0, 0.001, 0.002, 0.5], n_rows=200) == [(0.001, 1), (0.5, 100), (1.0, 200)]
+    with pytest.raises(ValueError, match="not in"):
+        training_sizes(fractions=[0.5, 1.5], n_rows=200)
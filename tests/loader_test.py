@@ -0,0 +1,76 @@
+"""Data loader test module."""
+
+from pathlib import Path
+
+import pytest
+
+from src.ml_pipeline_handler.io.loader import load_data
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> str:
+    """Write a small wide CSV file.
+
+    Returns:
+        The path of the CSV file.
+    """
+    path = tmp_path / "data.csv"
+    path.write_text("a,b,c,label,unused\n1.5,1,x,0,foo\n2.5,2,y,1,bar\n3.5,300,x,0,baz\n4.5,4,x,1,qux\n")
+    return str(path)
+
+
+def test_load_data_all_columns(csv_path: str) -> None:
+    """Test that without features every column except the target is returned.
+
+    Returns:
+        None
+    """
+    x, y = load_data(data_path=csv_path, target_column="label")
+    assert list(x.columns) == ["a", "b", "c", "unused"]
+    assert y.tolist() == [0, 1, 0, 1]
+
+
+def test_load_data_projects_features(csv_path: str) -> None:
+    """Test that only the requested features and the target are parsed.
+
+    Returns:
+        None
+    """
+    x, y = load_data(data_path=csv_path, target_column="label", features=["b", "a"])
+    assert list(x.columns) == ["a", "b"]
+    assert y.name == "label"
+
+
+def test_load_data_compact_dtypes(csv_path: str) -> None:
+    """Test that compaction downcasts numeric and low cardinality string columns.
+
+    Returns:
+        None
+    """
+    x, y = load_data(data_path=csv_path, target_column="label", features=["a", "b", "c"], compact=True)
+    assert x["a"].dtype == "float32"
+    assert x["b"].dtype == "uint16"
+    assert x["c"].dtype == "category"
+    assert y.dtype == "uint8"
+
+
+def test_load_data_explicit_dtypes(csv_path: str) -> None:
+    """Test that explicit dtypes are kept as given even when compacting.
+
+    Returns:
+        None
+    """
+    x, _ = load_data(data_path=csv_path, target_column="label", features=["a"], dtypes={"a": "float64"}, compact=True)
+    assert x["a"].dtype == "float64"
+
+
+def test_load_data_missing_columns(csv_path: str) -> None:
+    """Test that missing target or feature columns raise a ValueError.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Target column"):
+        load_data(data_path=csv_path, target_column="missing")
+    with pytest.raises(ValueError, match="Feature columns"):
+        load_data(data_path=csv_path, target_column="label", features=["missing"])
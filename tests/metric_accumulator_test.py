@@ -0,0 +1,85 @@
+"""Metric accumulator test module."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from src.ml_pipeline_handler.metric.classification.accumulator import ClassificationMetricAccumulator
+from src.ml_pipeline_handler.metric.classification.handler import ClassificationMetricHandler
+from src.ml_pipeline_handler.metric.metric_factory import MetricFactory
+from src.ml_pipeline_handler.metric.model_type import ModelType
+from src.ml_pipeline_handler.metric.regression.accumulator import RegressionMetricAccumulator
+from src.ml_pipeline_handler.metric.regression.handler import RegressionMetricHandler
+
+
+def test_regression_accumulator_matches_handler() -> None:
+    """Test that batches merged from several accumulators give the metrics of the full arrays."""
+    rng = np.random.default_rng(seed=0)
+    y_true = rng.normal(loc=1e6, scale=3.0, size=1000)
+    y_pred = y_true + rng.normal(size=1000)
+
+    accumulators = [RegressionMetricAccumulator() for _ in range(3)]
+    for index, start in enumerate(range(0, 1000, 70)):
+        accumulators[index % 3].update(y_true=y_true[start : start + 70], y_pred=y_pred[start : start + 70])
+    result = accumulators[0].merge(accumulators[1]).merge(accumulators[2]).result()
+
+    expected = RegressionMetricHandler(model_type=ModelType.REGRESSION).compute_metrics(y_true=y_true, y_pred=y_pred)
+    assert result.mean_absolute_error == pytest.approx(expected.mean_absolute_error)
+    assert result.mean_squared_error == pytest.approx(expected.mean_squared_error)
+    assert result.r_square == pytest.approx(expected.r_square, rel=1e-9)
+
+
+def test_classification_accumulator_matches_handler() -> None:
+    """Test that the chunked confusion matrix metrics are exact and the binned ROC AUC close to the exact one."""
+    rng = np.random.default_rng(seed=1)
+    classes = np.array(["a", "b", "c"])
+    y_true = classes[rng.integers(0, 3, size=900)]
+    y_proba = rng.dirichlet(alpha=[1, 1, 1], size=900)
+    y_proba[np.arange(900), np.searchsorted(classes, y_true)] += 0.5
+    y_proba /= y_proba.sum(axis=1, keepdims=True)
+    y_pred = classes[y_proba.argmax(axis=1)]
+
+    accumulator = MetricFactory.get_metrics_accumulator(model_type=ModelType.CLASSIFICATION, classes=classes)
+    other = MetricFactory.get_metrics_accumulator(model_type=ModelType.CLASSIFICATION, classes=classes)
+    accumulator.update(y_true=y_true[:400], y_pred=y_pred[:400], y_proba=y_proba[:400])
+    other.update(y_true=y_true[400:], y_pred=y_pred[400:], y_proba=y_proba[400:])
+    result = accumulator.merge(other).result()
+
+    expected = ClassificationMetricHandler(model_type=ModelType.CLASSIFICATION).compute_metrics(
+        y_true=y_true, y_pred=y_pred, y_proba=y_proba
+    )
+    assert result.confusion_matrix == expected.confusion_matrix
+    assert result.f1_weighted == pytest.approx(expected.f1_weighted)
+    assert result.roc_auc == pytest.approx(roc_auc_score(y_true, y_proba, multi_class="ovr"), abs=1e-3)
+
+
+def test_classification_accumulator_collects_classes() -> None:
+    """Test that classes appearing in later batches or merged accumulators grow the confusion matrix."""
+    first, second = ClassificationMetricAccumulator(), ClassificationMetricAccumulator()
+    first.update(y_true=np.array([1, 1, 2]), y_pred=np.array([1, 2, 2]))
+    second.update(y_true=np.array([0, 3]), y_pred=np.array([0, 1]))
+    result = first.merge(second).result()
+
+    assert result.classes == [0, 1, 2, 3]
+    assert result.confusion_matrix == [[1, 0, 0, 0], [0, 1, 1, 0], [0, 0, 1, 0], [0, 1, 0, 0]]
+    assert np.isnan(result.roc_auc)
+    with pytest.raises(ValueError, match="classes of the model are required"):
+        first.update(y_true=np.array([1]), y_pred=np.array([1]), y_proba=np.array([[0.0, 1.0, 0.0, 0.0]]))
+
+
+def test_classification_accumulator_binary_targets() -> None:
+    """Test binary targets without classes, with positive class probabilities and merged into other accumulators."""
+    collected = ClassificationMetricAccumulator()
+    collected.update(y_true=[0, 1, 1, 0], y_pred=[0, 1, 0, 0])
+    result = collected.result()
+    assert result.accuracy == pytest.approx(0.75)
+    assert np.isnan(result.roc_auc)
+
+    y_true, y_proba = np.array([0, 1, 1, 0, 1]), np.array([0.1, 0.8, 0.4, 0.3, 0.9])
+    accumulator = ClassificationMetricAccumulator(classes=[0, 1])
+    accumulator.update(y_true=y_true, y_pred=(y_proba > 0.5).astype(int), y_proba=y_proba)
+    assert accumulator.result().roc_auc == pytest.approx(roc_auc_score(y_true, y_proba))
+    with pytest.raises(ValueError, match="one column per class"):
+        accumulator.update(y_true=y_true, y_pred=y_true, y_proba=np.ones(shape=(5, 3)))
+    with pytest.raises(ValueError, match="must share their classes"):
+        ClassificationMetricAccumulator().merge(accumulator)
@@ -45,12 +45,12 @@ classification_y_true = np.array([0, 1, 1, 0, 1, 0])
 classification_y_pred = np.array([0, 1, 1, 0, 0, 1])
 classification_y_proba = np.array(
     [
-        [0.2, 0.8, 0.9, 0.3, 0.4, 0.6],
-        [1, 2, 3, 4, 5, 6],
-        [1, 2, 3, 4, 5, 6],
-        [1, 2, 3, 4, 5, 6],
-        [1, 2, 3, 4, 5, 6],
-        [1, 2, 3, 4, 5, 6],
+        [0.2, 0.8],
+        [1, 2],
+        [1, 2],
+        [1, 2],
+        [1, 2],
+        [1, 2],
     ]
 )
 
@@ -0,0 +1,90 @@
+"""Parallelism test module."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from threadpoolctl import threadpool_info
+
+from benchmarks.parallel_scaling import core_counts, run_scaling
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.parallelism import blas_limits, parallel_pool, split_n_jobs
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+CONFIG = PipelineConfig(
+    data_path="src/data/housing.csv",
+    features=["OverallQual", "GrLivArea", "GarageCars"],
+    target_column="SalePrice",
+    algorithm=AlgorithmType.RANDOM_FOREST_REGRESSOR,
+    out_file="models/whatever.pkl",
+    random_state=42,
+    model_params={"n_estimators": 10},
+)
+
+
+def test_split_n_jobs_shares_the_cores_between_workers() -> None:
+    """Test that a pool never gets more workers than tasks and that its workers share the cores."""
+    assert split_n_jobs(n_jobs=8, n_tasks=4) == (4, 2)
+    assert split_n_jobs(n_jobs=8, n_tasks=3) == (3, 2)
+    assert split_n_jobs(n_jobs=2, n_tasks=5) == (2, 1)
+    assert split_n_jobs(n_jobs=None, n_tasks=5) == (1, 1)
+    assert core_counts(max_cores=6) == [1, 2, 4, 6]
+    assert core_counts(max_cores=1) == [1]
+
+
+def test_parallel_pool_configures_its_workers() -> None:
+    """Test that process workers limit their own BLAS threads while thread workers share the limit of the pool."""
+    with parallel_pool(config=replace(CONFIG, n_jobs=4, blas_threads=8), n_tasks=2) as (_, worker_config):
+        assert (worker_config.n_jobs, worker_config.blas_threads) == (2, 2)
+    with parallel_pool(config=replace(CONFIG, n_jobs=4, backend="threading"), n_tasks=4) as (parallel, worker_config):
+        assert (worker_config.n_jobs, worker_config.blas_threads) == (1, None)
+        assert parallel(iter([])) == []
+    with (
+        pytest.raises(ValueError, match="is not one of"),
+        parallel_pool(config=replace(CONFIG, backend="dask"), n_tasks=2),
+    ):
+        pass
+
+
+def test_blas_limits() -> None:
+    """Test that the BLAS threads are limited inside the context only."""
+    with blas_limits(blas_threads=1):
+        assert all(library["num_threads"] == 1 for library in threadpool_info())
+    with blas_limits(blas_threads=None):
+        pass
+
+
+def test_estimators_and_workers_follow_n_jobs() -> None:
+    """Test that the estimator gets config.n_jobs and the copies fitted by the workers get their share of it."""
+    pipeline = PipelineFactory.build_pipeline(config=replace(CONFIG, n_jobs=3))
+    assert pipeline.model.n_jobs == 3
+    assert pipeline.model.n_estimators == 10
+
+    copy = pipeline.fresh_copy(config=replace(pipeline.config, n_jobs=1))
+    assert copy.model.n_jobs == 1
+    assert copy.model.n_estimators == 10
+
+    result = pipeline.cross_validate(n_folds=3, n_jobs=2)
+    assert result.cross_validation is not None
+    assert len(result.cross_validation.folds) == 3
+
+
+def test_run_scaling(tmp_path: Path) -> None:
+    """Test that the scaling benchmark reports every parallel path at every number of cores."""
+    report = run_scaling(
+        n_rows=300,
+        algorithm=AlgorithmType.DECISION_TREE_REGRESSOR,
+        data_dir=tmp_path,
+        max_cores=2,
+        repeats=1,
+        n_boot=50,
+        cv_folds=2,
+    )
+    results = {(result["name"], result["n_jobs"]): result for result in report["results"]}
+
+    assert results.keys() == {
+        (name, n_jobs) for name in ("fit_predict", "cross_validate", "bootstrap") for n_jobs in (1, 2)
+    }
+    assert all(result["speedup"] == 1.0 for (_, n_jobs), result in results.items() if n_jobs == 1)
+    assert report["metadata"]["backend"] == "loky"
@@ -0,0 +1,106 @@
+"""Forest retraining test module."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.io.loader import load_model
+from src.ml_pipeline_handler.io.saver import save_artifact
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.pipeline.retrain import artifact_config, retrain_forest
+
+
+@pytest.fixture
+def batches(tmp_path: Path) -> tuple[str, str]:
+    """Split the housing dataset into an old and a new batch of CSV files.
+
+    Returns:
+        The paths of the old and the new batch.
+
+    """
+    data = pd.read_csv("src/data/housing.csv")
+    old, new = tmp_path / "old.csv", tmp_path / "new.csv"
+    data.iloc[:730].to_csv(old, index=False)
+    data.iloc[730:].to_csv(new, index=False)
+    return str(old), str(new)
+
+
+def save_forest(tmp_path: Path, data_path: str, algorithm: AlgorithmType, **kwargs) -> str:
+    """Fit a forest of 20 trees on a batch and save it as a slim model artifact.
+
+    Returns:
+        The path of the artifact.
+
+    """
+    config = PipelineConfig(
+        data_path=data_path,
+        out_file=str(tmp_path / "old.art"),
+        algorithm=algorithm,
+        random_state=42,
+        model_params={"n_estimators": 20},
+        **kwargs,
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    pipeline.predict()
+    save_artifact(model=pipeline, file_name=config.out_file)
+    return config.out_file
+
+
+def test_retrain_replaces_the_oldest_trees(tmp_path: Path, batches: tuple[str, str]) -> None:
+    """Test that the kept trees and the pre-processor are reused as is and new trees are fitted on the new data."""
+    old_data, new_data = batches
+    model_file = save_forest(
+        tmp_path=tmp_path,
+        data_path=old_data,
+        algorithm=AlgorithmType.RANDOM_FOREST_REGRESSOR,
+        features=["OverallQual", "GrLivArea", "GarageCars", "TotalBsmtSF"],
+        target_column="SalePrice",
+        scale_standard=["GrLivArea", "TotalBsmtSF"],
+    )
+    old = load_model(file_name=model_file)
+
+    artifact = load_model(file_name=model_file)
+    config = artifact_config(artifact=artifact, data_path=new_data, out_file=str(tmp_path / "new.art"))
+    result = retrain_forest(artifact=artifact, config=config, n_new_trees=10, drop_oldest=5)
+
+    assert isinstance(result.metrics, RegressionMetricResult)
+    assert result.metrics.r_square > 0.7
+    new = load_model(file_name=str(tmp_path / "new.art"))
+    assert new.config["data_path"] == new_data
+    assert len(new.model.estimators_) == 25
+    assert not new.model.warm_start
+    for kept, tree in zip(old.model.estimators_[5:], new.model.estimators_[:15], strict=True):
+        assert np.array_equal(kept.tree_.threshold, tree.tree_.threshold)
+    kept_seeds = {tree.random_state for tree in new.model.estimators_[:15]}
+    assert kept_seeds.isdisjoint(tree.random_state for tree in new.model.estimators_[15:])
+    assert np.array_equal(
+        new.pre_processor.transformers_[0][1][0].mean_, old.pre_processor.transformers_[0][1][0].mean_
+    )
+
+
+def test_retrain_rejects_other_models(tmp_path: Path, batches: tuple[str, str]) -> None:
+    """Test that only forests are retrained, with the classes they were trained on."""
+    old_data, new_data = batches
+    model_file = save_forest(
+        tmp_path=tmp_path,
+        data_path=old_data,
+        algorithm=AlgorithmType.RANDOM_FOREST,
+        features=["GrLivArea", "TotalBsmtSF"],
+        target_column="OverallQual",
+    )
+    artifact = load_model(file_name=model_file)
+    config = artifact_config(artifact=artifact, data_path=new_data, out_file=str(tmp_path / "new.art"))
+
+    with pytest.raises(ValueError, match="at least one tree"):
+        retrain_forest(artifact=artifact, config=config, n_new_trees=5, drop_oldest=20)
+    artifact.model.classes_ = artifact.model.classes_[1:]
+    with pytest.raises(ValueError, match="share their classes"):
+        retrain_forest(artifact=artifact, config=config, n_new_trees=5)
+    artifact.algorithm = AlgorithmType.DECISION_TREE_CLASSIFIER.value
+    with pytest.raises(ValueError, match="not a random forest"):
+        retrain_forest(artifact=artifact, config=config, n_new_trees=5)
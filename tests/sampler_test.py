@@ -0,0 +1,120 @@
+"""Sampling stage test module."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.io import sampler
+from src.ml_pipeline_handler.io.sampler import allocate_rows, load_sample, parse_sample_size, sample_data
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+
+
+@pytest.fixture
+def data_path(tmp_path: Path) -> str:
+    rng = np.random.default_rng(seed=0)
+    n_rows = 5000
+    data = pd.DataFrame(
+        {
+            "feature1": rng.normal(size=n_rows),
+            "feature2": rng.choice(["a", "b", "c"], size=n_rows),
+            "target": rng.choice(["common", "rare"], size=n_rows, p=[0.95, 0.05]),
+        }
+    )
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    ("method", "size", "n_rows"),
+    [("uniform", 0.1, None), ("uniform", 300, 300), ("reservoir", 300, 300), ("reservoir", 0.1, 500)],
+)
+def test_sample_does_not_depend_on_the_chunk_size(data_path: str, method: str, size: float, n_rows: int) -> None:
+    """Test that every method draws the same rows whatever the chunk size, with the requested number of rows."""
+    samples = [
+        sample_data(
+            data_path=data_path,
+            target_column="target",
+            features=["feature1", "feature2"],
+            size=size,
+            method=method,
+            chunk_size=chunk_size,
+            dtypes={"feature2": "category"},
+        )
+        for chunk_size in (128, 5000)
+    ]
+    (x, y), (other_x, _) = samples
+
+    assert x.index.equals(other_x.index)
+    assert x.index.is_monotonic_increasing
+    assert x.index.equals(y.index)
+    assert isinstance(x["feature2"].dtype, pd.CategoricalDtype)
+    if n_rows is None:
+        assert 400 < len(y) < 600
+    else:
+        assert len(y) == n_rows
+
+
+def test_stratified_sample_keeps_the_class_shares(data_path: str) -> None:
+    """Test that every class keeps its share of the rows, even the rare one."""
+    counts = pd.read_csv(data_path)["target"].value_counts()
+    _, y = sample_data(
+        data_path=data_path, target_column="target", features=["feature1"], size=0.02, method="stratified"
+    )
+    assert y.value_counts().to_dict() == {label: round(count * 0.02) for label, count in counts.items()}
+
+    assert allocate_rows(counts=pd.Series({"a": 5, "b": 3, "c": 2}), fraction=None, rows=7) == {"a": 4, "b": 2, "c": 1}
+    assert allocate_rows(counts=pd.Series({"a": 500, "b": 10}), fraction=0.01, rows=None) == {"a": 5, "b": 1}
+    with pytest.raises(ValueError, match="categorical target"):
+        sample_data(data_path=data_path, target_column="feature1", features=["feature2"], size=0.1, method="stratified")
+
+
+def test_sample_size_and_method_are_validated(data_path: str) -> None:
+    """Test that sizes are read as fractions or row caps and that invalid settings are rejected."""
+    assert parse_sample_size(size=0.01) == (0.01, None)
+    assert parse_sample_size(size=1000) == (None, 1000)
+    for size in (0, 12.5):
+        with pytest.raises(ValueError, match="Sample size"):
+            parse_sample_size(size=size)
+    with pytest.raises(ValueError, match="is not one of"):
+        sample_data(data_path=data_path, target_column="target", features=["feature1"], size=0.1, method="systematic")
+
+
+def test_sample_is_cached_on_disk(tmp_path: Path, data_path: str) -> None:
+    """Test that a later process reuses the sample written to the cache directory instead of reading the file."""
+    settings = {"data_path": data_path, "target_column": "target", "features": ["feature1"], "size": 100}
+    x, y = load_sample(**settings, cache_dir=str(tmp_path / "cache"))
+    assert len(list((tmp_path / "cache").glob("sample-*.pkl"))) == 1
+
+    sampler._samples.clear()
+    cached_x, cached_y = load_sample(**settings, cache_dir=str(tmp_path / "cache"), chunk_size=7)
+    assert cached_x.equals(x)
+    assert cached_y.equals(y)
+    assert load_sample(**settings, cache_dir=str(tmp_path / "cache"))[0] is cached_x
+
+
+@pytest.mark.parametrize("algorithm", [AlgorithmType.LOGISTIC_REGRESSION, AlgorithmType.SGD_CLASSIFIER])
+def test_pipelines_fit_on_the_sample(data_path: str, algorithm: AlgorithmType) -> None:
+    """Test that in-memory and incremental pipelines split and fit the sampled rows only."""
+    config = PipelineConfig(
+        data_path=data_path,
+        features=["feature1"],
+        target_column="target",
+        algorithm=algorithm,
+        out_file="models/whatever.pkl",
+        random_state=42,
+        scale_standard=["feature1"],
+        sample=1000,
+        sample_method="stratified",
+        chunk_size=256,
+    )
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    prediction, _ = pipeline.predict()
+
+    assert pipeline.y_test is not None
+    assert len(prediction) == len(pipeline.y_test)
+    assert 200 < len(prediction) < 400
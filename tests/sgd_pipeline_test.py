@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.metric.classification.result import ClassificationMetricResult
+from src.ml_pipeline_handler.metric.regression.result import RegressionMetricResult
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.classification.sgd_classifier_pipeline import SGDClassifierPipeline
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.pipeline.regression.sgd_regressor_pipeline import SGDRegressorPipeline
+
+
+@pytest.fixture
+def data_path(tmp_path: Path) -> str:
+    rng = np.random.default_rng(seed=0)
+    x = rng.normal(loc=50.0, scale=10.0, size=(2000, 2))
+    data = pd.DataFrame({"feature1": x[:, 0], "feature2": x[:, 1], "noise": rng.normal(size=2000)})
+    data["value"] = 3 * data["feature1"] - 2 * data["feature2"]
+    data["label"] = (data["feature1"] > data["feature2"]).astype(int)
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+def build_config(data_path: str, algorithm: AlgorithmType, target_column: str, **kwargs) -> PipelineConfig:
+    return PipelineConfig(
+        data_path=data_path,
+        features=["feature1", "feature2", "noise"],
+        target_column=target_column,
+        algorithm=algorithm,
+        out_file="models/sgd.pkl",
+        random_state=42,
+        chunk_size=256,
+        **kwargs,
+    )
+
+
+def test_sgd_regressor_pipeline(data_path: str):
+    config = build_config(data_path, AlgorithmType.SGD_REGRESSOR, "value", scale_standard=["feature1", "feature2"])
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    assert isinstance(pipeline, SGDRegressorPipeline)
+
+    prediction, probability = pipeline.predict()
+    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+
+    assert probability is None
+    assert len(prediction) == len(pipeline.y_test)
+    assert isinstance(metrics, RegressionMetricResult)
+    assert metrics.r_square > 0.95
+
+
+def test_sgd_classifier_pipeline(data_path: str):
+    config = build_config(data_path, AlgorithmType.SGD_CLASSIFIER, "label", scale_minmax=["feature1", "feature2"])
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    assert isinstance(pipeline, SGDClassifierPipeline)
+
+    prediction, probability = pipeline.predict()
+    metrics = pipeline.compute_metrics(prediction=prediction, probability=probability)
+
+    assert probability.shape == (len(prediction), 2)
+    assert isinstance(metrics, ClassificationMetricResult)
+    assert metrics.accuracy > 0.9
+
+
+def test_sgd_pipeline_rejects_robust_scaler(data_path: str):
+    config = build_config(data_path, AlgorithmType.SGD_REGRESSOR, "value", scale_robust=["feature1"])
+    pipeline = PipelineFactory.build_pipeline(config=config)
+    with pytest.raises(ValueError, match="RobustScaler"):
+        pipeline.predict()
@@ -0,0 +1,69 @@
+"""Stage cache test module."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.pipeline.stage_cache import StageCache, get_stage_cache, stage_key
+
+CONFIG = PipelineConfig(
+    data_path="src/data/housing.csv",
+    features=["OverallQual", "GrLivArea", "GarageCars", "GarageArea", "TotalBsmtSF"],
+    target_column="SalePrice",
+    algorithm=AlgorithmType.LINEAR_REGRESSION,
+    out_file="models/whatever.pkl",
+    random_state=42,
+    scale_standard=["GrLivArea", "TotalBsmtSF"],
+    cache_stages=True,
+)
+
+
+def test_stage_key_depends_on_stage_settings() -> None:
+    """Test that the key ignores the algorithm but not the scalers, test size or random state."""
+    key = stage_key(config=CONFIG, test_size=0.3)
+
+    assert key == stage_key(config=replace(CONFIG, algorithm=AlgorithmType.RANDOM_FOREST_REGRESSOR), test_size=0.3)
+    assert key != stage_key(config=CONFIG, test_size=0.2)
+    assert key != stage_key(config=replace(CONFIG, random_state=0), test_size=0.3)
+    assert key != stage_key(config=replace(CONFIG, scale_minmax=["GarageArea"]), test_size=0.3)
+
+
+def test_pipelines_share_the_prepared_stage() -> None:
+    """Test that a second pipeline with the same stage settings reuses the split and the fitted pre-processor."""
+    get_stage_cache().clear()
+    first = PipelineFactory.build_pipeline(config=CONFIG)
+    first_prediction, _ = first.predict()
+
+    second = PipelineFactory.build_pipeline(config=replace(CONFIG, algorithm=AlgorithmType.DECISION_TREE_REGRESSOR))
+    second.predict()
+
+    assert second.prepared is first.prepared
+    assert second.pre_processor is first.pre_processor
+
+    uncached = PipelineFactory.build_pipeline(config=replace(CONFIG, cache_stages=False))
+    uncached_prediction, _ = uncached.predict()
+    np.testing.assert_allclose(first_prediction, uncached_prediction)
+
+
+def test_stage_cache_on_disk(tmp_path: Path) -> None:
+    """Test that on-disk entries are reused by a new cache and evicted above max_entries."""
+    pipeline = PipelineFactory.build_pipeline(config=CONFIG)
+    calls = []
+
+    def compute():  # noqa: ANN202
+        calls.append(1)
+        return pipeline.prepare_data(test_size=0.3)
+
+    StageCache(cache_dir=str(tmp_path), max_entries=2).get_or_compute(key="a", compute=compute)
+    prepared = StageCache(cache_dir=str(tmp_path), max_entries=2).get_or_compute(key="a", compute=compute)
+    assert len(calls) == 1
+    assert prepared.pre_processor is not None
+
+    cache = StageCache(cache_dir=str(tmp_path), max_entries=2)
+    cache.get_or_compute(key="b", compute=compute)
+    cache.get_or_compute(key="c", compute=compute)
+    assert sorted(path.stem for path in tmp_path.glob("*.pkl")) == ["b", "c"]
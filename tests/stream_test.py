@@ -0,0 +1,79 @@
+"""Streaming loader test module."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.ml_pipeline_handler.io.stream import is_test_row, row_uniform, stream_data, stream_training_set
+
+
+def write_csv(path: Path, rows: int) -> str:
+    """Write a CSV file with a row id feature and a target column.
+
+    Returns:
+        The path of the CSV file.
+    """
+    pd.DataFrame({"row": range(rows), "other": 0, "target": [i % 3 for i in range(rows)]}).to_csv(path, index=False)
+    return str(path)
+
+
+def test_is_test_row_is_deterministic() -> None:
+    """Test that the hash split depends only on the row index and the random state.
+
+    Returns:
+        None
+    """
+    rows = np.arange(100_000)
+    mask = is_test_row(row_index=rows, random_state=42, test_size=0.3)
+    assert np.array_equal(mask, is_test_row(row_index=rows, random_state=42, test_size=0.3))
+    assert not np.array_equal(mask, is_test_row(row_index=rows, random_state=7, test_size=0.3))
+    assert abs(mask.mean() - 0.3) < 0.01
+
+
+def test_row_uniform_accepts_negative_seeds() -> None:
+    """Test that seeds are taken modulo 2**64 instead of overflowing.
+
+    Returns:
+        None
+    """
+    rows = np.arange(1_000)
+    draws = row_uniform(row_index=rows, random_state=-1)
+    assert np.array_equal(draws, row_uniform(row_index=rows, random_state=2**64 - 1))
+    assert ((draws >= 0) & (draws < 1)).all()
+
+
+def test_stream_data_chunks(tmp_path: Path) -> None:
+    """Test that chunks contain only the requested features and cover every row.
+
+    Returns:
+        None
+    """
+    data_path = write_csv(tmp_path / "data.csv", rows=25)
+    chunks = list(stream_data(data_path=data_path, target_column="target", features=["row"], chunk_size=10))
+    assert [len(x) for x, _ in chunks] == [10, 10, 5]
+    assert all(list(x.columns) == ["row"] for x, _ in chunks)
+    assert pd.concat([y for _, y in chunks]).tolist() == [i % 3 for i in range(25)]
+
+
+def test_stream_training_set_independent_of_chunk_size(tmp_path: Path) -> None:
+    """Test that the train/test split does not depend on the chunk size.
+
+    Returns:
+        None
+    """
+    data_path = write_csv(tmp_path / "data.csv", rows=1000)
+
+    def test_rows(chunk_size: int) -> list[int]:
+        batches = stream_training_set(
+            data_path=data_path,
+            target_column="target",
+            features=["row"],
+            chunk_size=chunk_size,
+            test_size=0.3,
+            random_state=42,
+        )
+        return [row for _, x_test, _, _ in batches for row in x_test["row"]]
+
+    assert test_rows(chunk_size=64) == test_rows(chunk_size=1000)
+    assert 200 < len(test_rows(chunk_size=64)) < 400
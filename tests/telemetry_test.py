@@ -0,0 +1,161 @@
+"""Telemetry test module."""
+
+import json
+import pstats
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from main import main
+from src.ml_pipeline_handler.algorithm import AlgorithmType
+from src.ml_pipeline_handler.pipeline.base_config import PipelineConfig
+from src.ml_pipeline_handler.pipeline.pipeline_factory import PipelineFactory
+from src.ml_pipeline_handler.telemetry.profiler import StageProfiler
+from src.ml_pipeline_handler.telemetry.sinks import JsonLogSink, OtlpJsonSink, PrometheusTextfileSink
+from src.ml_pipeline_handler.telemetry.span import (
+    NULL_SPAN,
+    configure_instrumentation,
+    instrumentation_enabled,
+    shutdown_instrumentation,
+    span,
+)
+
+
+@pytest.fixture
+def data_path(tmp_path: Path) -> str:
+    rng = np.random.default_rng(seed=0)
+    data = pd.DataFrame({"feature1": rng.normal(size=400), "feature2": rng.normal(size=400)})
+    data["target"] = 2 * data["feature1"] - data["feature2"]
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+def read_lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_span_is_a_no_op_while_disabled() -> None:
+    """Test that spans are the shared no-op span until a sink is configured."""
+    assert not instrumentation_enabled()
+    with span("fit", rows=10) as stage:
+        stage.set_attribute(key="algorithm", value="linear_regression")
+    assert stage is NULL_SPAN
+
+
+def test_nested_spans_are_exported_to_every_sink(tmp_path: Path) -> None:
+    """Test that nested spans share their trace and reach the JSON, Prometheus and OTLP/JSON sinks."""
+    configure_instrumentation(
+        sinks=[
+            JsonLogSink(file_name=str(tmp_path / "spans.jsonl")),
+            PrometheusTextfileSink(file_name=str(tmp_path / "stages.prom")),
+            OtlpJsonSink(file_name=str(tmp_path / "otlp.jsonl")),
+        ],
+        trace_memory=True,
+    )
+    try:
+        with span("pipeline", algorithm="linear_regression"):
+            with span("load_data") as stage:
+                blocks = [np.ones(shape=100_000) for _ in range(4)]
+                stage.set_rows(len(blocks))
+            with pytest.raises(ValueError, match="failed"), span("fit"):
+                raise ValueError("failed")
+    finally:
+        shutdown_instrumentation()
+
+    load_data, fit, pipeline = read_lines(tmp_path / "spans.jsonl")
+    assert [load_data["name"], fit["name"], pipeline["name"]] == ["load_data", "fit", "pipeline"]
+    assert load_data["parent_id"] == fit["parent_id"] == pipeline["span_id"]
+    assert load_data["trace_id"] == fit["trace_id"] == pipeline["trace_id"]
+    assert pipeline["parent_id"] is None
+    assert load_data["rows"] == 4
+    assert load_data["peak_traced_mb"] >= 3
+    assert pipeline["peak_traced_mb"] >= load_data["peak_traced_mb"]
+    assert fit["error"] == "ValueError"
+    assert pipeline["attributes"] == {"algorithm": "linear_regression"}
+
+    prometheus = (tmp_path / "stages.prom").read_text(encoding="utf-8")
+    assert "# TYPE ml_pipeline_stage_runs_total counter" in prometheus
+    assert 'ml_pipeline_stage_rows_total{stage="load_data"} 4.0' in prometheus
+    assert 'ml_pipeline_stage_errors_total{stage="fit"} 1.0' in prometheus
+
+    otlp = [request["resourceSpans"][0]["scopeSpans"][0]["spans"][0] for request in read_lines(tmp_path / "otlp.jsonl")]
+    assert otlp[0]["parentSpanId"] == otlp[2]["spanId"]
+    assert otlp[1]["status"]["code"] == 2
+    assert {"key": "rows", "value": {"intValue": "4"}} in otlp[0]["attributes"]
+
+
+def test_pipeline_stages_are_instrumented(tmp_path: Path, data_path: str) -> None:
+    """Test that running a pipeline records a span per stage under one pipeline span."""
+    config = PipelineConfig(
+        data_path=data_path,
+        features=["feature1", "feature2"],
+        target_column="target",
+        algorithm=AlgorithmType.LINEAR_REGRESSION,
+        out_file="models/linear_regression.pkl",
+        random_state=42,
+        scale_standard=["feature1"],
+    )
+    configure_instrumentation(sinks=[JsonLogSink(file_name=str(tmp_path / "spans.jsonl"))])
+    try:
+        PipelineFactory.build_pipeline(config=config).predict()
+    finally:
+        shutdown_instrumentation()
+
+    records = {record["name"]: record for record in read_lines(tmp_path / "spans.jsonl")}
+    assert {"load_data", "split", "pre_process", "fit", "predict", "pipeline"} <= records.keys()
+    assert records["load_data"]["rows"] == 400
+    assert records["pipeline"]["attributes"]["algorithm"] == "linear_regression"
+    assert all(record["trace_id"] == records["pipeline"]["trace_id"] for record in records.values())
+    assert records["pipeline"]["wall_time"] >= records["fit"]["wall_time"]
+
+
+def test_stage_profiler_splits_the_profile_by_stage(tmp_path: Path, data_path: str) -> None:
+    """Test that the profiler writes a .pstats file and collapsed stacks rooted at the stage of every function."""
+    config = PipelineConfig(
+        data_path=data_path,
+        features=["feature1", "feature2"],
+        target_column="target",
+        algorithm=AlgorithmType.DECISION_TREE_REGRESSOR,
+        out_file=str(tmp_path / "model.pkl"),
+        random_state=42,
+    )
+    configure_instrumentation(sinks=[StageProfiler(file_name=config.out_file, top_n=5)])
+    try:
+        pipeline = PipelineFactory.build_pipeline(config=config)
+        prediction, _ = pipeline.predict()
+        with span("metrics"):
+            pipeline.compute_metrics(prediction=prediction)
+    finally:
+        shutdown_instrumentation()
+
+    functions = {name for _, _, name in pstats.Stats(str(tmp_path / "model.pstats")).stats}
+    assert {"load_data", "fit_predict", "compute_metrics"} <= functions
+
+    stacks = [line.rsplit(" ", maxsplit=1) for line in (tmp_path / "model.collapsed").read_text().splitlines()]
+    assert all(count.isdigit() for _, count in stacks)
+    stages = {stack.split(";")[0] for stack, _ in stacks}
+    assert {"load", "preprocess", "fit", "predict", "metrics"} <= stages
+    assert any(stack.startswith("fit;") and "(fit)" in stack for stack, _ in stacks)
+
+
+def test_main_writes_the_profile_of_a_failed_run(tmp_path: Path, data_path: str) -> None:
+    """Test that main profiles its run and writes the profile even when the run raises."""
+    with pytest.raises(ValueError, match="not found"):
+        main(
+            data_path=data_path,
+            features=["feature1", "missing"],
+            target_column="target",
+            scale_standard=[],
+            scale_robust=[],
+            scale_minmax=[],
+            algorithm=AlgorithmType.LINEAR_REGRESSION,
+            out_file=str(tmp_path / "model.pkl"),
+            profile=True,
+        )
+
+    assert not instrumentation_enabled()
+    assert (tmp_path / "model.pstats").exists()
+    assert (tmp_path / "model.collapsed").exists()